@@ -12,7 +12,7 @@ if exist "%VENV_ACTIVATOR%" (
 )
 
 echo Starting FastAPI host...
-python -m src.server
+python -m src.launcher
 
 popd
 endlocal
@@ -0,0 +1 @@
+"""Standalone performance benchmarks for DEMOAPP004 (run with `python -m benchmarks.<name>`)."""
@@ -0,0 +1,171 @@
+"""
+Latency under 2x overload with and without admission control.
+
+    python -m benchmarks.bench_admission --duration 15 --overload 2
+
+Starts a single-worker server, measures the sustainable rate of a heavy
+dynamic string token with a closed-loop client, then offers `--overload` times
+that rate as an open-loop (fixed arrival rate) stream for `--duration`
+seconds, once with admission control disabled and once enabled. Without
+shedding the backlog, and with it p99, grows for as long as the overload
+lasts; with shedding, admitted requests stay within the queue timeout plus
+service time and the excess gets fast 503s. `/alive` is probed throughout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import signal
+import statistics
+import time
+from typing import Dict, List
+from urllib.parse import quote
+
+from benchmarks.common import (
+    free_port,
+    percentile,
+    print_table,
+    start_server,
+    wait_until_alive,
+    write_json,
+)
+
+HEAVY_TOKEN = "[ALPHA-NUMERIC-1000-LINES-500]"
+SERVER_ENV = {
+    "TOKENPARSER_OFFLOAD_THREADS": "2",
+    "TOKENPARSER_OFFLOAD_PROCESSES": "1",
+    "TOKENPARSER_ADMISSION_HEAVY_CONCURRENCY": "2",
+    "TOKENPARSER_ADMISSION_HEAVY_QUEUE": "4",
+    "TOKENPARSER_ADMISSION_QUEUE_TIMEOUT": "0.5",
+}
+
+
+async def _get_status(port: int, path: str) -> int:
+    """
+    GET `path` over a fresh `Connection: close` socket and return the status.
+
+    A bare asyncio stream client: the load generator shares the CPU with the
+    server, so it must spend as little of it per request as possible.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        request = f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n"
+        writer.write(request.encode())
+        status_line = await reader.readline()
+        while await reader.read(1 << 20):
+            pass
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def _capacity(port: int, path: str, concurrency: int, seconds: float) -> float:
+    """Requests/second a closed-loop client sustains at `concurrency`."""
+    completed = 0
+    deadline = time.perf_counter() + seconds
+
+    async def loop() -> None:
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            completed += await _get_status(port, path) == 200
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return completed / (time.perf_counter() - started)
+
+
+async def _overload(port: int, path: str, rate: float, duration: float):
+    """Fire requests at `rate`/s for `duration` seconds regardless of responses."""
+    results: Dict[str, List[float]] = {"ok": [], "shed": [], "failed": [], "alive": []}
+    pending = []
+    deadline = time.perf_counter() + duration
+
+    async def heavy() -> None:
+        started = time.perf_counter()
+        try:
+            key = {200: "ok", 503: "shed"}.get(await _get_status(port, path), "failed")
+        except OSError:
+            key = "failed"
+        results[key].append(time.perf_counter() - started)
+
+    async def probe() -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await _get_status(port, "/alive")
+            results["alive"].append(time.perf_counter() - started)
+            await asyncio.sleep(0.05)
+
+    prober = asyncio.create_task(probe())
+    next_at = time.perf_counter()
+    while next_at < deadline:
+        pending.append(asyncio.create_task(heavy()))
+        next_at += 1 / rate
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+    await asyncio.gather(prober, *pending)
+    return results
+
+
+def _row(mode: str, rate: float, results: Dict[str, List[float]]) -> Dict[str, object]:
+    ok, shed, alive = results["ok"], results["shed"], results["alive"]
+    return {
+        "mode": mode,
+        "offered_rps": rate,
+        "ok": len(ok),
+        "shed": len(shed),
+        "failed": len(results["failed"]),
+        "ok_p50_ms": statistics.median(ok) * 1000 if ok else 0.0,
+        "ok_p99_ms": percentile(sorted(ok), 0.99) * 1000 if ok else 0.0,
+        "shed_p99_ms": percentile(sorted(shed), 0.99) * 1000 if shed else 0.0,
+        "alive_p99_ms": percentile(sorted(alive), 0.99) * 1000 if alive else 0.0,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--token", default=HEAVY_TOKEN)
+    parser.add_argument("--overload", type=float, default=2.0, help="Multiple of capacity.")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds of overload.")
+    parser.add_argument(
+        "--calibrate", type=float, default=5.0, help="Seconds spent measuring capacity."
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="Closed-loop clients while calibrating."
+    )
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    path = f"/parse-dynamic-string-token?token={quote(args.token)}"
+    rows = []
+    rate = 0.0
+    for mode, admission in (("no admission", "0"), ("admission", "1")):
+        port = free_port()
+        env = {**SERVER_ENV, "TOKENPARSER_ADMISSION": admission}
+        server = start_server(port, ["--workers", "1"], env=env)
+        try:
+            asyncio.run(wait_until_alive(f"http://127.0.0.1:{port}"))
+            if not rate:
+                capacity = asyncio.run(_capacity(port, path, args.concurrency, args.calibrate))
+                rate = capacity * args.overload
+            results = asyncio.run(_overload(port, path, rate, args.duration))
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+        rows.append(_row(mode, rate, results))
+
+    print(f"token={args.token} capacity={rate / args.overload:.1f}/s overload={args.overload}x")
+    columns = [
+        "mode", "offered_rps", "ok", "shed", "failed", "ok_p50_ms", "ok_p99_ms", "shed_p99_ms",
+        "alive_p99_ms",
+    ]
+    print_table(rows, columns)
+    if args.json_path:
+        write_json(args.json_path, {"token": args.token, "results": rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
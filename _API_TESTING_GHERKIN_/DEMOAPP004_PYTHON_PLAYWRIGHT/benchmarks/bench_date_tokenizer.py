@@ -0,0 +1,74 @@
+"""
+Single-pass date tokenizer versus the regex reference path.
+
+    python -m benchmarks.bench_date_tokenizer --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.common import measure, print_table, write_json
+from tokenparser.date_parser import (
+    DateTokenError,
+    _compile_date_token_regex,
+    _scan_date_token,
+)
+
+
+def _cases(adversarial_repeats: int) -> dict[str, str]:
+    return {
+        "valid-short": "[TODAY]",
+        "valid-typical": "[TODAY+2YEAR+6MONTH-15DAY]",
+        "valid-month-end": "[END-FEBRUARY-2024]",
+        "invalid-unbracketed": "INVALIDTOKEN",
+        "invalid-unit": "[TODAY+1WEEK]",
+        "invalid-month": "[START-SMARCH-2024]",
+        "adversarial-valid": "[TODAY" + "+1DAY" * adversarial_repeats + "]",
+        "adversarial-invalid-tail": "[TODAY" + "+1DAY" * adversarial_repeats + "+1]",
+        "adversarial-mixed": "[TODAY" + "+1YEAR-1MONTH+1DAY" * (adversarial_repeats // 3) + "]",
+    }
+
+
+def _runner(compile_token, token: str):
+    def run() -> None:
+        try:
+            compile_token(token)
+        except DateTokenError:
+            pass
+
+    return run
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--adversarial-repeats", type=int, default=5000)
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    rows = []
+    for name, token in _cases(args.adversarial_repeats).items():
+        regex = measure(f"regex:{name}", _runner(_compile_date_token_regex, token), args.repeat)
+        scan = measure(f"scan:{name}", _runner(_scan_date_token, token), args.repeat)
+        rows.append(
+            {
+                "case": name,
+                "token_chars": len(token),
+                "regex_us": regex.best * 1e6,
+                "scan_us": scan.best * 1e6,
+                "speedup": regex.best / scan.best,
+            }
+        )
+
+    print_table(rows, ["case", "token_chars", "regex_us", "scan_us", "speedup"])
+    if args.json_path:
+        write_json(args.json_path, {"results": rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
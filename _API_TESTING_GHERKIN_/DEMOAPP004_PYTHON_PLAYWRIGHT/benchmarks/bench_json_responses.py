@@ -0,0 +1,153 @@
+"""
+Old vs new JSON response paths for the parse endpoints.
+
+    python -m benchmarks.bench_json_responses --json .results/bench_json.json
+
+Two sections:
+
+- `encode`: encoding `{"ParsedToken": value}` alone with the stdlib
+  (`JSONResponse.render`), orjson (if installed) and `parsed_token_bytes`,
+  with and without orjson available to it.
+- `endpoint`: full requests through the ASGI callable, comparing the original
+  dict-returning handlers (jsonable_encoder + JSONResponse) with the app's
+  pre-encoded `FastJSONResponse` handlers. Metrics are disabled so only the
+  response path differs; the date endpoint's ETag work is included.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from urllib.parse import quote
+
+os.environ["TOKENPARSER_METRICS"] = "0"
+
+from fastapi import FastAPI, Query  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from benchmarks.common import asgi_get, measure, print_table, write_json  # noqa: E402
+from src import responses  # noqa: E402
+from src.server import app  # noqa: E402
+from tokenparser.date_parser import format_date_utc, parse_date_token  # noqa: E402
+from tokenparser.dynamic_string_parser import generate_dynamic_string  # noqa: E402
+
+ENDPOINT_CASES = (
+    ("/alive", ""),
+    ("/parse-date-token", "[END-MARCH-2024]"),
+    ("/parse-dynamic-string-token", "[ALPHA-NUMERIC-16]"),
+    ("/parse-dynamic-string-token", "[ALPHA-NUMERIC-100-LINES-100]"),
+)
+ENCODE_CASES = (
+    "[NUMERIC-20]",
+    "[ALPHA-NUMERIC-10000]",
+    "[ALPHA-NUMERIC-100-LINES-100]",
+    "[ALPHA-NUMERIC-1000-LINES-1000]",
+)
+
+
+def _legacy_app() -> FastAPI:
+    """The original handlers: return dicts and let FastAPI encode them."""
+    legacy = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+
+    @legacy.get("/alive")
+    async def alive():
+        return {"Status": "ALIVE-AND-KICKING"}
+
+    @legacy.get("/parse-date-token")
+    async def parse_date(token: str = Query(..., min_length=1)):
+        return {"ParsedToken": format_date_utc(parse_date_token(token))}
+
+    @legacy.get("/parse-dynamic-string-token")
+    async def parse_dynamic(token: str = Query(..., min_length=1)):
+        return {"ParsedToken": generate_dynamic_string(token)}
+
+    return legacy
+
+
+def _without_orjson(func, *args):
+    saved, responses.orjson = responses.orjson, None
+    try:
+        return func(*args)
+    finally:
+        responses.orjson = saved
+
+
+def _encode_rows(repeat: int):
+    rows = []
+    for token in ENCODE_CASES:
+        value = generate_dynamic_string(token, mode="fast", seed=1)
+        encoders = {"stdlib": lambda: JSONResponse({"ParsedToken": value}).body}
+        if responses.orjson is not None:
+            encoders["orjson"] = lambda: responses.orjson.dumps({"ParsedToken": value})
+        encoders["parsed_token_bytes"] = lambda: responses.parsed_token_bytes(value)
+        encoders["parsed_token_bytes (stdlib only)"] = lambda: _without_orjson(
+            responses.parsed_token_bytes, value
+        )
+
+        expected = encoders["stdlib"]()
+        baseline = None
+        for name, encode in encoders.items():
+            assert encode() == expected, f"{name} output differs for {token}"
+            timing = measure(f"{token}:{name}", encode, repeat=repeat)
+            baseline = baseline or timing.best
+            rows.append(
+                {
+                    "case": token,
+                    "path": name,
+                    "microseconds": timing.best * 1e6,
+                    "speedup": baseline / timing.best,
+                }
+            )
+    return rows
+
+
+def _endpoint_rows(repeat: int):
+    loop = asyncio.new_event_loop()
+    rows = []
+    for path, token in ENDPOINT_CASES:
+        query = f"token={quote(token)}" if token else ""
+        baseline = None
+        for name, target in (("dict+JSONResponse", _legacy_app()), ("FastJSONResponse", app)):
+            timing = measure(
+                f"{path}?{query}:{name}",
+                lambda: loop.run_until_complete(asgi_get(target, path, query=query)),
+                repeat=repeat,
+            )
+            baseline = baseline or timing.best
+            rows.append(
+                {
+                    "case": f"{path} {token}".strip(),
+                    "path": name,
+                    "microseconds": timing.best * 1e6,
+                    "speedup": baseline / timing.best,
+                }
+            )
+    loop.close()
+    return rows
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    encode_rows = _encode_rows(args.repeat)
+    endpoint_rows = _endpoint_rows(args.repeat)
+
+    print(f"orjson={'yes' if responses.orjson is not None else 'no'}")
+    print("\nencode")
+    print_table(encode_rows, ["case", "path", "microseconds", "speedup"])
+    print("\nendpoint")
+    print_table(endpoint_rows, ["case", "path", "microseconds", "speedup"])
+    if args.json_path:
+        write_json(args.json_path, {"encode": encode_rows, "endpoint": endpoint_rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
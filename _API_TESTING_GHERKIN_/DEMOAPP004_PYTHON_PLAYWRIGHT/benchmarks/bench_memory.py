@@ -0,0 +1,268 @@
+"""
+Peak memory per request for dynamic strings of growing size, with a baseline gate.
+
+    python -m benchmarks.bench_memory --json .results/bench_memory.json
+    python -m benchmarks.bench_memory --baseline benchmarks/baseline_memory.json
+    python -m benchmarks.bench_memory --update-baseline
+
+Requests go straight through the ASGI app under tracemalloc. The response
+body is counted and discarded, as a socket would, so the number is what the
+server itself holds at its peak. Each case reports that peak above the
+pre-request baseline, and its ratio to the output size. JSON bodies and
+`text/plain` streams are measured for each size, along with the first
+(uncached) OpenAPI YAML render. The process-pool tier and the parser's
+multi-core chunk pool are disabled here because allocations in other
+processes cannot be traced, so every size runs in this process.
+
+Traced peaks depend on the Python version and the code, not the machine's
+load. With `--baseline` the exit status is 1 when a case peaks more than
+`--threshold` (default 10%) plus `--slack-kib` above its baseline entry.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import quote
+
+from benchmarks.common import PROJECT_ROOT, print_table, write_json
+
+# Must be set before src.server reads its settings: keep every size in-process.
+os.environ.setdefault("TOKENPARSER_OFFLOAD_PROCESS_MIN_CHARS", str(1 << 62))
+os.environ.setdefault("TOKENPARSER_PARALLEL_WORKERS", "1")
+
+from src import server  # noqa: E402
+from src.memory_debug import rss_bytes  # noqa: E402
+
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "baseline_memory.json"
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_SLACK_KIB = 64
+
+DYNAMIC_TOKENS = {
+    "100KB": "[ALPHA-1000-LINES-100]",
+    "1MB": "[ALPHA-NUMERIC-10000-LINES-100]",
+    "10MB": "[ALPHA-NUMERIC-10000-LINES-1000]",
+    "40MB": "[ALPHA-NUMERIC-SPECIAL-40000-LINES-1000]",
+}
+
+# name -> (path, query, headers)
+Case = Tuple[str, str, Mapping[str, str]]
+
+
+def cases() -> Dict[str, Case]:
+    """All cases by stable name (names are the baseline keys)."""
+    suite: Dict[str, Case] = {}
+    for size, token in DYNAMIC_TOKENS.items():
+        query = f"token={quote(token)}"
+        suite[f"dynamic-string.json[{size}]"] = ("/parse-dynamic-string-token", query, {})
+        suite[f"dynamic-string.stream[{size}]"] = (
+            "/parse-dynamic-string-token", query, {"Accept": "text/plain"}
+        )
+    suite["parse-date-token"] = ("/parse-date-token", f"token={quote('[TODAY+1DAY]')}", {})
+    suite["openapi.yaml[first render]"] = ("/swagger/v1/swagger.yaml", "", {})
+    return suite
+
+
+async def _request(path: str, query: str, headers: Mapping[str, str]) -> Tuple[int, int]:
+    """GET through the app, discarding the body; returns (status, body bytes)."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    status = 0
+    size = 0
+    requested = False
+
+    async def receive():
+        # One empty request body, then no disconnect until the response is done
+        # (streaming responses poll receive() for a disconnect while they send).
+        nonlocal requested
+        if requested:
+            await asyncio.Event().wait()
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status, size
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        else:
+            size += len(message.get("body", b""))
+
+    await server.app(scope, receive, send)
+    return status, size
+
+
+def _reset_caches(name: str) -> None:
+    if name.startswith("openapi"):
+        server.app.openapi_schema = None
+        server._openapi_artifacts.cache_clear()
+
+
+def measure_case(loop: asyncio.AbstractEventLoop, name: str, case: Case, repeat: int) -> Dict:
+    """Smallest traced peak over `repeat` runs, after one warm-up run."""
+    peaks: List[int] = []
+    size = 0
+    for run in range(repeat + 1):
+        _reset_caches(name)
+        gc.collect()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        status, size = loop.run_until_complete(_request(*case))
+        if status != 200:
+            raise RuntimeError(f"{name} answered {status}")
+        if run:
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    peak = min(peaks)
+    return {"peak_bytes": peak, "output_bytes": size, "peak_per_output": peak / max(size, 1)}
+
+
+def run_suite(repeat: int, names: List[str]) -> Dict[str, Dict[str, Any]]:
+    suite = cases()
+    loop = asyncio.new_event_loop()
+    tracemalloc.start()
+    try:
+        return {name: measure_case(loop, name, suite[name], repeat) for name in names}
+    finally:
+        tracemalloc.stop()
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+    slack_bytes: int,
+) -> List[Dict[str, Any]]:
+    """One row per case with its ratio to the baseline and a status."""
+    rows = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            rows.append({"case": name, "peak_kib": result["peak_bytes"] / 1024, "status": "new"})
+            continue
+        limit = reference["peak_bytes"] * (1 + threshold) + slack_bytes
+        rows.append(
+            {
+                "case": name,
+                "baseline_kib": reference["peak_bytes"] / 1024,
+                "peak_kib": result["peak_bytes"] / 1024,
+                "ratio": result["peak_bytes"] / max(reference["peak_bytes"], 1),
+                "status": "REGRESSED" if result["peak_bytes"] > limit else "ok",
+            }
+        )
+    return rows
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this.")
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Compare against this baseline JSON and exit 1 on regressions.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed peak growth per case as a fraction (0.10 = 10%%).",
+    )
+    parser.add_argument(
+        "--slack-kib",
+        type=int,
+        default=DEFAULT_SLACK_KIB,
+        help="Absolute growth always allowed, so tiny cases do not flap.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        type=Path,
+        help=f"Write the results as the new baseline (default {DEFAULT_BASELINE.name}).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    names = [name for name in cases() if args.filter in name]
+    results = run_suite(args.repeat, names)
+    report: Dict[str, Any] = {"environment": _environment(), "cases": results}
+
+    regressions: List[str] = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("environment", {}).get("python") != platform.python_version():
+            print("note: baseline was recorded on another Python version", file=sys.stderr)
+        rows = compare(results, baseline["cases"], args.threshold, args.slack_kib * 1024)
+        regressions = [row["case"] for row in rows if row["status"] == "REGRESSED"]
+        report.update(
+            baseline=str(args.baseline),
+            threshold=args.threshold,
+            comparison=rows,
+            regressions=regressions,
+        )
+        print_table(rows, ["case", "baseline_kib", "peak_kib", "ratio", "status"])
+    else:
+        rows = [
+            {
+                "case": name,
+                "peak_kib": result["peak_bytes"] / 1024,
+                "output_kib": result["output_bytes"] / 1024,
+                "peak_per_output": result["peak_per_output"],
+            }
+            for name, result in results.items()
+        ]
+        print_table(rows, ["case", "peak_kib", "output_kib", "peak_per_output"])
+
+    peak_rss: Optional[int] = rss_bytes()["peak_bytes"]
+    report["peak_rss_bytes"] = peak_rss
+    if peak_rss is not None:
+        print(f"\nprocess peak RSS: {peak_rss / (1 << 20):.1f} MiB (includes tracemalloc overhead)")
+    if args.json_path:
+        write_json(args.json_path, report)
+    if args.update_baseline:
+        write_json(args.update_baseline, {"environment": _environment(), "cases": results})
+        print(f"baseline written to {args.update_baseline}")
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) peaked more than {args.threshold:.0%} above baseline: "
+            + ", ".join(regressions),
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
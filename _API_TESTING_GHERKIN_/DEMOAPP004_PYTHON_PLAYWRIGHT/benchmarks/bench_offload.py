@@ -0,0 +1,113 @@
+"""
+Latency of cheap requests while large dynamic string tokens are in flight.
+
+    python -m benchmarks.bench_offload --duration 10 --large "[ALPHA-NUMERIC-10000-LINES-1000]"
+
+Runs a single-worker server twice: once with every token generated inline on
+the event loop (offload thresholds pushed out of reach) and once with the
+default size-aware dispatch. In both runs `--large-concurrency` clients loop on
+the large token while probes hit `/alive` and a small token; the report lists
+probe latency percentiles for each mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import signal
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.common import (
+    free_port,
+    percentile,
+    print_table,
+    start_server,
+    wait_until_alive,
+    write_json,
+)
+
+INLINE_ONLY = {
+    "TOKENPARSER_OFFLOAD_THREAD_MIN_CHARS": str(1 << 62),
+    "TOKENPARSER_OFFLOAD_PROCESS_MIN_CHARS": str(1 << 62),
+}
+SMALL_PATH = "/parse-dynamic-string-token?token=[ALPHA-NUMERIC-16]"
+
+
+async def _measure(base_url: str, large: str, large_concurrency: int, duration: float):
+    latencies: Dict[str, List[float]] = {"/alive": [], "small token": []}
+    large_done = 0
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        deadline = time.perf_counter() + duration
+
+        async def large_loop() -> None:
+            nonlocal large_done
+            while time.perf_counter() < deadline:
+                await client.get("/parse-dynamic-string-token", params={"token": large})
+                large_done += 1
+
+        async def probe(name: str, path: str) -> None:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await client.get(path)
+                latencies[name].append(time.perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            *(large_loop() for _ in range(large_concurrency)),
+            probe("/alive", "/alive"),
+            probe("small token", SMALL_PATH),
+        )
+    return latencies, large_done
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--large", default="[ALPHA-NUMERIC-10000-LINES-1000]")
+    parser.add_argument("--large-concurrency", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per mode.")
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    rows = []
+    for mode, env in (("inline", INLINE_ONLY), ("size-aware", {})):
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(port, ["--workers", "1"], env=env)
+        try:
+            asyncio.run(wait_until_alive(base_url))
+            latencies, large_done = asyncio.run(
+                _measure(base_url, args.large, args.large_concurrency, args.duration)
+            )
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+        for probe, samples in latencies.items():
+            rows.append(
+                {
+                    "mode": mode,
+                    "probe": probe,
+                    "requests": len(samples),
+                    "p50_ms": statistics.median(samples) * 1000,
+                    "p99_ms": percentile(sorted(samples), 0.99) * 1000,
+                    "max_ms": max(samples) * 1000,
+                    "large_completed": large_done,
+                }
+            )
+
+    print(f"large={args.large} large_concurrency={args.large_concurrency}")
+    columns = ["mode", "probe", "requests", "p50_ms", "p99_ms", "max_ms", "large_completed"]
+    print_table(rows, columns)
+    if args.json_path:
+        write_json(args.json_path, {"large": args.large, "results": rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+"""
+Multi-core scaling benchmark for large `-LINES-` dynamic string tokens.
+
+    python -m benchmarks.bench_parallel_strings --lines 100000 1000000 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from benchmarks.common import measure, print_table, write_json
+from tokenparser import dynamic_string_parser
+from tokenparser.dynamic_string_parser import generate_dynamic_string
+
+
+def _parse_args() -> argparse.Namespace:
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({1, *(2**i for i in range(1, cpus.bit_length()) if 2**i <= cpus), cpus})
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--width", type=int, default=50, help="Characters per line.")
+    parser.add_argument("--types", default="ALPHA-NUMERIC", help="Token character types.")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--mode", default="crypto", choices=["crypto", "fast"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    # Benchmark the split itself, not the size threshold that decides whether to use it.
+    dynamic_string_parser.PARALLEL_MIN_CHARS = 0
+
+    rows = []
+    for lines in args.lines:
+        token = f"[{args.types}-{args.width}-LINES-{lines}]"
+        serial = None
+        for workers in args.workers:
+            timing = measure(
+                f"{token}@{workers}",
+                lambda: generate_dynamic_string(token, mode=args.mode, workers=workers),
+                repeat=args.repeat,
+                min_run_seconds=0,
+            )
+            serial = serial or timing.best
+            speedup = serial / timing.best
+            rows.append(
+                {
+                    "lines": lines,
+                    "workers": workers,
+                    "seconds": timing.best,
+                    "chars_per_second": args.width * lines / timing.best,
+                    "speedup": speedup,
+                    "efficiency": speedup / workers,
+                }
+            )
+
+    print(f"cpu_count={os.cpu_count()} mode={args.mode} width={args.width}")
+    print_table(rows, ["lines", "workers", "seconds", "chars_per_second", "speedup", "efficiency"])
+    if args.json_path:
+        write_json(args.json_path, {"cpu_count": os.cpu_count(), "results": rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+"""
+Characters-per-second benchmark for the dynamic string random engine.
+
+    python -m benchmarks.bench_random_strings --chars 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.common import measure, print_table, write_json
+from tokenparser.dynamic_string_parser import _parse_token
+from tokenparser.random_engine import RANDOM_MODES, CharSampler
+
+POOLS = {
+    "NUMERIC": "[NUMERIC-1]",
+    "ALPHA": "[ALPHA-1]",
+    "ALPHA-NUMERIC": "[ALPHA-NUMERIC-1]",
+    "ALPHA-NUMERIC-SPECIAL": "[ALPHA-NUMERIC-SPECIAL-1]",
+    "ALL-TYPES": "[ALPHA-NUMERIC-PUNCTUATION-SPECIAL-1]",
+}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chars", type=int, default=200_000, help="Characters per call.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--modes", nargs="+", default=list(RANDOM_MODES), choices=RANDOM_MODES)
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    rows = []
+    for pool_name, token in POOLS.items():
+        pool = _parse_token(token).char_pool
+        for mode in args.modes:
+            sampler = CharSampler(pool, mode)
+            timing = measure(
+                f"{mode}:{pool_name}",
+                lambda: sampler.sample(args.chars),
+                repeat=args.repeat,
+            )
+            rows.append(
+                {
+                    "pool": pool_name,
+                    "pool_size": len(pool),
+                    "mode": mode,
+                    "chars_per_second": args.chars / timing.best,
+                    "ms_per_call": timing.best * 1000,
+                }
+            )
+
+    print_table(rows, ["pool", "pool_size", "mode", "chars_per_second", "ms_per_call"])
+    if args.json_path:
+        write_json(args.json_path, {"chars_per_call": args.chars, "results": rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+"""
+Cold start: time from process start to the first successful `/alive`.
+
+    python -m benchmarks.bench_startup --runs 5 --budget-ms 1500
+
+Each run launches `python -m src.launcher` on a free port and polls `/alive`
+over a bare socket every few milliseconds until it answers 200. The median
+is checked against `--budget-ms` (or `TOKENPARSER_STARTUP_BUDGET_MS`); the
+exit status is 1 when it is over. A `-X importtime` breakdown of
+`import src.server` lists the slowest top-level packages, so a regression can
+be traced to the import that caused it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from benchmarks.common import PROJECT_ROOT, free_port, print_table, start_server, write_json
+
+DEFAULT_BUDGET_MS = float(os.getenv("TOKENPARSER_STARTUP_BUDGET_MS", "1500"))
+POLL_INTERVAL = 0.005
+
+
+def _alive(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=1) as sock:
+            sock.sendall(b"GET /alive HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n")
+            return sock.recv(64).startswith(b"HTTP/1.1 200")
+    except OSError:
+        return False
+
+
+def time_to_alive(args: List[str], timeout: float = 60.0) -> float:
+    """Seconds from launching the server to its first 200 from `/alive`."""
+    port = free_port()
+    started = time.perf_counter()
+    server = start_server(port, args)
+    try:
+        while not _alive(port):
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with {server.returncode} before /alive")
+            if time.perf_counter() - started > timeout:
+                raise RuntimeError(f"/alive did not answer within {timeout:.0f}s")
+            time.sleep(POLL_INTERVAL)
+        return time.perf_counter() - started
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+
+def import_breakdown(module: str = "src.server") -> Dict[str, float]:
+    """Cumulative `-X importtime` microseconds per top-level package imported by `module`."""
+    path = os.pathsep.join([str(PROJECT_ROOT / "src"), str(PROJECT_ROOT)])
+    environ = {**os.environ, "PYTHONPATH": path}
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=environ,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines read "import time: self | cumulative | <2 spaces per depth>name" and
+    # each import is listed after everything it pulled in, so the depth-1 lines
+    # just before `module`'s own depth-0 line are its direct imports.
+    packages: Dict[str, float] = defaultdict(float)
+    children: List[tuple] = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        if depth == 1:
+            children.append((name, int(cumulative)))
+        elif depth == 0:
+            if name == module:
+                for child, microseconds in children:
+                    packages[child.split(".")[0]] += microseconds
+                packages[f"TOTAL {module}"] = int(cumulative)
+            children = []
+    return dict(packages)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Fail when the median time to /alive exceeds this (0 disables).",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Packages listed in the breakdown.")
+    parser.add_argument(
+        "--server-arg", action="append", default=[], help="Extra launcher flag (repeatable)."
+    )
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    server_args = ["--workers", "1", *args.server_arg]
+    samples = [time_to_alive(server_args) * 1000 for _ in range(args.runs)]
+    median_ms = statistics.median(samples)
+
+    breakdown = import_breakdown()
+    total_key = "TOTAL src.server"
+    ranked = sorted(
+        ((name, us) for name, us in breakdown.items() if name != total_key),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    rows = [{"package": name, "import_ms": us / 1000} for name, us in ranked[: args.top]]
+    rows.append({"package": "import src.server (total)", "import_ms": breakdown[total_key] / 1000})
+    print_table(rows, ["package", "import_ms"])
+
+    summary = (
+        f"\ntime to first /alive: median {median_ms:.0f} ms, min {min(samples):.0f} ms, "
+        f"max {max(samples):.0f} ms over {args.runs} runs"
+    )
+    over: Optional[bool] = None
+    if args.budget_ms:
+        over = median_ms > args.budget_ms
+        summary += f"; budget {args.budget_ms:.0f} ms {'EXCEEDED' if over else 'ok'}"
+    print(summary)
+    if args.json_path:
+        write_json(
+            args.json_path,
+            {
+                "time_to_alive_ms": samples,
+                "median_ms": median_ms,
+                "budget_ms": args.budget_ms or None,
+                "over_budget": over,
+                "import_ms": {name: us / 1000 for name, us in breakdown.items()},
+            },
+        )
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
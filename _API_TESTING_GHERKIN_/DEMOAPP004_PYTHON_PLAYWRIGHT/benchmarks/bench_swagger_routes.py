@@ -0,0 +1,90 @@
+"""
+Requests/second for the swagger routes: per-request encoding vs pre-rendered bytes.
+
+    python -m benchmarks.bench_swagger_routes --json .results/bench_swagger.json
+
+Requests are driven straight through the ASGI callable, so the numbers isolate
+the routing + handler cost from HTTP client, socket and server overhead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from typing import Dict, Optional
+
+import yaml
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from benchmarks.common import asgi_get, measure, print_table, write_json
+from src.server import app
+
+ROUTES = ("/swagger/v1/json", "/swagger/v1/swagger.json", "/swagger/v1/swagger.yaml")
+
+
+def _legacy_app() -> FastAPI:
+    """The original handlers: re-encode the cached schema dict on every request."""
+    legacy = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+
+    @legacy.get("/swagger/v1/json")
+    @legacy.get("/swagger/v1/swagger.json")
+    async def swagger_json():
+        return JSONResponse(app.openapi())
+
+    @legacy.get("/swagger/v1/swagger.yaml")
+    async def swagger_yaml():
+        return PlainTextResponse(yaml.safe_dump(app.openapi()), media_type="application/x-yaml")
+
+    return legacy
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    loop = asyncio.new_event_loop()
+    variants: Dict[str, tuple] = {
+        "per-request": (_legacy_app(), {}),
+        "pre-rendered": (app, {}),
+        "pre-rendered+gzip": (app, {"Accept-Encoding": "gzip"}),
+        "304": (app, None),
+    }
+
+    rows = []
+    for route in ROUTES:
+        baseline: Optional[float] = None
+        for variant, (target, headers) in variants.items():
+            if headers is None:
+                etag = loop.run_until_complete(asgi_get(target, route, {}))["headers"]["etag"]
+                headers = {"If-None-Match": etag}
+            timing = measure(
+                f"{route}:{variant}",
+                lambda: loop.run_until_complete(asgi_get(target, route, headers)),
+                repeat=args.repeat,
+            )
+            baseline = baseline or timing.best
+            rows.append(
+                {
+                    "route": route,
+                    "variant": variant,
+                    "requests_per_second": 1 / timing.best,
+                    "speedup": baseline / timing.best,
+                }
+            )
+    loop.close()
+
+    print_table(rows, ["route", "variant", "requests_per_second", "speedup"])
+    if args.json_path:
+        write_json(args.json_path, {"results": rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,265 @@
+"""
+Micro-benchmark suite for the tokenparser entry points, with a baseline gate.
+
+    python -m benchmarks.bench_tokenparser --json .results/bench.json
+    python -m benchmarks.bench_tokenparser --baseline benchmarks/baseline_tokenparser.json
+    python -m benchmarks.bench_tokenparser --update-baseline
+
+Every case is warmed up and then timed over `--repeat` runs (see
+`common.measure`); the best run is compared, as it is the least disturbed by
+other load. With `--baseline` the exit status is 1 when any case is more than
+`--threshold` (default 25%) slower than its baseline entry. Baselines are
+machine-specific: regenerate them with `--update-baseline` on the machine that
+runs the gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+
+from benchmarks.common import PROJECT_ROOT, measure, print_table, write_json
+from tokenparser.date_parser import (
+    DateTokenError,
+    compile_date_token,
+    evaluate_date_plan,
+    parse_date_range_token,
+    parse_date_token,
+)
+from tokenparser.dynamic_string_parser import (
+    DynamicStringTokenError,
+    _parse_token,
+    generate_dynamic_string,
+)
+
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "baseline_tokenparser.json"
+DEFAULT_THRESHOLD = 0.25
+
+DATE_TOKENS = {
+    "short": "[TODAY]",
+    "long": "[TODAY+2YEAR+6MONTH-15DAY+1YEAR-3MONTH+10DAY]",
+    "month-end": "[END-FEBRUARY-2024]",
+    "invalid": "INVALIDTOKEN",
+    "invalid-unit": "[TODAY+1WEEK]",
+}
+RANGE_TOKENS = {
+    "valid": "[START-JANUARY-2024<->END-DECEMBER-2030]",
+    "invalid": "[START-JANUARY-2024<->TODAY]",
+}
+DYNAMIC_TOKENS = {
+    "short": "[ALPHA-5]",
+    "long-types": "[ALPHA-NUMERIC-PUNCTUATION-SPECIAL-64]",
+    "lines": "[ALPHA-NUMERIC-100-LINES-100]",
+    "all": "[ALPHA-NUMERIC-ALL]",
+    "all-lines": "[SPECIAL-ALL-LINES-100]",
+    "invalid-format": "INVALIDTOKEN",
+    "invalid-type": "[GREEK-10]",
+}
+# Generation cases: valid tokens only, single-core so no process pool is timed.
+GENERATE_TOKENS = {
+    "short": "[ALPHA-5]",
+    "medium": "[ALPHA-NUMERIC-SPECIAL-1000]",
+    "lines": "[ALPHA-NUMERIC-100-LINES-100]",
+    "large": "[NUMERIC-10000-LINES-100]",
+    "all": "[ALPHA-NUMERIC-ALL]",
+    "all-lines": "[SPECIAL-ALL-LINES-100]",
+}
+
+
+def _swallow(func: Callable[..., Any], *args: Any, errors=(), **kwargs: Any) -> Callable[[], None]:
+    """A zero-argument call of `func` that treats `errors` as an expected outcome."""
+
+    def run() -> None:
+        try:
+            func(*args, **kwargs)
+        except errors:
+            pass
+
+    return run
+
+
+def _uncached_parse_date_token(token: str):
+    """`parse_date_token` without the plan and result LRU caches."""
+    return evaluate_date_plan(compile_date_token.__wrapped__(token))
+
+
+def cases() -> Dict[str, Callable[[], None]]:
+    """All benchmark cases by stable name (names are the baseline keys)."""
+    suite: Dict[str, Callable[[], None]] = {}
+    for name, token in DATE_TOKENS.items():
+        suite[f"parse_date_token[{name}]"] = _swallow(
+            parse_date_token, token, errors=DateTokenError
+        )
+        suite[f"parse_date_token.uncached[{name}]"] = _swallow(
+            _uncached_parse_date_token, token, errors=DateTokenError
+        )
+    for name, token in RANGE_TOKENS.items():
+        suite[f"parse_date_range_token[{name}]"] = _swallow(
+            parse_date_range_token, token, errors=DateTokenError
+        )
+    for name, token in DYNAMIC_TOKENS.items():
+        suite[f"_parse_token[{name}]"] = _swallow(
+            _parse_token, token, errors=DynamicStringTokenError
+        )
+    for name, token in GENERATE_TOKENS.items():
+        suite[f"generate_dynamic_string[{name}]"] = _swallow(
+            generate_dynamic_string, token, mode="crypto", workers=1
+        )
+    suite["generate_dynamic_string.fast[lines]"] = _swallow(
+        generate_dynamic_string, GENERATE_TOKENS["lines"], mode="fast", seed=1, workers=1
+    )
+    return suite
+
+
+def run_suite(
+    repeat: int, min_run_seconds: float, names: Iterable[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Time the `names` cases with the garbage collector paused, like timeit."""
+    suite = cases()
+    results: Dict[str, Dict[str, Any]] = {}
+    for name in names:
+        func = suite[name]
+        gc.collect()
+        gc.disable()
+        try:
+            timing = measure(name, func, repeat=repeat, warmup=3, min_run_seconds=min_run_seconds)
+        finally:
+            gc.enable()
+        results[name] = {
+            "best_us": timing.best * 1e6,
+            "median_us": timing.median * 1e6,
+            "calls_per_run": timing.calls_per_run,
+            "runs": timing.runs,
+        }
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], threshold: float
+) -> List[Dict[str, Any]]:
+    """One row per case with its ratio to the baseline and a status."""
+    rows = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            rows.append({"case": name, "best_us": result["best_us"], "status": "new"})
+            continue
+        ratio = result["best_us"] / reference["best_us"]
+        status = "REGRESSED" if ratio > 1 + threshold else "ok"
+        rows.append(
+            {
+                "case": name,
+                "baseline_us": reference["best_us"],
+                "best_us": result["best_us"],
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return rows
+
+
+def _regressed(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], threshold: float
+) -> List[str]:
+    rows = compare(results, baseline, threshold)
+    return [row["case"] for row in rows if row["status"] == "REGRESSED"]
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument(
+        "--min-run-seconds", type=float, default=0.1, help="Minimum duration of each timed run."
+    )
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this.")
+    parser.add_argument(
+        "--confirm",
+        type=int,
+        default=2,
+        help="Re-time apparent regressions this many times, keeping each case's best result.",
+    )
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Compare against this baseline JSON and exit 1 on regressions.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown per case as a fraction (0.25 = 25%% slower).",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        type=Path,
+        help=f"Write the results as the new baseline (default {DEFAULT_BASELINE.name}).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    names = [name for name in cases() if args.filter in name]
+    results = run_suite(args.repeat, args.min_run_seconds, names)
+    report: Dict[str, Any] = {"environment": _environment(), "cases": results}
+
+    regressions: List[str] = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        # A slowdown has to survive re-timing: one noisy run should not fail the gate.
+        for _ in range(args.confirm):
+            suspects = _regressed(results, baseline["cases"], args.threshold)
+            if not suspects:
+                break
+            for name, retry in run_suite(args.repeat, args.min_run_seconds, suspects).items():
+                if retry["best_us"] < results[name]["best_us"]:
+                    results[name] = retry
+        rows = compare(results, baseline["cases"], args.threshold)
+        regressions = [row["case"] for row in rows if row["status"] == "REGRESSED"]
+        report.update(
+            baseline=str(args.baseline),
+            baseline_environment=baseline.get("environment"),
+            threshold=args.threshold,
+            comparison=rows,
+            regressions=regressions,
+        )
+        print_table(rows, ["case", "baseline_us", "best_us", "ratio", "status"])
+    else:
+        rows = [{"case": name, **result} for name, result in results.items()]
+        print_table(rows, ["case", "best_us", "median_us", "calls_per_run"])
+
+    if args.json_path:
+        write_json(args.json_path, report)
+    if args.update_baseline:
+        write_json(args.update_baseline, {"environment": _environment(), "cases": results})
+        print(f"baseline written to {args.update_baseline}")
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}: "
+            + ", ".join(regressions),
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""
+Throughput scaling of the multi-worker launcher.
+
+    python -m benchmarks.bench_workers --workers 1 2 4 8 --duration 10 --concurrency 128
+
+For each worker count the launcher is started on a free port as a separate
+process tree, a closed-loop asyncio client keeps `--concurrency` requests in
+flight for `--duration` seconds, and the server is then stopped with SIGTERM.
+The client shares the machine, so leave a core or two free for it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import signal
+import time
+from typing import Dict
+
+import httpx
+
+from benchmarks.common import free_port, print_table, start_server, wait_until_alive, write_json
+
+DEFAULT_PATH = "/parse-date-token?token=[TODAY%2B1DAY]"
+
+
+async def _drive(base_url: str, path: str, concurrency: int, duration: float) -> Dict[str, float]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    completed = errors = 0
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        # Settle connections before the timed window.
+        await asyncio.gather(*(client.get(path) for _ in range(concurrency)))
+        deadline = time.perf_counter() + duration
+
+        async def loop() -> None:
+            nonlocal completed, errors
+            while time.perf_counter() < deadline:
+                try:
+                    response = await client.get(path)
+                    completed += 1
+                    errors += response.status_code >= 400
+                except httpx.TransportError:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return {"requests": completed, "errors": errors, "requests_per_second": completed / elapsed}
+
+
+def _parse_args() -> argparse.Namespace:
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({1, *(2**i for i in range(1, cpus.bit_length()) if 2**i <= cpus), cpus})
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per worker count.")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--path", default=DEFAULT_PATH, help="Request path and query.")
+    parser.add_argument(
+        "--server-arg", action="append", default=[], help="Extra launcher flag (repeatable)."
+    )
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    rows = []
+    baseline = None
+    for workers in args.workers:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(port, ["--workers", str(workers), *args.server_arg])
+        try:
+            asyncio.run(wait_until_alive(base_url))
+            result = asyncio.run(_drive(base_url, args.path, args.concurrency, args.duration))
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+        baseline = baseline or result["requests_per_second"]
+        rows.append(
+            {
+                "workers": workers,
+                **result,
+                "speedup": result["requests_per_second"] / baseline,
+            }
+        )
+
+    print(f"cpu_count={os.cpu_count()} concurrency={args.concurrency} path={args.path}")
+    print_table(rows, ["workers", "requests", "errors", "requests_per_second", "speedup"])
+    if args.json_path:
+        write_json(args.json_path, {"cpu_count": os.cpu_count(), "results": rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""
+Throughput of `/ws/parse` against the REST parse endpoints.
+
+    python -m benchmarks.bench_ws_parse --messages 20000 --connections 1 8
+
+Starts a single-worker server and parses the same `--messages` tokens of one
+`--kind` two ways per connection count: REST requests over keep-alive
+connections (each connection waits for its response before sending the next
+request), and `/ws/parse` with every connection pipelining its share of the
+messages. Reports messages/second, and the speed-up over REST with the same
+number of connections.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import signal
+import time
+from typing import Dict, List
+from urllib.parse import quote
+
+from websockets.asyncio.client import connect
+
+from benchmarks.common import free_port, print_table, start_server, wait_until_alive, write_json
+from tooling.load_test import HttpConnection
+
+# kind -> (REST route, token)
+KINDS = {
+    "date": ("/parse-date-token", "[TODAY+1DAY]"),
+    "date-range": ("/parse-date-range-token", "[START-JANUARY-2024<->END-DECEMBER-2030]"),
+    "dynamic-string": ("/parse-dynamic-string-token", "[ALPHA-NUMERIC-32]"),
+}
+
+
+def _shares(total: int, parts: int) -> List[int]:
+    return [total // parts + (index < total % parts) for index in range(parts)]
+
+
+async def _rest(port: int, kind: str, messages: int, connections: int) -> float:
+    route, token = KINDS[kind]
+    target = f"{route}?token={quote(token)}"
+
+    async def client(count: int) -> None:
+        connection = HttpConnection("127.0.0.1", port)
+        try:
+            for _ in range(count):
+                if await connection.get(target) != 200:
+                    raise RuntimeError(f"{target} failed")
+        finally:
+            connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(count) for count in _shares(messages, connections)))
+    return time.perf_counter() - started
+
+
+async def _ws(port: int, kind: str, messages: int, connections: int) -> float:
+    _, token = KINDS[kind]
+
+    async def client(count: int) -> None:
+        async with connect(f"ws://127.0.0.1:{port}/ws/parse", max_queue=None) as websocket:
+
+            async def send_all() -> None:
+                for index in range(count):
+                    await websocket.send(json.dumps({"id": index, "kind": kind, "token": token}))
+
+            sender = asyncio.create_task(send_all())
+            for _ in range(count):
+                if "result" not in json.loads(await websocket.recv()):
+                    raise RuntimeError(f"/ws/parse failed for {token}")
+            await sender
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(count) for count in _shares(messages, connections)))
+    return time.perf_counter() - started
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--kind", choices=sorted(KINDS), default="date")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--json", dest="json_path", help="Optional path for a JSON report.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    port = free_port()
+    server = start_server(port, ["--workers", "1"])
+    rows: List[Dict[str, object]] = []
+    try:
+        asyncio.run(wait_until_alive(f"http://127.0.0.1:{port}"))
+        for connections in args.connections:
+            rest_rate = 0.0
+            for transport, run in (("rest", _rest), ("ws", _ws)):
+                asyncio.run(run(port, args.kind, min(args.messages, 500), connections))  # warm-up
+                seconds = asyncio.run(run(port, args.kind, args.messages, connections))
+                rate = args.messages / seconds
+                rest_rate = rest_rate or rate
+                rows.append(
+                    {
+                        "transport": transport,
+                        "connections": connections,
+                        "messages": args.messages,
+                        "seconds": seconds,
+                        "msgs_per_s": rate,
+                        "speedup": rate / rest_rate,
+                    }
+                )
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+    print(f"kind={args.kind} token={KINDS[args.kind][1]}")
+    print_table(rows, ["transport", "connections", "messages", "seconds", "msgs_per_s", "speedup"])
+    if args.json_path:
+        write_json(args.json_path, {"kind": args.kind, "results": rows})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,187 @@
+"""Shared timing and reporting helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Mirror the layout pytest sees: `tokenparser` lives under src/, `src.server` at the root.
+for _path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+# The one nearest-rank percentile, shared with the load test and run summaries.
+from tooling.summary_renderer import percentile  # noqa: E402,F401
+
+
+@dataclass
+class Timing:
+    """Per-call timings (seconds) gathered by `measure`."""
+
+    name: str
+    calls_per_run: int
+    runs: int
+    best: float
+    median: float
+    mean: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int = 5,
+    warmup: int = 1,
+    min_run_seconds: float = 0.2,
+) -> Timing:
+    """
+    Time `func` after `warmup` calls, `timeit.autorange` style.
+
+    Each run loops enough calls to last at least `min_run_seconds` so fast
+    functions are not dominated by timer resolution.
+    """
+    for _ in range(warmup):
+        func()
+
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_run_seconds or calls >= 1 << 20:
+            break
+        calls *= 2
+
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        samples.append((time.perf_counter() - started) / calls)
+
+    return Timing(
+        name=name,
+        calls_per_run=calls,
+        runs=repeat,
+        best=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+    )
+
+
+def print_table(rows: Sequence[Dict[str, Any]], columns: Iterable[str]) -> None:
+    """Print rows as a fixed-width table."""
+    columns = list(columns)
+    rendered = [[_format(row.get(col)) for col in columns] for row in rows]
+    widths = [
+        max(len(col), *(len(cells[i]) for cells in rendered)) if rendered else len(col)
+        for i, col in enumerate(columns)
+    ]
+    print("  ".join(col.ljust(width) for col, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for cells in rendered:
+        print("  ".join(cell.ljust(width) for cell, width in zip(cells, widths)))
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:,.6g}" if value < 1000 else f"{value:,.0f}"
+    return str(value)
+
+
+def write_json(path: str | Path, payload: Any) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return path
+
+
+def free_port() -> int:
+    """Return a currently unused localhost TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(
+    port: int, args: Sequence[str] = (), env: Optional[Mapping[str, str]] = None
+) -> subprocess.Popen:
+    """Launch `python -m src.launcher` on 127.0.0.1:`port` with quiet logging."""
+    environ = {**os.environ, **(env or {})}
+    environ["PYTHONPATH"] = os.pathsep.join([str(PROJECT_ROOT / "src"), str(PROJECT_ROOT)])
+    command = [
+        sys.executable, "-m", "src.launcher",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--no-access-log", "--log-level", "warning", *args,
+    ]
+    return subprocess.Popen(command, cwd=PROJECT_ROOT, env=environ)
+
+
+async def wait_until_alive(base_url: str, timeout: float = 30.0) -> None:
+    """Poll `/alive` until the server answers or `timeout` seconds pass."""
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/alive")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+async def asgi_get(
+    target, path: str, headers: Optional[Mapping[str, str]] = None, query: str = ""
+) -> Dict[str, Any]:
+    """
+    Issue one GET straight through an ASGI callable (no client, no sockets).
+
+    Returns the status, headers and body; useful for measuring routing and
+    handler cost in isolation.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    messages: List[dict] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await target(scope, receive, send)
+    start = messages[0]
+    return {
+        "status": start["status"],
+        "headers": {k.decode(): v.decode() for k, v in start["headers"]},
+        "body": b"".join(m.get("body", b"") for m in messages[1:]),
+    }
@@ -0,0 +1,20 @@
+@api
+Feature: Concurrent API Requests
+  As a test author with many independent requests in one scenario
+  I want them sent concurrently over one shared request context
+  So that the suite does not wait on the network one request at a time
+
+  Scenario Outline: Independent date token requests run concurrently
+    Given the date tokens "<tokens>"
+    When I send a GET request for each date token concurrently
+    Then each concurrent response should match its date token
+
+    Examples:
+      | tokens                                                                          |
+      | [TODAY],[TOMORROW+3DAY],[END-FEBRUARY-2024],INVALIDTOKEN,[START-MAY-2020]       |
+      | [TODAY-1YEAR-1MONTH],[YESTERDAY],[START-JANUARY-2024],[TODAY+1WEEK],[TOMORROW] |
+
+  Scenario: A batch request and single lookups run side by side
+    Given the date tokens "[TODAY],[END-FEBRUARY-2024],INVALIDTOKEN"
+    When I post the date tokens and request each one concurrently
+    Then the batch records should agree with the single lookups
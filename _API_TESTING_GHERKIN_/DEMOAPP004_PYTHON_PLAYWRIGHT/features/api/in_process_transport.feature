@@ -0,0 +1,19 @@
+@api @network
+Feature: In-Process ASGI Transport
+  As a test author running the API scenarios without a server
+  I want in-process calls into the ASGI app to answer like the server does
+  So that API_TRANSPORT=asgi runs test the same behaviour, only faster
+
+  Scenario Outline: The in-process app answers like the running server
+    When I request "<endpoint>" over the network and in-process
+    Then both transports should return the same status, content type and body
+
+    Examples:
+      | endpoint                                                            |
+      | /alive                                                              |
+      | /parse-date-token?token=[END-FEBRUARY-2024]                         |
+      | /parse-date-token?token=INVALIDTOKEN                                |
+      | /parse-date-range-token?token=[START-JANUARY-2024<->END-MARCH-2024] |
+      | /parse-dynamic-string-token?token=[NUMERIC-0]                       |
+      | /swagger/v1/swagger.json                                            |
+      | /missing-route                                                      |
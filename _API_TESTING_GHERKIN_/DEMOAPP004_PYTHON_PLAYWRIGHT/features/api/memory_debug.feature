@@ -0,0 +1,10 @@
+@api
+Feature: Memory Debug Endpoint
+  As an operator
+  I want the memory profiler off unless it is asked for
+  So that production workers never pay for allocation tracing
+
+  Scenario: The memory report is not served by default
+    Given the Token Parser API is available
+    When I send a GET request to "/debug/memory"
+    Then the response status should be 404
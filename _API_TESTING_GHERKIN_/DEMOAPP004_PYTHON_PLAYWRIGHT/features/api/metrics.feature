@@ -0,0 +1,41 @@
+@api
+Feature: Metrics Endpoint
+  As an operator
+  I want Prometheus metrics from the API
+  So that I can see traffic, latency and parser behaviour under load
+
+  Scenario: Requests are counted per route template
+    Given the Token Parser API is available
+    When I send a GET request to "/alive"
+    And I send a GET request to "/metrics"
+    Then the response status should be 200
+    And the metrics should include "tokenparser_http_requests_total{route=\"/alive\",method=\"GET\",status=\"200\"}"
+    And the metrics should include "tokenparser_http_request_duration_seconds_bucket{route=\"/alive\",le=\"+Inf\"}"
+    And the metrics should include "tokenparser_http_requests_in_flight"
+
+  Scenario Outline: Rejected tokens are counted by error type
+    Given a <kind> token "<token>"
+    When I send a GET request to "<endpoint>" with the token query
+    And I send a GET request to "/metrics"
+    Then the metrics should include "tokenparser_token_errors_total{route=\"<endpoint>\",type=\"<error>\"}"
+
+    Examples:
+      | kind           | token        | endpoint                    | error                   |
+      | date           | INVALIDTOKEN | /parse-date-token           | DateTokenError          |
+      | dynamic string | INVALIDTOKEN | /parse-dynamic-string-token | DynamicStringTokenError |
+
+  Scenario: Generated bytes and parser cache ratios are reported
+    Given a dynamic string token "[NUMERIC-10-LINES-2]"
+    When I send a GET request to "/parse-dynamic-string-token" with the token query
+    And I send a GET request to "/metrics"
+    Then the metrics should include "tokenparser_dynamic_string_generated_bytes_total"
+    And the metrics should include "tokenparser_cache_hit_ratio{cache=\"date_plans\"}"
+    And the metrics should include "tokenparser_cache_hit_ratio{cache=\"char_tables\"}"
+
+  Scenario: Admission control reports limits and shed requests per cost class
+    Given the Token Parser API is available
+    When I send a GET request to "/metrics"
+    Then the metrics should include "tokenparser_admission_limit{cost_class=\"heavy\"}"
+    And the metrics should include "tokenparser_admission_queued{cost_class=\"light\"}"
+    And the metrics should include "tokenparser_admission_shed_total{cost_class=\"heavy\",reason=\"queue_full\"}"
+    And the metrics should include "tokenparser_admission_shed_total{cost_class=\"light\",reason=\"queue_timeout\"}"
@@ -0,0 +1,40 @@
+@api
+Feature: Parse Date Range Token Endpoint
+  As a consumer
+  I want to resolve and expand date range tokens via the API
+  So that I can seed every date between two month boundaries
+
+  Scenario: Parse the endpoints of a date range token
+    Given a date range token "[START-JANUARY-2024<->END-FEBRUARY-2024]"
+    When I send a GET request to "/parse-date-range-token" with the token query
+    Then the response status should be 200
+    And the response body field "StartDate" should equal "2024-01-01 00:00:00Z"
+    And the response body field "EndDate" should equal "2024-02-29 00:00:00Z"
+    And the response should be cacheable forever
+
+  Scenario Outline: Expand a date range token
+    Given a date range token "<token>"
+    When I expand the date range token by "<step>"
+    Then the response status should be 200
+    And the response should list <count> dates from "<first>" to "<last>"
+
+    Examples:
+      | token                                     | step  | count | first                | last                 |
+      | [START-JANUARY-2024<->END-FEBRUARY-2024]  | DAY   | 60    | 2024-01-01 00:00:00Z | 2024-02-29 00:00:00Z |
+      | [END-JANUARY-2024<->END-DECEMBER-2024]    | MONTH | 12    | 2024-01-31 00:00:00Z | 2024-12-31 00:00:00Z |
+      | [START-JANUARY-2000<->END-DECEMBER-2030]  | DAY   | 11323 | 2000-01-01 00:00:00Z | 2030-12-31 00:00:00Z |
+      | [END-FEBRUARY-2024<->END-JUNE-2024]       | MONTH | 5     | 2024-02-29 00:00:00Z | 2024-06-30 00:00:00Z |
+      | [END-APRIL-2024<->END-AUGUST-2024]        | MONTH | 5     | 2024-04-30 00:00:00Z | 2024-08-31 00:00:00Z |
+      | [START-DECEMBER-9999<->END-DECEMBER-9999] | DAY   | 31    | 9999-12-01 00:00:00Z | 9999-12-31 00:00:00Z |
+      | [END-JANUARY-9999<->END-DECEMBER-9999]    | MONTH | 12    | 9999-01-31 00:00:00Z | 9999-12-31 00:00:00Z |
+
+  Scenario Outline: Reject invalid date range requests
+    Given a date range token "<token>"
+    When I expand the date range token by "<step>"
+    Then the response status should be 400
+    And the response body field "Error" should equal "<message>"
+
+    Examples:
+      | token                                    | step | message                     |
+      | INVALIDTOKEN                             | DAY  | Invalid string token format |
+      | [START-JANUARY-2024<->END-FEBRUARY-2024] | WEEK | Invalid range step          |
@@ -19,3 +19,24 @@ Feature: Parse Date Token Endpoint
       | [TOMORROW+3DAY]            | 200    | ParsedToken | tomorrow plus three days (four days from today)     |
       | [YESTERDAY-2DAY]           | 200    | ParsedToken | yesterday minus two days (three days ago)           |
       | [TODAY+2YEAR+6MONTH-15DAY] | 200    | ParsedToken | two years and six months ahead of today minus 15 days |
+      | [TODAY+9000YEAR]           | 400    | Error       | is out of range                                     |
+
+  Scenario Outline: Date token responses can be cached and revalidated
+    Given a date token "<token>"
+    When I send a GET request to "/parse-date-token" with the token query
+    Then the response status should be 200
+    And the response should be cacheable <lifetime>
+    When I revalidate the date token with the last ETag
+    Then the response status should be 304
+    And the response body should be empty
+
+    Examples:
+      | token               | lifetime                    |
+      | [TODAY+1DAY]        | until the next UTC midnight |
+      | [END-FEBRUARY-2024] | forever                     |
+
+  Scenario: Invalid date tokens are not cached
+    Given a date token "INVALIDTOKEN"
+    When I send a GET request to "/parse-date-token" with the token query
+    Then the response status should be 400
+    And the response should not carry an ETag
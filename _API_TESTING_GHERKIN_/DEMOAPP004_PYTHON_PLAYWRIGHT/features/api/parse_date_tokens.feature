@@ -0,0 +1,21 @@
+@api
+Feature: Parse Date Tokens Batch Endpoint
+  As a data-seeding job
+  I want to resolve many date tokens in a single request
+  So that per-request overhead does not dominate large runs
+
+  Scenario Outline: Parse a batch of date tokens
+    Given the date tokens "<tokens>"
+    When I send a POST request to "/parse-date-tokens" with the tokens as "<format>"
+    Then the response status should be 200
+    And the response should stream one record per date token
+
+    Examples:
+      | tokens                                                | format |
+      | [TODAY],INVALIDTOKEN,[END-FEBRUARY-2024]              | json   |
+      | [TOMORROW+3DAY],[TODAY-1YEAR-1MONTH],[START-MAY-2020] | ndjson |
+
+  Scenario: Stop the batch at a malformed JSON array element
+    When I send a POST request to "/parse-date-tokens" with the body '["[TODAY]", {x, "[TOMORROW]"]'
+    Then the response status should be 200
+    And the response should stream the records "[TODAY]" then the error "Invalid JSON array body"
@@ -15,3 +15,21 @@ Feature: Parse Dynamic String Token Endpoint
       | [NUMERIC-8]                            | 200    | ParsedToken | A numeric string of length 8                                                       |
       | [SPECIAL-5-LINES-3]                    | 200    | ParsedToken | 3 lines of strings with each line containing 5 special characters                  |
       | [ALPHA-NUMERIC-SPECIAL-12]             | 200    | ParsedToken | A mixed alpha, numeric, and special character string of length 12                  |
+      | [ALPHA-1000-LINES-100]                 | 200    | ParsedToken | 100 lines of 1000 alpha characters, generated on the thread pool                   |
+
+    @perf
+    Examples: 5 MB, generated on the process pool
+      | token                     | status | key         | expectation                           |
+      | [NUMERIC-5000-LINES-1000] | 200    | ParsedToken | 1000 lines of 5000 numeric characters |
+
+  Scenario Outline: Stream a multi-line dynamic string token
+    Given a dynamic string token "<token>"
+    When I stream the dynamic string token accepting "<accept>"
+    Then the response status should be 200
+    And the streamed "<accept>" body should match the dynamic string token
+
+    Examples:
+      | token                      | accept               |
+      | [ALPHA-NUMERIC-20-LINES-5] | text/plain           |
+      | [SPECIAL-8-LINES-4]        | application/x-ndjson |
+      | [PUNCTUATION-ALL-LINES-3]  | text/plain           |
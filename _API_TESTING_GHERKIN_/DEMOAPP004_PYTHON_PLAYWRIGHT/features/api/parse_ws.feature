@@ -0,0 +1,26 @@
+@api @network
+Feature: Pipelined WebSocket Parsing
+  As a client parsing thousands of tokens interactively
+  I want to pipeline parse messages over one WebSocket connection
+  So that each token does not pay for a full HTTP request/response cycle
+
+  Scenario Outline: Every pipelined message gets a matching reply
+    Given the WebSocket messages "<messages>"
+    When I pipeline the WebSocket messages to "/ws/parse" 1 time
+    Then each WebSocket reply should match its message
+
+    Examples:
+      | messages                                                                                        |
+      | date=[TODAY];date=INVALIDTOKEN;date=[END-FEBRUARY-2024]                                         |
+      | date-range=[START-JANUARY-2024<->END-DECEMBER-2030];date-range=[START-JANUARY-2024<->TODAY]     |
+      | dynamic-string=[ALPHA-NUMERIC-32];dynamic-string=[SPECIAL-20-LINES-5];dynamic-string=[GREEK-10] |
+      | date=[TOMORROW+3DAY];greek=[TODAY];dynamic-string=[NUMERIC-1000-LINES-100]                      |
+
+  Scenario: Bursts beyond the in-flight limit are all answered
+    Given the WebSocket messages "date=[TODAY];dynamic-string=[ALPHA-16];date=INVALIDTOKEN"
+    When I pipeline the WebSocket messages to "/ws/parse" 400 times
+    Then each WebSocket reply should match its message
+
+  Scenario: Malformed frames are answered with an error
+    When I send the raw WebSocket frame "not json" to "/ws/parse"
+    Then the WebSocket reply error should contain "not valid JSON"
@@ -0,0 +1,24 @@
+@api
+Feature: JSON Response Encoding
+  As a consumer comparing raw payloads
+  I want every JSON body encoded exactly as before
+  So that byte-level contract checks keep passing on the fast response path
+
+  Scenario: The health check body is compact JSON
+    Given the Token Parser API is available
+    When I send a GET request to "/alive"
+    Then the raw response body should be compact JSON
+
+  Scenario Outline: Parsed token bodies are compact JSON
+    Given a <kind> token "<token>"
+    When I send a GET request to "<endpoint>" with the token query
+    Then the response status should be <status>
+    And the raw response body should be compact JSON
+
+    Examples:
+      | kind           | token                      | endpoint                    | status |
+      | date           | [END-FEBRUARY-2024]        | /parse-date-token           | 200    |
+      | date           | INVALIDTOKEN               | /parse-date-token           | 400    |
+      | dynamic string | [ALPHA-NUMERIC-SPECIAL-64] | /parse-dynamic-string-token | 200    |
+      | dynamic string | [PUNCTUATION-2000]         | /parse-dynamic-string-token | 200    |
+      | dynamic string | [SPECIAL-20-LINES-5]       | /parse-dynamic-string-token | 200    |
@@ -0,0 +1,17 @@
+@api
+Feature: Response Snapshots
+  As a test author asking several questions about one response
+  I want the response copied once, with its timing, when the request is made
+  So that questions do not go back to the driver or decode the body again
+
+  Scenario: The last response is remembered as an immutable, timed snapshot
+    Given a date token "[END-FEBRUARY-2024]"
+    When I send a GET request to "/parse-date-token" with the token query
+    Then the response status should be 200
+    And the remembered response should be a snapshot with its timing and size
+    And repeated body questions should share one decoded JSON value
+
+  Scenario: Each request is recorded in the latency trace
+    Given a date token "[TODAY+1DAY]"
+    When I request the date token while tracing latency
+    Then the latency trace should hold one record for "/parse-date-token" and the token
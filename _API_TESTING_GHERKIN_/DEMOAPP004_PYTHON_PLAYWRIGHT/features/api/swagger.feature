@@ -0,0 +1,21 @@
+@api
+Feature: OpenAPI Documents
+  As a contract-test runner
+  I want the OpenAPI documents served as cheap static bytes
+  So that constant polling does not load the API
+
+  Scenario Outline: Fetch and revalidate a pre-rendered OpenAPI document
+    When I fetch the OpenAPI document "<path>" accepting "<encoding>"
+    Then the response status should be 200
+    And the response should be encoded as "<encoding>"
+    And the OpenAPI document should describe "/parse-date-token"
+    When I revalidate the OpenAPI document with the last ETag
+    Then the response status should be 304
+    And the response body should be empty
+
+    Examples:
+      | path                     | encoding |
+      | /swagger/v1/json         | identity |
+      | /swagger/v1/swagger.json | gzip     |
+      | /swagger/v1/swagger.yaml | identity |
+      | /swagger/v1/swagger.yaml | gzip     |
@@ -7,26 +7,58 @@ Screenplay tasks.
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+import yaml
 from pytest_bdd import given, parsers, then, when, scenarios
 
 from screenplay.questions.response_body import ResponseBody
+from screenplay.questions.response_header import ResponseHeader
+from screenplay.questions.response_records import ResponseRecords
 from screenplay.questions.response_status import ResponseStatus
+from screenplay.questions.response_text import ResponseText
+from screenplay.questions.websocket_replies import WebSocketReplies
+from screenplay.support import latency_trace
+from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
 from screenplay.tasks.send_get_request import SendGetRequest
-from tokenparser.date_parser import format_date_utc, parse_date_token
+from screenplay.tasks.send_get_request_async import SendGetRequestAsync
+from screenplay.tasks.send_post_request import SendPostRequest
+from screenplay.tasks.send_post_request_async import SendPostRequestAsync
+from screenplay.tasks.send_websocket_messages import SendWebSocketMessages
+from tokenparser.date_parser import (
+    DateTokenError,
+    format_date_utc,
+    parse_date_range_token,
+    parse_date_token,
+    seconds_until_utc_midnight,
+)
 from tokenparser.dynamic_string_parser import (
     ALPHA_CHARS,
     NUMERIC_CHARS,
     PUNCTUATION_CHARS,
     SPECIAL_CHARS,
     TOKEN_PATTERN,
+    DynamicStringTokenError,
+    generate_dynamic_string,
 )
 
 FEATURE_DIR = Path(__file__).resolve().parents[1]
 scenarios(str(FEATURE_DIR / "api" / "alive.feature"))
 scenarios(str(FEATURE_DIR / "api" / "parse_date_token.feature"))
 scenarios(str(FEATURE_DIR / "api" / "parse_dynamic_string_token.feature"))
+scenarios(str(FEATURE_DIR / "api" / "parse_date_tokens.feature"))
+scenarios(str(FEATURE_DIR / "api" / "parse_date_range_token.feature"))
+scenarios(str(FEATURE_DIR / "api" / "swagger.feature"))
+scenarios(str(FEATURE_DIR / "api" / "metrics.feature"))
+scenarios(str(FEATURE_DIR / "api" / "response_encoding.feature"))
+scenarios(str(FEATURE_DIR / "api" / "parse_ws.feature"))
+scenarios(str(FEATURE_DIR / "api" / "memory_debug.feature"))
+scenarios(str(FEATURE_DIR / "api" / "concurrent_requests.feature"))
+scenarios(str(FEATURE_DIR / "api" / "in_process_transport.feature"))
+scenarios(str(FEATURE_DIR / "api" / "response_snapshot.feature"))
 
 
 @given("the Token Parser API is available")
@@ -46,6 +78,16 @@ def store_dynamic_token(token: str, scenario_context):
     scenario_context.pop("date_token", None)
 
 
+@given(parsers.parse('a date range token "{token}"'))
+def store_date_range_token(token: str, scenario_context):
+    scenario_context["date_range_token"] = token
+
+
+@given(parsers.parse('the date tokens "{tokens}"'))
+def store_date_tokens(tokens: str, scenario_context):
+    scenario_context["date_tokens"] = tokens.split(",")
+
+
 @when(parsers.parse('I send a GET request to "{endpoint}"'))
 def send_basic_get(actor, endpoint: str):
     actor.attempts_to(SendGetRequest(endpoint=endpoint))
@@ -65,6 +107,80 @@ def send_dynamic_token(actor, scenario_context):
     )
 
 
+@when("I send a GET request to \"/parse-date-range-token\" with the token query")
+def send_date_range_token(actor, scenario_context):
+    token = scenario_context["date_range_token"]
+    actor.attempts_to(SendGetRequest(endpoint="/parse-date-range-token", params={"token": token}))
+
+
+@when(parsers.parse('I expand the date range token by "{step}"'))
+def expand_date_range_token(actor, scenario_context, step: str):
+    token = scenario_context["date_range_token"]
+    actor.attempts_to(
+        SendGetRequest(endpoint="/parse-date-range-token", params={"token": token, "step": step})
+    )
+
+
+@when(parsers.parse('I stream the dynamic string token accepting "{accept}"'))
+def send_dynamic_token_streamed(actor, scenario_context, accept: str):
+    token = scenario_context["dynamic_token"]
+    actor.attempts_to(
+        SendGetRequest(
+            endpoint="/parse-dynamic-string-token",
+            params={"token": token},
+            headers={"Accept": accept},
+        )
+    )
+
+
+@when("I revalidate the date token with the last ETag")
+def revalidate_date_token(actor, scenario_context):
+    etag = ResponseHeader("ETag").answered_by(actor)
+    assert etag, "Expected the previous response to carry an ETag"
+    actor.attempts_to(
+        SendGetRequest(
+            endpoint="/parse-date-token",
+            params={"token": scenario_context["date_token"]},
+            headers={"If-None-Match": etag},
+        )
+    )
+
+
+@when(parsers.parse('I fetch the OpenAPI document "{path}" accepting "{encoding}"'))
+def fetch_openapi_document(actor, scenario_context, path: str, encoding: str):
+    scenario_context["openapi_request"] = (path, encoding)
+    actor.attempts_to(SendGetRequest(endpoint=path, headers={"Accept-Encoding": encoding}))
+
+
+@when("I revalidate the OpenAPI document with the last ETag")
+def revalidate_openapi_document(actor, scenario_context):
+    path, encoding = scenario_context["openapi_request"]
+    etag = ResponseHeader("ETag").answered_by(actor)
+    assert etag, "Expected the previous response to carry an ETag"
+    actor.attempts_to(
+        SendGetRequest(
+            endpoint=path, headers={"Accept-Encoding": encoding, "If-None-Match": etag}
+        )
+    )
+
+
+@when(parsers.parse('I send a POST request to "{endpoint}" with the tokens as "{body_format}"'))
+def send_token_batch(actor, scenario_context, endpoint: str, body_format: str):
+    tokens = scenario_context["date_tokens"]
+    if body_format == "ndjson":
+        body = "\n".join(json.dumps(token) for token in tokens)
+        task = SendPostRequest(endpoint=endpoint, body=body, content_type="application/x-ndjson")
+    else:
+        task = SendPostRequest(endpoint=endpoint, body=json.dumps(tokens))
+    actor.attempts_to(task)
+
+
+@when(parsers.parse("I send a POST request to \"{endpoint}\" with the body '{body}'"))
+def send_raw_body(actor, endpoint: str, body: str):
+    # As bytes: Playwright would JSON-encode a str that is not valid JSON.
+    actor.attempts_to(SendPostRequest(endpoint=endpoint, body=body.encode("utf-8")))
+
+
 @then(parsers.parse("the response status should be {status:d}"))
 def assert_status(actor, status: int):
     actual = ResponseStatus.answered_by(actor)
@@ -78,6 +194,92 @@ def assert_body_field(actor, field: str, expected: str):
     assert str(body[field]) == expected
 
 
+@then(parsers.parse('the response should list {count:d} dates from "{first}" to "{last}"'))
+def assert_expanded_dates(actor, count: int, first: str, last: str):
+    dates = ResponseRecords.answered_by(actor)
+    assert len(dates) == count, f"Expected {count} dates, got {len(dates)}"
+    assert dates[0] == first
+    assert dates[-1] == last
+
+
+@then("the response should be cacheable until the next UTC midnight")
+def assert_cacheable_until_midnight(actor):
+    cache_control = ResponseHeader("Cache-Control").answered_by(actor) or ""
+    assert cache_control.startswith("public, max-age="), cache_control
+    max_age = int(cache_control.rsplit("=", 1)[1])
+    assert 0 < max_age <= seconds_until_utc_midnight() + 1
+    assert ResponseHeader("ETag").answered_by(actor)
+
+
+@then("the response should be cacheable forever")
+def assert_cacheable_forever(actor):
+    cache_control = ResponseHeader("Cache-Control").answered_by(actor) or ""
+    assert "immutable" in cache_control, cache_control
+    assert ResponseHeader("ETag").answered_by(actor)
+
+
+@then("the response should not carry an ETag")
+def assert_no_etag(actor):
+    assert ResponseHeader("ETag").answered_by(actor) is None
+
+
+@then(parsers.parse('the response should be encoded as "{encoding}"'))
+def assert_content_encoding(actor, encoding: str):
+    actual = ResponseHeader("Content-Encoding").answered_by(actor) or "identity"
+    assert actual == encoding
+
+
+@then(parsers.parse('the OpenAPI document should describe "{path}"'))
+def assert_openapi_document(actor, path: str):
+    # Playwright transparently decompresses gzip bodies.
+    document = yaml.safe_load(ResponseText.answered_by(actor))
+    assert path in document["paths"], f"OpenAPI document missing path '{path}'"
+
+
+@then(parsers.parse('the metrics should include "{series}"'))
+def assert_metrics_series(actor, series: str):
+    series = series.replace('\\"', '"')
+    text = ResponseText.answered_by(actor)
+    names = {line.rsplit(" ", 1)[0] for line in text.splitlines() if not line.startswith("#")}
+    assert series in names, f"Metric series {series} not exposed"
+
+
+@then("the raw response body should be compact JSON")
+def assert_compact_json(actor):
+    # The encoding JSONResponse uses; the fast path must match it byte for byte.
+    raw = ResponseText.answered_by(actor)
+    expected = json.dumps(json.loads(raw), ensure_ascii=False, separators=(",", ":"))
+    assert raw == expected, f"Body is not compact stdlib JSON: {raw[:200]!r}"
+
+
+@then("the response body should be empty")
+def assert_empty_body(actor):
+    assert ResponseText.answered_by(actor) == ""
+
+
+@then("the response should stream one record per date token")
+def assert_date_token_records(actor, scenario_context):
+    tokens = scenario_context["date_tokens"]
+    records = ResponseRecords.answered_by(actor)
+    assert [record["token"] for record in records] == tokens
+
+    for token, record in zip(tokens, records):
+        try:
+            expected = _expected_date_string(token)
+        except DateTokenError as error:
+            assert record.get("Error") == str(error)
+        else:
+            assert record.get("ParsedToken") == expected
+
+
+@then(parsers.parse('the response should stream the records "{tokens}" then the error "{error}"'))
+def assert_records_then_error(actor, tokens: str, error: str):
+    *records, last = ResponseRecords.answered_by(actor)
+    assert [record["token"] for record in records] == tokens.split(",")
+    assert all("ParsedToken" in record for record in records), records
+    assert last == {"token": None, "Error": error}
+
+
 def _expected_date_string(token: str) -> str:
     parsed = parse_date_token(token)
     return format_date_utc(parsed)
@@ -116,6 +318,15 @@ def _assert_dynamic_token_value(token: str, actual_value: str) -> None:
         assert set(line).issubset(allowed_chars), "Unexpected characters in generated string"
 
 
+@then(parsers.parse('the streamed "{accept}" body should match the dynamic string token'))
+def assert_streamed_dynamic_body(actor, scenario_context, accept: str):
+    if accept == "application/x-ndjson":
+        value = "\r\n".join(ResponseRecords.answered_by(actor))
+    else:
+        value = ResponseText.answered_by(actor)
+    _assert_dynamic_token_value(scenario_context["dynamic_token"], value)
+
+
 @then(parsers.parse('the response should contain "{field}" with the value "{expected}"'))
 def assert_response_contains(actor, scenario_context, field: str, expected: str):
     body = ResponseBody.answered_by(actor)
@@ -135,3 +346,195 @@ def assert_response_contains(actor, scenario_context, field: str, expected: str)
             return
 
     raise AssertionError(f"Unhandled assertion for field '{field}'")
+
+
+@given(parsers.parse('the WebSocket messages "{messages}"'))
+def store_websocket_messages(messages: str, scenario_context):
+    scenario_context["ws_messages"] = [
+        tuple(message.split("=", 1)) for message in messages.split(";")
+    ]
+
+
+@when(parsers.parse('I pipeline the WebSocket messages to "{endpoint}" {times:d} time'))
+@when(parsers.parse('I pipeline the WebSocket messages to "{endpoint}" {times:d} times'))
+def pipeline_websocket_messages(actor, scenario_context, endpoint: str, times: int):
+    messages = scenario_context["ws_messages"] * times
+    frames = [
+        json.dumps({"id": index, "kind": kind, "token": token})
+        for index, (kind, token) in enumerate(messages)
+    ]
+    actor.attempts_to(SendWebSocketMessages(endpoint, frames))
+    scenario_context["ws_sent"] = dict(enumerate(messages))
+
+
+@when(parsers.parse('I send the raw WebSocket frame "{frame}" to "{endpoint}"'))
+def send_raw_websocket_frame(actor, endpoint: str, frame: str):
+    actor.attempts_to(SendWebSocketMessages(endpoint, [frame]))
+
+
+@then("each WebSocket reply should match its message")
+def assert_websocket_replies(actor, scenario_context):
+    sent = scenario_context["ws_sent"]
+    replies = WebSocketReplies.answered_by(actor)
+    assert sorted(reply["id"] for reply in replies) == sorted(sent), "Expected one reply per id"
+
+    for reply in replies:
+        kind, token = sent[reply["id"]]
+        if kind == "date":
+            try:
+                expected = _expected_date_string(token)
+            except DateTokenError as error:
+                assert reply.get("error") == str(error)
+            else:
+                assert reply.get("result") == expected
+        elif kind == "date-range":
+            try:
+                start, end = parse_date_range_token(token)
+            except DateTokenError as error:
+                assert reply.get("error") == str(error)
+            else:
+                expected = {"StartDate": format_date_utc(start), "EndDate": format_date_utc(end)}
+                assert reply.get("result") == expected
+        elif kind == "dynamic-string":
+            try:
+                generate_dynamic_string(token)
+            except DynamicStringTokenError as error:
+                assert reply.get("error") == str(error)
+            else:
+                _assert_dynamic_token_value(token, reply["result"])
+        else:
+            assert reply.get("error", "").startswith("Unknown kind"), reply
+
+
+@then(parsers.parse('the WebSocket reply error should contain "{expected}"'))
+def assert_websocket_reply_error(actor, expected: str):
+    (reply,) = WebSocketReplies.answered_by(actor)
+    assert expected in reply.get("error", ""), reply
+
+
+def _date_token_key(index: int) -> str:
+    return f"{MemoryKeys.LAST_RESPONSE}[{index}]"
+
+
+@when("I send a GET request for each date token concurrently")
+def send_date_tokens_concurrently(async_actor, async_runner, scenario_context):
+    tokens = scenario_context["date_tokens"]
+
+    async_runner.run(
+        async_actor.attempts_concurrently(
+            *(
+                SendGetRequestAsync(
+                    "/parse-date-token", params={"token": token}, remember_as=_date_token_key(i)
+                )
+                for i, token in enumerate(tokens)
+            )
+        )
+    )
+    scenario_context["concurrent_bodies"] = [
+        ResponseBody.answered_by(async_actor, _date_token_key(i)) for i in range(len(tokens))
+    ]
+
+
+@when("I post the date tokens and request each one concurrently")
+def send_batch_and_lookups_concurrently(async_actor, async_runner, scenario_context):
+    tokens = scenario_context["date_tokens"]
+    batch = SendPostRequestAsync("/parse-date-tokens", body=json.dumps(tokens))
+
+    lookups = [
+        SendGetRequestAsync(
+            "/parse-date-token", params={"token": token}, remember_as=_date_token_key(i)
+        )
+        for i, token in enumerate(tokens)
+    ]
+    async_runner.run(async_actor.attempts_concurrently(batch, *lookups))
+    scenario_context["batch_records"] = ResponseRecords.answered_by(async_actor)
+    scenario_context["concurrent_bodies"] = [
+        ResponseBody.answered_by(async_actor, _date_token_key(i)) for i in range(len(tokens))
+    ]
+
+
+@then("each concurrent response should match its date token")
+def assert_concurrent_date_bodies(scenario_context):
+    tokens = scenario_context["date_tokens"]
+    bodies = scenario_context["concurrent_bodies"]
+    assert len(bodies) == len(tokens)
+    for token, body in zip(tokens, bodies):
+        try:
+            expected = _expected_date_string(token)
+        except DateTokenError as error:
+            assert body == {"Error": str(error)}
+        else:
+            assert body == {"ParsedToken": expected}
+
+
+@then("the batch records should agree with the single lookups")
+def assert_batch_matches_lookups(scenario_context):
+    records = scenario_context["batch_records"]
+    bodies = scenario_context["concurrent_bodies"]
+    assert [record["token"] for record in records] == scenario_context["date_tokens"]
+    for record, body in zip(records, bodies):
+        assert {key: value for key, value in record.items() if key != "token"} == body
+
+
+@when(parsers.parse('I request "{endpoint}" over the network and in-process'))
+def request_over_both_transports(
+    playwright_api_context, asgi_request_context, scenario_context, endpoint: str
+):
+    scenario_context["transport_responses"] = {
+        "network": playwright_api_context.get(endpoint),
+        "asgi": asgi_request_context.get(endpoint),
+    }
+
+
+@then("both transports should return the same status, content type and body")
+def assert_transports_agree(scenario_context):
+    network, in_process = (
+        scenario_context["transport_responses"][name] for name in ("network", "asgi")
+    )
+    assert in_process.status == network.status
+    assert in_process.headers.get("content-type") == network.headers.get("content-type")
+    assert in_process.body() == network.body()
+
+
+@then("the remembered response should be a snapshot with its timing and size")
+def assert_response_snapshot(actor):
+    snapshot = actor.memory.recall(MemoryKeys.LAST_RESPONSE)
+    assert isinstance(snapshot, ResponseSnapshot)
+    assert (snapshot.method, snapshot.endpoint) == ("GET", "/parse-date-token")
+    assert snapshot.duration_ms > 0
+    assert snapshot.size == len(snapshot.body()) > 0
+    with pytest.raises(AttributeError):
+        snapshot.status = 500
+
+
+@then("repeated body questions should share one decoded JSON value")
+def assert_json_decoded_once(actor):
+    assert ResponseBody.answered_by(actor) is ResponseBody.answered_by(actor)
+
+
+@when("I request the date token while tracing latency")
+def send_date_token_traced(actor, scenario_context, latency_trace_file, tmp_path):
+    trace = latency_trace.LatencyTrace(tmp_path / "latency.jsonl")
+    latency_trace.install(trace)
+    try:
+        actor.attempts_to(
+            SendGetRequest("/parse-date-token", params={"token": scenario_context["date_token"]})
+        )
+    finally:
+        latency_trace.install(latency_trace_file)
+        trace.close()
+    scenario_context["trace_path"] = trace.path
+
+
+@then(parsers.parse('the latency trace should hold one record for "{endpoint}" and the token'))
+def assert_latency_trace(actor, scenario_context, endpoint: str):
+    lines = scenario_context["trace_path"].read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    snapshot = actor.memory.recall(MemoryKeys.LAST_RESPONSE)
+    assert (record["method"], record["endpoint"]) == ("GET", endpoint)
+    assert record["token"] == scenario_context["date_token"]
+    assert record["status"] == snapshot.status == 200
+    assert record["bytes"] == snapshot.size
+    assert record["duration_ms"] == round(snapshot.duration_ms, 3)
+    assert record["test"].endswith("test_each_request_is_recorded_in_the_latency_trace")
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Tuple
 
 import pytest
@@ -12,11 +16,17 @@ from pytest_bdd import given, parsers, then, when, scenarios
 
 from screenplay.abilities.use_token_parsers import UseTokenParsers
 from screenplay.support.memory_keys import MemoryKeys
+from src.admission import AdmissionController, AdmissionMiddleware
+from src.memory_debug import MemoryDebugMiddleware, MemoryProfiler
+from src.responses import FastJSONResponse
+from tokenparser.date_parser import compile_date_token, evaluate_date_plan
 from tokenparser.dynamic_string_parser import SPECIAL_CHARS
 
 FEATURE_DIR = Path(__file__).resolve().parents[1] / "util-tests"
 scenarios(str(FEATURE_DIR / "tokenDateParser.feature"))
 scenarios(str(FEATURE_DIR / "tokenDynamicStringParser.feature"))
+scenarios(str(FEATURE_DIR / "admissionControl.feature"))
+scenarios(str(FEATURE_DIR / "memoryDebug.feature"))
 
 
 def _parser(actor):
@@ -61,11 +71,29 @@ def remember_date_range(token: str, scenario_context):
     scenario_context["date_range_token"] = token
 
 
+@given(parsers.parse('I have the date tokens "{tokens}"'))
+def remember_date_tokens(tokens: str, scenario_context):
+    scenario_context["date_tokens"] = tokens.split(",")
+
+
+@given(parsers.parse('I have the anchor days from "{first}" to "{last}"'))
+def remember_anchor_days(first: str, last: str, scenario_context):
+    start, end = date.fromisoformat(first), date.fromisoformat(last)
+    scenario_context["anchor_days"] = [
+        start + timedelta(days=offset) for offset in range((end - start).days + 1)
+    ]
+
+
 @given(parsers.parse('I have the dynamic token "{token}"'))
 def remember_dynamic_token(token: str, scenario_context):
     scenario_context["dynamic_token"] = token
 
 
+@given(parsers.parse('I use the "{mode}" random mode'))
+def remember_random_mode(mode: str, scenario_context):
+    scenario_context["random_mode"] = mode
+
+
 @when("I parse the date token locally")
 def parse_relative_date(actor, scenario_context):
     token = scenario_context["date_token"]
@@ -102,12 +130,35 @@ def parse_date_range(actor, scenario_context):
         actor.memory.forget(MemoryKeys.LAST_PARSED_RANGE)
 
 
+@when(parsers.parse('I expand the date range string locally by "{step}"'))
+def expand_date_range(actor, scenario_context, step: str):
+    token = scenario_context["date_range_token"]
+    _clear_error(actor)
+    try:
+        dates = [value.strftime("%Y-%m-%d") for value in _parser(actor).expand_date_range(token, step)]
+        actor.memory.remember(MemoryKeys.LAST_EXPANDED_RANGE, dates)
+    except Exception as error:
+        _remember_error(actor, error)
+        actor.memory.forget(MemoryKeys.LAST_EXPANDED_RANGE)
+
+
+@when("I parse the date tokens in bulk locally")
+def parse_dates_bulk(actor, scenario_context):
+    pytest.importorskip("numpy")
+    result = _parser(actor).parse_dates_bulk(
+        scenario_context["date_tokens"], scenario_context["anchor_days"]
+    )
+    actor.memory.remember(MemoryKeys.LAST_PARSED_BULK, result)
+
+
 @when("I parse the dynamic token locally")
 def parse_dynamic_string(actor, scenario_context):
     token = scenario_context["dynamic_token"]
     _clear_error(actor)
     try:
-        generated = _parser(actor).parse_dynamic_string(token)
+        generated = _parser(actor).parse_dynamic_string(
+            token, mode=scenario_context.get("random_mode")
+        )
         actor.memory.remember(MemoryKeys.LAST_GENERATED_STRING, generated)
     except Exception as error:
         _remember_error(actor, error)
@@ -130,6 +181,22 @@ def assert_relative_date(actor, years: int, months: int, days: int):
     assert parsed == expected, f"Expected {expected.isoformat()} got {parsed.isoformat()}"
 
 
+@then("every bulk result should match the scalar parser")
+def assert_bulk_matches_scalar(actor, scenario_context):
+    result = actor.memory.recall(MemoryKeys.LAST_PARSED_BULK)
+    assert result is not None, "Expected bulk results to be stored"
+
+    for row, token in enumerate(scenario_context["date_tokens"]):
+        for col, anchor in enumerate(scenario_context["anchor_days"]):
+            actual = str(result[row, col])
+            try:
+                expected = evaluate_date_plan(compile_date_token(token), anchor)
+            except (ValueError, OverflowError):  # DateTokenError or out-of-range dates
+                assert actual == "NaT", f"{token} @ {anchor}: expected NaT got {actual}"
+                continue
+            assert actual == expected.strftime("%Y-%m-%d"), f"{token} @ {anchor}: got {actual}"
+
+
 @then(parsers.parse('an error should be thrown with message "{message}"'))
 def assert_parse_error(actor, message: str):
     error = actor.memory.recall(MemoryKeys.LAST_PARSE_ERROR)
@@ -154,6 +221,20 @@ def assert_range(actor, start: str, end: str):
     assert actual_end.strftime("%Y-%m-%d") == end
 
 
+@then(
+    parsers.re(
+        r'the expansion should have (?P<count>\d+) dates from "(?P<first>[^"]*)" to "(?P<last>[^"]*)"'
+    ),
+    converters={"count": int},
+)
+def assert_expanded_range(actor, count: int, first: str, last: str):
+    dates = actor.memory.recall(MemoryKeys.LAST_EXPANDED_RANGE)
+    assert dates is not None, "Expected an expanded date range"
+    assert len(dates) == count, f"Expected {count} dates, got {len(dates)}"
+    if dates:
+        assert (dates[0], dates[-1]) == (first, last)
+
+
 @then(parsers.parse("the generated string should have a length of {length:d}"))
 def assert_generated_length(actor, length: int):
     generated = actor.memory.recall(MemoryKeys.LAST_GENERATED_STRING)
@@ -196,3 +277,145 @@ def assert_lines(actor, lines: int):
 @then(parsers.parse('a dynamic string parser error should be thrown with message "{message}"'))
 def assert_dynamic_error(actor, message: str):
     assert_parse_error(actor, message)
+
+
+@given(parsers.parse("an admission limit of {limit:d} concurrent and {queue:d} queued requests"))
+def admission_limit(scenario_context, limit: int, queue: int):
+    scenario_context["admission"] = AdmissionController(
+        {"heavy": (limit, queue)}, queue_timeout=5.0, retry_after=2
+    )
+
+
+@given(parsers.parse("an admission queue timeout of {seconds:f} seconds"))
+def admission_queue_timeout(scenario_context, seconds: float):
+    scenario_context["admission"].queue_timeout = seconds
+
+
+@when(parsers.parse('{count:d} requests to "{path}" arrive at once, each taking {seconds:f} seconds'))
+def send_admission_burst(scenario_context, count: int, path: str, seconds: float):
+    async def slow_app(scope, receive, send):
+        await asyncio.sleep(seconds)
+        await FastJSONResponse(b"{}")(scope, receive, send)
+
+    middleware = AdmissionMiddleware(
+        slow_app,
+        scenario_context["admission"],
+        classify=lambda scope: None if scope["path"] == "/alive" else "heavy",
+    )
+
+    async def request():
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []}
+        await middleware(scope, receive, send)
+        return messages[0]
+
+    async def burst():
+        return await asyncio.gather(*(request() for _ in range(count)))
+
+    # Playwright's sync API keeps an event loop running on this thread.
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        scenario_context["admission_responses"] = runner.submit(asyncio.run, burst()).result()
+
+
+def _admission_responses(scenario_context, status: int):
+    return [r for r in scenario_context["admission_responses"] if r["status"] == status]
+
+
+@then(parsers.parse("{count:d} responses should have status {status:d}"))
+def assert_admission_status_count(scenario_context, count: int, status: int):
+    assert len(_admission_responses(scenario_context, status)) == count
+
+
+@then(parsers.parse("{count:d} responses should have status {status:d} with a Retry-After header"))
+def assert_shed_responses(scenario_context, count: int, status: int):
+    shed = _admission_responses(scenario_context, status)
+    assert len(shed) == count
+    for response in shed:
+        assert (b"retry-after", b"2") in response["headers"]
+
+
+@then(parsers.parse('the admission controller should have shed {count:d} requests as "{reason}"'))
+def assert_shed_count(scenario_context, count: int, reason: str):
+    assert scenario_context["admission"].shed[("heavy", reason)] == count
+
+
+@given(parsers.parse('a memory profiler excluding "{path}"'))
+def memory_profiler(scenario_context, path: str):
+    scenario_context["memory_profiler"] = MemoryProfiler()
+    scenario_context["memory_exclude"] = frozenset({path})
+
+
+@when(parsers.parse('a request to "{path}" allocates {peak:d} bytes and keeps {kept:d} bytes'))
+def send_allocating_request(scenario_context, path: str, peak: int, kept: int):
+    retained = []
+
+    async def allocating_app(scope, receive, send):
+        scope["route"] = SimpleNamespace(path=path)
+        transient = bytearray(peak)
+        retained.append(bytearray(kept))
+        del transient
+        await FastJSONResponse(b"{}")(scope, receive, send)
+
+    profiler = scenario_context["memory_profiler"]
+    middleware = MemoryDebugMiddleware(
+        allocating_app, profiler, exclude=scenario_context["memory_exclude"]
+    )
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []}
+    was_tracing = tracemalloc.is_tracing()
+    profiler.start()
+    try:
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            runner.submit(asyncio.run, middleware(scope, receive, send)).result()
+        scenario_context["memory_report"] = profiler.report(top=5)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()  # tracing would slow down the rest of the suite
+
+
+def _route_memory(scenario_context, path: str):
+    routes = scenario_context["memory_report"]["routes"]
+    assert path in routes, f"{path} missing from {sorted(routes)}"
+    return routes[path]
+
+
+@then(
+    parsers.parse(
+        'the memory report for "{path}" should show a peak of at least {peak:d} bytes'
+    )
+)
+def assert_route_peak(scenario_context, path: str, peak: int):
+    assert _route_memory(scenario_context, path)["max_peak_bytes"] >= peak
+
+
+@then(parsers.parse('the memory report for "{path}" should show about {kept:d} retained bytes'))
+def assert_route_retained(scenario_context, path: str, kept: int):
+    net = _route_memory(scenario_context, path)["net_bytes"]
+    assert abs(net - kept) < 64 * 1024, f"Expected about {kept} retained bytes, got {net}"
+
+
+@then("the memory report should list the top allocation sites and the process RSS")
+def assert_memory_report_sections(scenario_context):
+    report = scenario_context["memory_report"]
+    top = report["tracemalloc"]["top"]
+    assert top and {"location", "size_bytes", "count"} <= set(top[0])
+    assert report["tracemalloc"]["peak_bytes"] >= report["tracemalloc"]["current_bytes"]
+    assert set(report["rss"]) == {"current_bytes", "peak_bytes"}
+
+
+@then(parsers.parse('the memory report should not list "{path}"'))
+def assert_route_not_profiled(scenario_context, path: str):
+    assert path not in scenario_context["memory_report"]["routes"]
@@ -0,0 +1,31 @@
+@util
+Feature: Admission Control
+  As an operator running the API through bursts
+  I want requests beyond capacity rejected quickly with Retry-After
+  So that admitted requests keep a bounded latency
+
+  Scenario Outline: A burst beyond the limit and its queue is shed
+    Given an admission limit of <limit> concurrent and <queue> queued requests
+    When <burst> requests to "/parse-dynamic-string-token" arrive at once, each taking 0.05 seconds
+    Then <admitted> responses should have status 200
+    And <shed> responses should have status 503 with a Retry-After header
+    And the admission controller should have shed <shed> requests as "queue_full"
+
+    Examples:
+      | limit | queue | burst | admitted | shed |
+      | 2     | 3     | 5     | 5        | 0    |
+      | 2     | 3     | 8     | 5        | 3    |
+      | 1     | 0     | 4     | 1        | 3    |
+
+  Scenario: Queued requests give up after the queue timeout
+    Given an admission limit of 1 concurrent and 5 queued requests
+    And an admission queue timeout of 0.05 seconds
+    When 3 requests to "/parse-dynamic-string-token" arrive at once, each taking 0.3 seconds
+    Then 1 responses should have status 200
+    And 2 responses should have status 503 with a Retry-After header
+    And the admission controller should have shed 2 requests as "queue_timeout"
+
+  Scenario: Health probes bypass admission control
+    Given an admission limit of 1 concurrent and 0 queued requests
+    When 5 requests to "/alive" arrive at once, each taking 0.05 seconds
+    Then 5 responses should have status 200
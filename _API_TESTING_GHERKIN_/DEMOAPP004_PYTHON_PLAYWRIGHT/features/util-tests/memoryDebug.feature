@@ -0,0 +1,17 @@
+@util
+Feature: Memory Debug Profiler
+  As a developer chasing memory spikes
+  I want per-route allocation deltas next to the top allocation sites
+  So that large tokens and schema renders show up with their memory cost
+
+  Scenario: Per-route peaks and retained memory are reported
+    Given a memory profiler excluding "/debug/memory"
+    When a request to "/parse-dynamic-string-token" allocates 4000000 bytes and keeps 1000000 bytes
+    Then the memory report for "/parse-dynamic-string-token" should show a peak of at least 4000000 bytes
+    And the memory report for "/parse-dynamic-string-token" should show about 1000000 retained bytes
+    And the memory report should list the top allocation sites and the process RSS
+
+  Scenario: Excluded paths are not profiled
+    Given a memory profiler excluding "/debug/memory"
+    When a request to "/debug/memory" allocates 100000 bytes and keeps 0 bytes
+    Then the memory report should not list "/debug/memory"
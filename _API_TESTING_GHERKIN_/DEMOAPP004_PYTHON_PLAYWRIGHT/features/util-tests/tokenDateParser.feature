@@ -19,6 +19,8 @@ Feature: Parsing dates from token format strings using TokenDateParser
       | [TODAY+5MONTH]           | 0     | 5      | 0    |
       | [TOMORROW+5MONTH]        | 0     | 5      | 1    |
       | [YESTERDAY+5MONTH-1YEAR] | -1    | 5      | -1   |
+      | [TODAY+1DAY+1DAY-3DAY]   | 0     | 0      | -1   |
+      | [TOMORROW-1DAY+2YEAR]    | 2     | 0      | 0    |
 
   Scenario: Handling invalid token input
     Given I have the date token "INVALID-TOKEN"
@@ -50,3 +52,30 @@ Feature: Parsing dates from token format strings using TokenDateParser
       | [END-OCTOBER-2020<->END-FEBRUARY-2022]   | 2020-10-31 | 2022-02-28 |
       | [START-DECEMBER-2021<->END-JUNE-2025]    | 2021-12-01 | 2025-06-30 |
       | [START-JULY-2021<->START-MARCH-2023]     | 2021-07-01 | 2023-03-01 |
+
+  Scenario Outline: Expanding date range tokens lazily
+    Given I have the date range string "<dateRangeTokenString>"
+    When I expand the date range string locally by "<step>"
+    Then the expansion should have <count> dates from "<StartDate>" to "<EndDate>"
+
+    Examples:
+      | dateRangeTokenString                      | step  | count | StartDate  | EndDate    |
+      | [START-JANUARY-2024<->END-FEBRUARY-2024]  | DAY   | 60    | 2024-01-01 | 2024-02-29 |
+      | [END-JANUARY-2024<->END-JUNE-2024]        | MONTH | 6     | 2024-01-31 | 2024-06-30 |
+      | [START-JULY-2021<->START-MARCH-2023]      | MONTH | 21    | 2021-07-01 | 2023-03-01 |
+      | [END-FEBRUARY-2024<->END-JUNE-2024]       | MONTH | 5     | 2024-02-29 | 2024-06-30 |
+      | [END-APRIL-2024<->END-AUGUST-2024]        | MONTH | 5     | 2024-04-30 | 2024-08-31 |
+      | [START-DECEMBER-9999<->END-DECEMBER-9999] | DAY   | 31    | 9999-12-01 | 9999-12-31 |
+      | [END-JANUARY-9999<->END-DECEMBER-9999]    | MONTH | 12    | 9999-01-31 | 9999-12-31 |
+      | [END-FEBRUARY-2022<->END-OCTOBER-2020]    | DAY   | 0     |            |            |
+
+  Scenario Outline: Bulk evaluation matches the scalar parser for every anchor day
+    Given I have the date tokens "<tokens>"
+    And I have the anchor days from "<firstAnchor>" to "<lastAnchor>"
+    When I parse the date tokens in bulk locally
+    Then every bulk result should match the scalar parser
+
+    Examples:
+      | tokens                                                                           | firstAnchor | lastAnchor |
+      | [TODAY+1MONTH],[TODAY-1YEAR+1MONTH-1DAY],[TOMORROW+1YEAR],[END-FEBRUARY-2024]    | 2024-01-28  | 2024-03-02 |
+      | [YESTERDAY+5MONTH-1YEAR],[TODAY+2YEAR+6MONTH-15DAY],[TODAY-13MONTH],INVALIDTOKEN | 2023-12-25  | 2024-01-05 |
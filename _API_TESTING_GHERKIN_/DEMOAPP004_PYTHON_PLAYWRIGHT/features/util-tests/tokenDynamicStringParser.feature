@@ -26,6 +26,21 @@ Feature: TokenDynamicStringParser String Generation
       | [PUNCTUATION-ALL]              | 6      | PUNCTUATION               | 1     |
       | [SPECIAL-PUNCTUATION-ALL]      | 30     | SPECIAL_PUNCTUATION       | 1     |
 
+  Scenario Outline: Generate strings with each random engine mode
+    Given I have the dynamic token "<token>"
+    And I use the "<mode>" random mode
+    When I parse the dynamic token locally
+    Then the generated string should have a length of <length>
+    And the generated string should match the character set "<characterSet>"
+    And the generated string should have <lines> lines
+
+    Examples:
+      | token                          | mode   | length | characterSet          | lines |
+      | [ALPHA-NUMERIC-SPECIAL-500]    | crypto | 500    | ALPHA_NUMERIC_SPECIAL | 1     |
+      | [ALPHA-NUMERIC-SPECIAL-500]    | fast   | 500    | ALPHA_NUMERIC_SPECIAL | 1     |
+      | [ALPHA-NUMERIC-SPECIAL-500]    | legacy | 500    | ALPHA_NUMERIC_SPECIAL | 1     |
+      | [NUMERIC-1000-LINES-20]        | fast   | 20000  | NUMERIC               | 20    |
+
   Scenario Outline: Invalid tokens raise descriptive errors
     Given I have the dynamic token "<token>"
     When I parse the dynamic token locally
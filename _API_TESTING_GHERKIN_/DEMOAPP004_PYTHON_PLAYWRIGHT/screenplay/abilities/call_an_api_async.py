@@ -0,0 +1,8 @@
+"""Ability wrapping Playwright's async APIRequestContext."""
+
+from playwright.async_api import APIRequestContext
+
+
+class CallAnApiAsync:
+    def __init__(self, context: APIRequestContext) -> None:
+        self.context = context
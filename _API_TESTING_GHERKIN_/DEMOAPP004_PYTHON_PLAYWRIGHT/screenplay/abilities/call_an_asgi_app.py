@@ -0,0 +1,11 @@
+"""Ability dispatching API calls in-process into an ASGI app instead of over HTTP."""
+
+from screenplay.abilities.call_an_api import CallAnApi
+from screenplay.support.asgi_transport import AsgiRequestContext
+
+
+class CallAnAsgiApp(CallAnApi):
+    """Stands in for `CallAnApi`: tasks asking for `CallAnApi` get this ability."""
+
+    def __init__(self, context: AsgiRequestContext) -> None:
+        super().__init__(context)
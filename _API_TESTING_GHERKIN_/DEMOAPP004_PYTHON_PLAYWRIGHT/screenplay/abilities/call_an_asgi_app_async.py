@@ -0,0 +1,11 @@
+"""Async ability dispatching API calls in-process into an ASGI app instead of over HTTP."""
+
+from screenplay.abilities.call_an_api_async import CallAnApiAsync
+from screenplay.support.asgi_transport import AsyncAsgiRequestContext
+
+
+class CallAnAsgiAppAsync(CallAnApiAsync):
+    """Stands in for `CallAnApiAsync`: tasks asking for `CallAnApiAsync` get this ability."""
+
+    def __init__(self, context: AsyncAsgiRequestContext) -> None:
+        super().__init__(context)
@@ -1,6 +1,12 @@
 """Ability exposing token parser utilities."""
 
-from tokenparser.date_parser import parse_date_range_token, parse_date_token
+from __future__ import annotations
+
+from tokenparser.date_parser import (
+    expand_date_range_token,
+    parse_date_range_token,
+    parse_date_token,
+)
 from tokenparser.dynamic_string_parser import generate_dynamic_string
 
 
@@ -11,5 +17,13 @@ class UseTokenParsers:
     def parse_date_range(self, token: str):
         return parse_date_range_token(token)
 
-    def parse_dynamic_string(self, token: str) -> str:
-        return generate_dynamic_string(token)
+    def expand_date_range(self, token: str, step: str = "DAY"):
+        return expand_date_range_token(token, step)
+
+    def parse_dates_bulk(self, tokens, anchors=None):
+        from tokenparser.bulk_date_parser import parse_date_tokens_bulk
+
+        return parse_date_tokens_bulk(tokens, anchors, errors="coerce")
+
+    def parse_dynamic_string(self, token: str, mode: str | None = None) -> str:
+        return generate_dynamic_string(token, mode=mode)
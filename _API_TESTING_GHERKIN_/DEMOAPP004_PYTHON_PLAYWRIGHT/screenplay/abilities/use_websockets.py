@@ -0,0 +1,14 @@
+"""Ability opening WebSocket connections to the API under test."""
+
+from __future__ import annotations
+
+from websockets.sync.client import ClientConnection, connect
+
+
+class UseWebSockets:
+    def __init__(self, base_url: str) -> None:
+        # http://host:port -> ws://host:port, https -> wss
+        self.base_url = "ws" + base_url.rstrip("/")[len("http"):]
+
+    def connect(self, endpoint: str) -> ClientConnection:
+        return connect(self.base_url + endpoint, open_timeout=10)
@@ -7,28 +7,39 @@ from typing import Dict, Type, TypeVar
 from screenplay.support.memory import ActorMemory
 
 AbilityType = TypeVar("AbilityType")
+ActorType = TypeVar("ActorType", bound="BaseActor")
 Task = TypeVar("Task")
 
 
-class Actor:
-    """Encapsulates abilities and memory for Screenplay tasks/questions."""
+class BaseActor:
+    """Name, abilities and memory shared by the sync and async actors."""
 
     def __init__(self, name: str) -> None:
         self.name = name
         self._abilities: Dict[Type, AbilityType] = {}
         self.memory = ActorMemory()
 
-    def can(self, ability: AbilityType) -> "Actor":
+    def can(self: ActorType, ability: AbilityType) -> ActorType:
         """Attach an ability to the actor."""
         self._abilities[type(ability)] = ability
         return self
 
     def ability(self, ability_cls: Type[AbilityType]) -> AbilityType:
-        return self._abilities[ability_cls]
+        """The ability of `ability_cls`, or of a subclass standing in for it."""
+        if ability_cls in self._abilities:
+            return self._abilities[ability_cls]
+        for ability in self._abilities.values():
+            if isinstance(ability, ability_cls):
+                return ability
+        raise KeyError(ability_cls)
 
     def forget(self) -> None:
         self.memory.reset()
 
+
+class Actor(BaseActor):
+    """Encapsulates abilities and memory for Screenplay tasks/questions."""
+
     def attempts_to(self, *tasks: Task) -> None:
         for task in tasks:
             task.perform_as(self)
@@ -0,0 +1,29 @@
+"""Async Screenplay actor for tasks built on Playwright's async API."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, TypeVar
+
+from screenplay.actors.actor import BaseActor
+
+Task = TypeVar("Task")
+
+
+class AsyncActor(BaseActor):
+    """
+    Counterpart of `Actor` whose tasks are awaitable.
+
+    `attempts_to` awaits tasks in order, like the sync actor. Independent tasks
+    can go through `attempts_concurrently`, which runs them at the same time
+    over the shared abilities and returns their results in order. Concurrent
+    tasks should remember their responses under distinct keys (`remember_as`)
+    rather than all writing `LAST_RESPONSE`.
+    """
+
+    async def attempts_to(self, *tasks: Task) -> None:
+        for task in tasks:
+            await task.perform_as(self)
+
+    async def attempts_concurrently(self, *tasks: Task) -> List[Any]:
+        return list(await asyncio.gather(*(task.perform_as(self) for task in tasks)))
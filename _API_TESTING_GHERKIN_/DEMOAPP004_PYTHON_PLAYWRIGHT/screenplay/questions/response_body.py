@@ -1,14 +1,13 @@
-"""Question that returns the JSON body of the last response."""
-
-from playwright.sync_api import APIResponse
+"""Question that returns the JSON body of a remembered response."""
 
 from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
 
 
 class ResponseBody:
     @staticmethod
-    def answered_by(actor):
-        response: APIResponse = actor.memory.recall(MemoryKeys.LAST_RESPONSE)
+    def answered_by(actor, key: str = MemoryKeys.LAST_RESPONSE):
+        response: ResponseSnapshot = actor.memory.recall(key)
         if response is None:
-            raise AssertionError("No response stored in memory")
+            raise AssertionError(f"No response stored in memory under {key}")
         return response.json()
@@ -0,0 +1,17 @@
+"""Question that returns a header from the last response."""
+
+from typing import Optional
+
+from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
+
+
+class ResponseHeader:
+    def __init__(self, name: str):
+        self.name = name.lower()
+
+    def answered_by(self, actor) -> Optional[str]:
+        response: ResponseSnapshot = actor.memory.recall(MemoryKeys.LAST_RESPONSE)
+        if response is None:
+            raise AssertionError("No response stored in memory")
+        return response.headers.get(self.name)
@@ -0,0 +1,15 @@
+"""Question that returns the NDJSON records of a remembered response."""
+
+import json
+
+from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
+
+
+class ResponseRecords:
+    @staticmethod
+    def answered_by(actor, key: str = MemoryKeys.LAST_RESPONSE):
+        response: ResponseSnapshot = actor.memory.recall(key)
+        if response is None:
+            raise AssertionError(f"No response stored in memory under {key}")
+        return [json.loads(line) for line in response.text().splitlines() if line.strip()]
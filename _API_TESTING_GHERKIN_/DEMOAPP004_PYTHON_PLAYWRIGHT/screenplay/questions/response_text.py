@@ -0,0 +1,13 @@
+"""Question that returns the raw text body of a remembered response."""
+
+from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
+
+
+class ResponseText:
+    @staticmethod
+    def answered_by(actor, key: str = MemoryKeys.LAST_RESPONSE) -> str:
+        response: ResponseSnapshot = actor.memory.recall(key)
+        if response is None:
+            raise AssertionError(f"No response stored in memory under {key}")
+        return response.text()
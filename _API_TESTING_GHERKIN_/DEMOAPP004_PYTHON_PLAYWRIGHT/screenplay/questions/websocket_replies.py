@@ -0,0 +1,12 @@
+"""Question that returns the replies to the last pipelined WebSocket frames."""
+
+from screenplay.support.memory_keys import MemoryKeys
+
+
+class WebSocketReplies:
+    @staticmethod
+    def answered_by(actor):
+        replies = actor.memory.recall(MemoryKeys.LAST_WS_REPLIES)
+        if replies is None:
+            raise AssertionError("No WebSocket replies stored in memory")
+        return replies
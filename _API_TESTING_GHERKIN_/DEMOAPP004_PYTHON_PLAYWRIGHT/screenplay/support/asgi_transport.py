@@ -0,0 +1,290 @@
+"""
+In-process stand-ins for Playwright's `APIRequestContext`, backed by an ASGI app.
+
+Requests are dispatched straight into the app's ASGI callable: no server, no
+sockets, no HTTP parsing. The request and response surface is the part of
+Playwright's that the Screenplay tasks and questions use (`get`/`post`/`fetch`
+with `params`, `headers` and `data`; `status`, `headers`, `body()`, `text()`,
+`json()`). It also behaves like Playwright where scenarios can tell:
+- default `accept`/`accept-encoding` headers;
+- gzip and deflate bodies are decoded while `content-encoding` is kept, and
+  any other encoding raises rather than leaking compressed bytes;
+- header names are lower-cased.
+
+`AsyncAsgiRequestContext` is the async flavour. `AsgiRequestContext` wraps it
+for sync code by running each request on an `AsyncRunner` loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import zlib
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from screenplay.support.async_runner import AsyncRunner
+
+DEFAULT_HEADERS = {
+    "accept": "*/*",
+    "accept-encoding": "gzip,deflate",  # only what _decode can undo
+    "user-agent": "screenplay-asgi",
+}
+
+
+class _AsgiResponseBase:
+    def __init__(self, url: str, status: int, headers: List[Tuple[str, str]], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers_array = [{"name": name, "value": value} for name, value in headers]
+        self.headers: Dict[str, str] = {}
+        for name, value in headers:
+            self.headers[name] = f"{self.headers[name]}, {value}" if name in self.headers else value
+        self._body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} url={self.url!r} status={self.status}>"
+
+
+class AsgiResponse(_AsgiResponseBase):
+    """Sync response with the `playwright.sync_api.APIResponse` reading methods."""
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        return self._body.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self._body)
+
+    def dispose(self) -> None:
+        pass
+
+
+class AsyncAsgiResponse(_AsgiResponseBase):
+    """Async response with the `playwright.async_api.APIResponse` reading methods."""
+
+    async def body(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return self._body.decode("utf-8")
+
+    async def json(self) -> Any:
+        return json.loads(self._body)
+
+    async def dispose(self) -> None:
+        pass
+
+
+def _decode(body: bytes, headers: List[Tuple[str, str]]) -> bytes:
+    encoding = next((value for name, value in headers if name == "content-encoding"), "")
+    encoding = encoding.strip().lower()
+    if encoding in ("gzip", "deflate"):
+        return zlib.decompress(body, wbits=zlib.MAX_WBITS | 32)  # gzip or zlib header
+    if encoding not in ("", "identity"):
+        raise ValueError(f"cannot decode content-encoding {encoding!r}")
+    return body
+
+
+class AsyncAsgiRequestContext:
+    """Async `APIRequestContext` look-alike dispatching into an ASGI app."""
+
+    def __init__(self, app, base_url: str = "http://testserver") -> None:
+        self.app = app
+        self.base_url = base_url.rstrip("/")
+        parts = urlsplit(self.base_url)
+        self._scheme = parts.scheme or "http"
+        self._server = (parts.hostname or "testserver", parts.port or 80)
+        self._host = parts.netloc or "testserver"
+        self._lifespan: Optional[asyncio.Task] = None
+        self._lifespan_events: Optional[asyncio.Queue] = None
+
+    async def start(self) -> None:
+        """Run the app's lifespan startup, if it has one."""
+        events: asyncio.Queue = asyncio.Queue()
+        started = asyncio.get_running_loop().create_future()
+        self._lifespan_events = events
+
+        async def receive():
+            return await events.get()
+
+        async def send(message):
+            if message["type"].startswith("lifespan.startup") and not started.done():
+                started.set_result(message)
+            elif message["type"].startswith("lifespan.shutdown"):
+                events.put_nowait(None)  # wake dispose()
+
+        async def lifespan():
+            try:
+                await self.app({"type": "lifespan", "asgi": {"version": "3.0"}}, receive, send)
+            finally:
+                if not started.done():  # the app does not support lifespan
+                    started.set_result(None)
+
+        events.put_nowait({"type": "lifespan.startup"})
+        self._lifespan = asyncio.create_task(lifespan())
+        message = await started
+        if message is not None and message["type"] == "lifespan.startup.failed":
+            raise RuntimeError(f"ASGI lifespan startup failed: {message.get('message', '')}")
+
+    async def dispose(self) -> None:
+        """Run the lifespan shutdown (offload pools are closed there)."""
+        if self._lifespan is None:
+            return
+        if not self._lifespan.done():
+            self._lifespan_events.put_nowait({"type": "lifespan.shutdown"})
+        await asyncio.gather(self._lifespan, return_exceptions=True)
+        self._lifespan = None
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> AsyncAsgiResponse:
+        return await self.fetch(url, method="GET", params=params, headers=headers)
+
+    async def post(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Any = None,
+    ) -> AsyncAsgiResponse:
+        return await self.fetch(url, method="POST", params=params, headers=headers, data=data)
+
+    async def fetch(
+        self,
+        url: str,
+        method: str = "GET",
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Any = None,
+    ) -> AsyncAsgiResponse:
+        return AsyncAsgiResponse(*await self.request(url, method, params, headers, data))
+
+    async def request(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Mapping[str, Any]],
+        headers: Optional[Mapping[str, str]],
+        data: Any,
+    ) -> Tuple[str, int, List[Tuple[str, str]], bytes]:
+        """Dispatch one request; returns (url, status, headers, decoded body)."""
+        parts = urlsplit(url)
+        query = parts.query
+        if params:
+            extra = urlencode({key: str(value) for key, value in params.items()})
+            query = f"{query}&{extra}" if query else extra
+        if data is None:
+            body = b""
+        elif isinstance(data, (bytes, bytearray)):
+            body = bytes(data)
+        elif isinstance(data, str):
+            body = data.encode("utf-8")
+        else:
+            body = json.dumps(data).encode("utf-8")
+
+        merged = {**DEFAULT_HEADERS, **{k.lower(): v for k, v in (headers or {}).items()}}
+        merged.setdefault("host", self._host)
+        if body:
+            merged["content-length"] = str(len(body))
+        path = parts.path or "/"
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": self._scheme,
+            "path": path,
+            "raw_path": path.encode("utf-8"),
+            "query_string": query.encode("latin-1"),
+            "root_path": "",
+            "headers": [(k.encode("latin-1"), str(v).encode("latin-1")) for k, v in merged.items()],
+            "client": ("127.0.0.1", 50000),
+            "server": self._server,
+        }
+
+        request_sent = False
+        response_done = asyncio.Event()
+        status = 500
+        response_headers: List[Tuple[str, str]] = []
+        chunks: List[bytes] = []
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # Streaming responses listen for a disconnect while they send.
+            await response_done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status, response_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = [
+                    (k.decode("latin-1").lower(), v.decode("latin-1"))
+                    for k, v in message.get("headers", [])
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_done.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_done.set()
+        full_url = f"{self.base_url}{path}" + (f"?{query}" if query else "")
+        return full_url, status, response_headers, _decode(b"".join(chunks), response_headers)
+
+
+class AsgiRequestContext:
+    """Sync `APIRequestContext` look-alike: each call runs on an `AsyncRunner` loop."""
+
+    def __init__(self, app, runner: AsyncRunner, base_url: str = "http://testserver") -> None:
+        self.runner = runner
+        self.inner = AsyncAsgiRequestContext(app, base_url)
+
+    def start(self) -> None:
+        self.runner.run(self.inner.start())
+
+    def dispose(self) -> None:
+        self.runner.run(self.inner.dispose())
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> AsgiResponse:
+        return self.fetch(url, method="GET", params=params, headers=headers)
+
+    def post(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Any = None,
+    ) -> AsgiResponse:
+        return self.fetch(url, method="POST", params=params, headers=headers, data=data)
+
+    def fetch(
+        self,
+        url: str,
+        method: str = "GET",
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Any = None,
+    ) -> AsgiResponse:
+        raw = self.runner.run(self.inner.request(url, method, params, headers, data))
+        return AsgiResponse(*raw)
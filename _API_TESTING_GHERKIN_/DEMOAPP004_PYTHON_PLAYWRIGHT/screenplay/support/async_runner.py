@@ -0,0 +1,40 @@
+"""Event loop on a background thread for driving async Screenplay code from sync steps."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRunner:
+    """
+    Runs coroutines on one long-lived event loop in a daemon thread.
+
+    Playwright's sync API keeps an event loop running on the test thread, so
+    pytest-bdd steps cannot call `asyncio.run`. Every coroutine submitted here
+    shares one loop, which lets objects bound to it (an async
+    `APIRequestContext`) live for the whole session.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="screenplay-async", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, awaitable: Awaitable[T], timeout: float | None = None) -> T:
+        """Run `awaitable` on the background loop and wait for its result."""
+
+        async def wrapper() -> T:
+            return await awaitable
+
+        return asyncio.run_coroutine_threadsafe(wrapper(), self.loop).result(timeout)
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
@@ -0,0 +1,75 @@
+"""
+Per-request latency trace written by the Screenplay HTTP tasks.
+
+When a trace is installed (the session fixture does this when `API_TRACE_PATH`
+is set), every request task records one JSON line: the time, the method, the
+endpoint path, the `token` query value, the status, `duration_ms`, the body
+`bytes` and the current test id. Records are buffered in memory and written
+`buffer_size` lines at a time, each batch in a single `O_APPEND` write.
+pytest-xdist workers can therefore share one file without splitting lines,
+and a record costs one `json.dumps` and a list append. With no trace
+installed, `record()` returns at once.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import parse_qs
+
+from screenplay.support.response_snapshot import ResponseSnapshot
+
+
+class LatencyTrace:
+    def __init__(self, path: str | Path, buffer_size: int = 512) -> None:
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self._lines: List[str] = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    def record(self, snapshot: ResponseSnapshot, token: Optional[str] = None) -> None:
+        test = os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+        endpoint, _, query = snapshot.endpoint.partition("?")
+        if token is None and query:
+            token = parse_qs(query).get("token", [None])[0]
+        entry = {
+            "ts": round(time.time(), 3),
+            "method": snapshot.method,
+            "endpoint": endpoint,
+            "token": token,
+            "status": snapshot.status,
+            "duration_ms": round(snapshot.duration_ms, 3),
+            "bytes": snapshot.size,
+            "test": test,
+        }
+        self._lines.append(json.dumps(entry, separators=(",", ":")))
+        if len(self._lines) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            os.write(self._fd, ("\n".join(self._lines) + "\n").encode("utf-8"))
+            self._lines.clear()
+
+    def close(self) -> None:
+        self.flush()
+        os.close(self._fd)
+
+
+_active: Optional[LatencyTrace] = None
+
+
+def install(trace: Optional[LatencyTrace]) -> None:
+    """Make `trace` the one `record()` writes to (None turns tracing off)."""
+    global _active
+    _active = trace
+
+
+def record(snapshot: ResponseSnapshot, token: Optional[str] = None) -> None:
+    """Record one request on the installed trace, if any."""
+    if _active is not None:
+        _active.record(snapshot, token)
@@ -3,9 +3,12 @@
 
 class MemoryKeys:
     LAST_RESPONSE = "LAST_RESPONSE"
+    LAST_WS_REPLIES = "LAST_WS_REPLIES"
     LAST_UTIL_RESULT = "LAST_UTIL_RESULT"
     LAST_PARSED_DATE = "LAST_PARSED_DATE"
     SECONDARY_PARSED_DATE = "SECONDARY_PARSED_DATE"
     LAST_PARSED_RANGE = "LAST_PARSED_RANGE"
+    LAST_PARSED_BULK = "LAST_PARSED_BULK"
+    LAST_EXPANDED_RANGE = "LAST_EXPANDED_RANGE"
     LAST_PARSE_ERROR = "LAST_PARSE_ERROR"
     LAST_GENERATED_STRING = "LAST_GENERATED_STRING"
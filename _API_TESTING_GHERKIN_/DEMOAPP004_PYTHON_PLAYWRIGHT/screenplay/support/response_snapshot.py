@@ -0,0 +1,112 @@
+"""Immutable copy of an API response, taken by the request tasks at request time."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Dict, Optional
+
+_UNSET = object()
+
+
+class ResponseSnapshot:
+    """
+    Status, headers and body bytes of one response, plus how long it took.
+
+    Tasks store a snapshot in actor memory instead of the live Playwright
+    `APIResponse`. Questions therefore read plain attributes rather than going
+    back to the driver, and the response is disposed as soon as it has been
+    copied, so it does not stay tied to the request context's lifetime. `text()`
+    and `json()` decode on first use and return the memoised value after that.
+    Treat the returned JSON as read-only: every question shares it.
+
+    `duration_ms` runs from just before the request is sent until the whole
+    body has been read. `size` is the body length in bytes, after any
+    `content-encoding` has been decoded.
+    """
+
+    __slots__ = (
+        "method", "endpoint", "url", "status", "headers", "duration_ms", "_body", "_text", "_json"
+    )
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        duration_ms: float,
+    ) -> None:
+        set_slot = object.__setattr__
+        set_slot(self, "method", method)
+        set_slot(self, "endpoint", endpoint)
+        set_slot(self, "url", url)
+        set_slot(self, "status", status)
+        set_slot(self, "headers", headers)
+        set_slot(self, "duration_ms", duration_ms)
+        set_slot(self, "_body", body)
+        set_slot(self, "_text", None)
+        set_slot(self, "_json", _UNSET)
+
+    @classmethod
+    def capture(cls, response, method: str, endpoint: str, started: float) -> "ResponseSnapshot":
+        """Copy a sync `APIResponse` (then dispose it); `started` is a `perf_counter()` value."""
+        snapshot = cls._copy(response, response.body(), method, endpoint, started)
+        response.dispose()
+        return snapshot
+
+    @classmethod
+    async def capture_async(
+        cls, response, method: str, endpoint: str, started: float
+    ) -> "ResponseSnapshot":
+        """`capture` for an async `APIResponse`."""
+        snapshot = cls._copy(response, await response.body(), method, endpoint, started)
+        await response.dispose()
+        return snapshot
+
+    @classmethod
+    def _copy(
+        cls, response, body: bytes, method: str, endpoint: str, started: float
+    ) -> "ResponseSnapshot":
+        duration_ms = (time.perf_counter() - started) * 1000
+        headers = dict(response.headers)
+        return cls(method, endpoint, response.url, response.status, headers, body, duration_ms)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    @property
+    def size(self) -> int:
+        return len(self._body)
+
+    def body(self) -> bytes:
+        return self._body
+
+    def text(self) -> str:
+        text: Optional[str] = self._text
+        if text is None:
+            text = self._body.decode("utf-8")
+            object.__setattr__(self, "_text", text)
+        return text
+
+    def json(self) -> Any:
+        value = self._json
+        if value is _UNSET:
+            value = json.loads(self._body)
+            object.__setattr__(self, "_json", value)
+        return value
+
+    def __repr__(self) -> str:
+        return (
+            f"<ResponseSnapshot {self.method} {self.url} status={self.status} "
+            f"size={self.size} duration_ms={self.duration_ms:.1f}>"
+        )
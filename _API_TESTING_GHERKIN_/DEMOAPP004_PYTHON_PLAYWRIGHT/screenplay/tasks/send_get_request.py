@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any, Dict
 
 from screenplay.abilities.call_an_api import CallAnApi
-from screenplay.support.memory import ActorMemory
+from screenplay.support import latency_trace
 from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
 
 
 class SendGetRequest:
-    def __init__(self, endpoint: str, params: Dict[str, Any] | None = None):
+    def __init__(
+        self,
+        endpoint: str,
+        params: Dict[str, Any] | None = None,
+        headers: Dict[str, str] | None = None,
+    ):
         self.endpoint = endpoint
         self.params = params or {}
+        self.headers = headers or {}
 
-    def perform_as(self, actor):
-        """Execute the HTTP request via Playwright."""
+    def perform_as(self, actor) -> ResponseSnapshot:
+        """Execute the HTTP request via Playwright and remember a snapshot of the response."""
         api = actor.ability(CallAnApi)
-        response = api.context.get(self.endpoint, params=self.params)
-        actor.memory.remember(MemoryKeys.LAST_RESPONSE, response)
+        started = time.perf_counter()
+        response = api.context.get(self.endpoint, params=self.params, headers=self.headers)
+        snapshot = ResponseSnapshot.capture(response, "GET", self.endpoint, started)
+        latency_trace.record(snapshot, self.params.get("token"))
+        actor.memory.remember(MemoryKeys.LAST_RESPONSE, snapshot)
+        return snapshot
@@ -0,0 +1,35 @@
+"""Task that performs a GET request via Playwright's async API."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict
+
+from screenplay.abilities.call_an_api_async import CallAnApiAsync
+from screenplay.support import latency_trace
+from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
+
+
+class SendGetRequestAsync:
+    def __init__(
+        self,
+        endpoint: str,
+        params: Dict[str, Any] | None = None,
+        headers: Dict[str, str] | None = None,
+        remember_as: str = MemoryKeys.LAST_RESPONSE,
+    ):
+        self.endpoint = endpoint
+        self.params = params or {}
+        self.headers = headers or {}
+        self.remember_as = remember_as
+
+    async def perform_as(self, actor) -> ResponseSnapshot:
+        """Execute the HTTP request without blocking the event loop; remember a snapshot."""
+        api = actor.ability(CallAnApiAsync)
+        started = time.perf_counter()
+        response = await api.context.get(self.endpoint, params=self.params, headers=self.headers)
+        snapshot = await ResponseSnapshot.capture_async(response, "GET", self.endpoint, started)
+        latency_trace.record(snapshot, self.params.get("token"))
+        actor.memory.remember(self.remember_as, snapshot)
+        return snapshot
@@ -0,0 +1,34 @@
+"""Task that performs a POST request via Playwright."""
+
+from __future__ import annotations
+
+import time
+from typing import Dict
+
+from screenplay.abilities.call_an_api import CallAnApi
+from screenplay.support import latency_trace
+from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
+
+
+class SendPostRequest:
+    def __init__(
+        self,
+        endpoint: str,
+        body: str | bytes,
+        content_type: str = "application/json",
+        headers: Dict[str, str] | None = None,
+    ):
+        self.endpoint = endpoint
+        self.body = body
+        self.headers = {"Content-Type": content_type, **(headers or {})}
+
+    def perform_as(self, actor) -> ResponseSnapshot:
+        """Execute the HTTP request via Playwright and remember a snapshot of the response."""
+        api = actor.ability(CallAnApi)
+        started = time.perf_counter()
+        response = api.context.post(self.endpoint, data=self.body, headers=self.headers)
+        snapshot = ResponseSnapshot.capture(response, "POST", self.endpoint, started)
+        latency_trace.record(snapshot)
+        actor.memory.remember(MemoryKeys.LAST_RESPONSE, snapshot)
+        return snapshot
@@ -0,0 +1,36 @@
+"""Task that performs a POST request via Playwright's async API."""
+
+from __future__ import annotations
+
+import time
+from typing import Dict
+
+from screenplay.abilities.call_an_api_async import CallAnApiAsync
+from screenplay.support import latency_trace
+from screenplay.support.memory_keys import MemoryKeys
+from screenplay.support.response_snapshot import ResponseSnapshot
+
+
+class SendPostRequestAsync:
+    def __init__(
+        self,
+        endpoint: str,
+        body: str | bytes,
+        content_type: str = "application/json",
+        headers: Dict[str, str] | None = None,
+        remember_as: str = MemoryKeys.LAST_RESPONSE,
+    ):
+        self.endpoint = endpoint
+        self.body = body
+        self.headers = {"Content-Type": content_type, **(headers or {})}
+        self.remember_as = remember_as
+
+    async def perform_as(self, actor) -> ResponseSnapshot:
+        """Execute the HTTP request without blocking the event loop; remember a snapshot."""
+        api = actor.ability(CallAnApiAsync)
+        started = time.perf_counter()
+        response = await api.context.post(self.endpoint, data=self.body, headers=self.headers)
+        snapshot = await ResponseSnapshot.capture_async(response, "POST", self.endpoint, started)
+        latency_trace.record(snapshot)
+        actor.memory.remember(self.remember_as, snapshot)
+        return snapshot
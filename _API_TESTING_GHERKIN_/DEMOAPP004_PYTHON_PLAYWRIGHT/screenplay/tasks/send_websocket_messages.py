@@ -0,0 +1,32 @@
+"""Task that pipelines frames over one WebSocket and collects the replies."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import List
+
+from screenplay.abilities.use_websockets import UseWebSockets
+from screenplay.support.memory_keys import MemoryKeys
+
+
+class SendWebSocketMessages:
+    def __init__(self, endpoint: str, frames: List[str], timeout: float = 30.0):
+        self.endpoint = endpoint
+        self.frames = frames
+        self.timeout = timeout
+
+    def perform_as(self, actor):
+        """Send every frame without waiting, then read one reply per frame."""
+        with actor.ability(UseWebSockets).connect(self.endpoint) as connection:
+            # Send from a second thread: once the server's in-flight limit is hit it
+            # stops reading, and only draining replies here lets the sender go on.
+            def send_all() -> None:
+                for frame in self.frames:
+                    connection.send(frame)
+
+            sender = threading.Thread(target=send_all, daemon=True)
+            sender.start()
+            replies = [json.loads(connection.recv(timeout=self.timeout)) for _ in self.frames]
+            sender.join(timeout=self.timeout)
+        actor.memory.remember(MemoryKeys.LAST_WS_REPLIES, replies)
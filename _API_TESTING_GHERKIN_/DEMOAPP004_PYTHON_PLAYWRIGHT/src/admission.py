@@ -0,0 +1,163 @@
+"""
+Admission control and load shedding for the DEMOAPP004 FastAPI host.
+
+Each request is mapped to a cost class (or exempted) before routing. A class
+admits up to `limit` concurrent requests and parks up to `queue_size` more in
+FIFO order; a request that finds the queue full, or waits longer than the queue
+timeout, is rejected straight away with `Retry-After` instead of adding to the
+latency of everything behind it. The permit is held until the response body has
+been sent, so streamed responses count for their whole duration.
+
+Like `src.metrics`, all state lives on the event loop thread: no locks, and
+limits are per worker process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Mapping, Optional, Tuple
+
+from src.responses import FastJSONResponse, json_bytes
+
+QUEUE_FULL = "queue_full"
+QUEUE_TIMEOUT = "queue_timeout"
+SHED_REASONS = (QUEUE_FULL, QUEUE_TIMEOUT)
+
+SHED_ERROR = "Server is overloaded, retry later"
+SHED_BODY = json_bytes({"Error": SHED_ERROR})
+
+# Maps an ASGI scope to a cost class name, or None for exempt requests.
+Classifier = Callable[[Mapping], Optional[str]]
+
+
+class ConcurrencyLimit:
+    """A concurrency limit with a bounded FIFO wait queue for one cost class."""
+
+    __slots__ = ("limit", "queue_size", "active", "waiters")
+
+    def __init__(self, limit: int, queue_size: int) -> None:
+        if limit < 1 or queue_size < 0:
+            raise ValueError("limit must be >= 1 and queue_size >= 0")
+        self.limit = limit
+        self.queue_size = queue_size
+        self.active = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self, timeout: float) -> Optional[str]:
+        """Take a slot, waiting up to `timeout` seconds; return a shed reason on failure."""
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            return None
+        if len(self.waiters) >= self.queue_size:
+            return QUEUE_FULL
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            if self._handed_over(waiter):
+                return None  # release() passed the slot on just as the wait expired
+            return QUEUE_TIMEOUT
+        except asyncio.CancelledError:
+            if self._handed_over(waiter):
+                self.release()  # the slot arrived as the client went away
+            raise
+        return None
+
+    def release(self) -> None:
+        """Hand the slot to the oldest live waiter, or free it."""
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _handed_over(self, waiter: asyncio.Future) -> bool:
+        """True if `waiter` was given a slot; otherwise drop it from the queue."""
+        if waiter.done() and not waiter.cancelled():
+            return True
+        try:
+            self.waiters.remove(waiter)
+        except ValueError:
+            pass
+        return False
+
+
+class AdmissionController:
+    """Per-class concurrency limits plus counts of the requests they shed."""
+
+    def __init__(
+        self,
+        limits: Mapping[str, Tuple[int, int]],
+        queue_timeout: float,
+        retry_after: int,
+        status_code: int = 503,
+    ) -> None:
+        self.limits: Dict[str, ConcurrencyLimit] = {
+            name: ConcurrencyLimit(limit, queue_size)
+            for name, (limit, queue_size) in limits.items()
+        }
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.status_code = status_code
+        self.shed: Dict[Tuple[str, str], int] = {
+            (name, reason): 0 for name in self.limits for reason in SHED_REASONS
+        }
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """`{"limit", "queue_size", "active", "queued", "shed": {reason: n}}` per class."""
+        return {
+            name: {
+                "limit": limit.limit,
+                "queue_size": limit.queue_size,
+                "active": limit.active,
+                "queued": len(limit.waiters),
+                "shed": {reason: self.shed[(name, reason)] for reason in SHED_REASONS},
+            }
+            for name, limit in self.limits.items()
+        }
+
+    def shed_response(self) -> FastJSONResponse:
+        return FastJSONResponse(
+            SHED_BODY,
+            status_code=self.status_code,
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+
+class AdmissionMiddleware:
+    """
+    Pure ASGI middleware applying an `AdmissionController` before routing.
+
+    `classify` sees the raw scope (path and query string) and must stay cheap:
+    it runs for every request, including the ones about to be shed.
+    """
+
+    def __init__(self, app, controller: AdmissionController, classify: Classifier) -> None:
+        self.app = app
+        self.controller = controller
+        self.classify = classify
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        cost_class = self.classify(scope)
+        if cost_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        controller = self.controller
+        limit = controller.limits[cost_class]
+        reason = await limit.acquire(controller.queue_timeout)
+        if reason is not None:
+            controller.shed[(cost_class, reason)] += 1
+            await controller.shed_response()(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limit.release()
@@ -0,0 +1,293 @@
+"""
+Process launcher for the DEMOAPP004 FastAPI host.
+
+`python -m src.launcher` runs one uvicorn server per worker process. Every
+setting is read from a `TOKENPARSER_*` environment variable (plus `PORT`) and
+can be overridden by the matching CLI flag:
+
+| Flag | Environment | Default |
+| --- | --- | --- |
+| `--host` | `TOKENPARSER_HOST` | `0.0.0.0` |
+| `--port` | `PORT` | `3002` |
+| `--workers` | `TOKENPARSER_WORKERS` | CPU count |
+| `--loop` | `TOKENPARSER_LOOP` | `auto` (uvloop when installed) |
+| `--http` | `TOKENPARSER_HTTP` | `auto` (httptools when installed) |
+| `--backlog` | `TOKENPARSER_BACKLOG` | `2048` |
+| `--keep-alive` | `TOKENPARSER_KEEP_ALIVE` | `5` seconds |
+| `--reuse-port` / `--no-reuse-port` | `TOKENPARSER_REUSE_PORT` | on where supported, 2+ workers |
+| `--graceful-timeout` | `TOKENPARSER_GRACEFUL_TIMEOUT` | `30` seconds |
+| `--log-level` | `TOKENPARSER_LOG_LEVEL` | `info` |
+| `--access-log` / `--no-access-log` | `TOKENPARSER_ACCESS_LOG` | on |
+| `--fd` | | none (bind `--host`/`--port`) |
+
+With SO_REUSEPORT each worker binds its own listening socket and the kernel
+spreads connections across them; otherwise the supervisor binds one socket and
+the workers share it. A single worker never sets SO_REUSEPORT, so starting a
+second instance on a busy port fails with EADDRINUSE instead of silently
+sharing it. `--fd` serves a single worker on an inherited socket that the
+parent already bound and put in listening state, so the parent owns the port
+choice.
+
+SIGTERM/SIGINT are forwarded to the workers, which stop accepting and drain
+in-flight requests for up to `--graceful-timeout` seconds before the supervisor
+kills any stragglers. Workers that exit unexpectedly are restarted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+APP_IMPORT = "src.server:app"
+LOOP_CHOICES = ("auto", "uvloop", "asyncio")
+HTTP_CHOICES = ("auto", "httptools", "h11")
+LOG_LEVELS = ("critical", "error", "warning", "info", "debug", "trace")
+
+REUSE_PORT_SUPPORTED = hasattr(socket, "SO_REUSEPORT")
+
+# A worker dying this soon after launch is treated as a startup failure.
+STARTUP_GRACE_SECONDS = 5.0
+
+logger = logging.getLogger("tokenparser.launcher")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
+@dataclass(frozen=True)
+class LaunchSettings:
+    """Resolved launcher configuration shared by the supervisor and workers."""
+
+    host: str = "0.0.0.0"
+    port: int = 3002
+    workers: int = 1
+    loop: str = "auto"
+    http: str = "auto"
+    backlog: int = 2048
+    keep_alive: int = 5
+    reuse_port: bool = False
+    graceful_timeout: int = 30
+    log_level: str = "info"
+    access_log: bool = True
+    fd: Optional[int] = None
+
+
+def parse_settings(argv: Optional[Sequence[str]] = None) -> LaunchSettings:
+    """Build `LaunchSettings` from environment defaults overridden by CLI flags."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.launcher", description="Run the Token Parser API."
+    )
+    parser.add_argument("--host", default=os.getenv("TOKENPARSER_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "3002")))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("TOKENPARSER_WORKERS") or os.cpu_count() or 1),
+        help="Worker processes (default: CPU count).",
+    )
+    parser.add_argument(
+        "--loop", choices=LOOP_CHOICES, default=os.getenv("TOKENPARSER_LOOP", "auto")
+    )
+    parser.add_argument(
+        "--http", choices=HTTP_CHOICES, default=os.getenv("TOKENPARSER_HTTP", "auto")
+    )
+    parser.add_argument(
+        "--backlog", type=int, default=int(os.getenv("TOKENPARSER_BACKLOG", "2048"))
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=int(os.getenv("TOKENPARSER_KEEP_ALIVE", "5")),
+        help="Seconds to hold idle keep-alive connections open.",
+    )
+    parser.add_argument(
+        "--reuse-port",
+        action=argparse.BooleanOptionalAction,
+        default=_env_bool("TOKENPARSER_REUSE_PORT", REUSE_PORT_SUPPORTED),
+        help="Bind one SO_REUSEPORT socket per worker (ignored with a single worker).",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=int(os.getenv("TOKENPARSER_GRACEFUL_TIMEOUT", "30")),
+        help="Seconds to drain in-flight requests on SIGTERM.",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=LOG_LEVELS,
+        default=os.getenv("TOKENPARSER_LOG_LEVEL", "info").lower(),
+    )
+    parser.add_argument(
+        "--access-log",
+        action=argparse.BooleanOptionalAction,
+        default=_env_bool("TOKENPARSER_ACCESS_LOG", True),
+    )
+    parser.add_argument(
+        "--fd",
+        type=int,
+        default=None,
+        help="Serve on this inherited listening socket instead of binding (one worker only).",
+    )
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.reuse_port and not REUSE_PORT_SUPPORTED:
+        parser.error("SO_REUSEPORT is not supported on this platform")
+    if args.fd is not None and args.workers != 1:
+        parser.error("--fd needs --workers 1")
+
+    return LaunchSettings(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=args.loop,
+        http=args.http,
+        backlog=args.backlog,
+        keep_alive=args.keep_alive,
+        reuse_port=args.reuse_port and args.workers > 1,
+        graceful_timeout=args.graceful_timeout,
+        log_level=args.log_level,
+        access_log=args.access_log,
+        fd=args.fd,
+    )
+
+
+def bind_socket(settings: LaunchSettings) -> socket.socket:
+    """Create the listening socket, with SO_REUSEPORT when enabled."""
+    family = socket.AF_INET6 if ":" in settings.host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if settings.reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((settings.host, settings.port))
+    sock.listen(settings.backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _uvicorn_config(settings: LaunchSettings):
+    import uvicorn
+
+    return uvicorn.Config(
+        APP_IMPORT,
+        host=settings.host,
+        port=settings.port,
+        loop=settings.loop,
+        http=settings.http,
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.keep_alive,
+        timeout_graceful_shutdown=settings.graceful_timeout,
+        log_level=settings.log_level,
+        access_log=settings.access_log,
+        reload=False,
+    )
+
+
+def serve(settings: LaunchSettings, sock: Optional[socket.socket] = None) -> None:
+    """
+    Run one uvicorn server in the current process until it is signalled.
+
+    Binds its own socket unless the supervisor handed one over. uvicorn's own
+    SIGTERM/SIGINT handlers stop accepting and drain open requests.
+    """
+    import uvicorn
+
+    sock = sock or bind_socket(settings)
+    uvicorn.Server(_uvicorn_config(settings)).run(sockets=[sock])
+
+
+class Supervisor:
+    """Starts, restarts and drains the worker processes."""
+
+    def __init__(self, settings: LaunchSettings) -> None:
+        self.settings = settings
+        self.context = multiprocessing.get_context("spawn")
+        self.shared_socket = None if settings.reuse_port else bind_socket(settings)
+        self.workers: List[multiprocessing.process.BaseProcess] = []
+        self.stopping = False
+
+    def _spawn(self) -> multiprocessing.process.BaseProcess:
+        process = self.context.Process(
+            target=serve, args=(self.settings, self.shared_socket), daemon=False
+        )
+        process.start()
+        return process
+
+    def _request_stop(self, signum, _frame) -> None:
+        if not self.stopping:
+            logger.info("Received %s; draining workers", signal.Signals(signum).name)
+        self.stopping = True
+
+    def run(self) -> int:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._request_stop)
+
+        self.workers = [self._spawn() for _ in range(self.settings.workers)]
+        logger.info(
+            "Serving on %s:%d with %d workers (reuse_port=%s)",
+            self.settings.host,
+            self.settings.port,
+            self.settings.workers,
+            self.settings.reuse_port,
+        )
+        started = time.monotonic()
+        while not self.stopping:
+            for index, process in enumerate(self.workers):
+                if process.is_alive() or self.stopping:
+                    continue
+                if time.monotonic() - started < STARTUP_GRACE_SECONDS:
+                    # Failing straight away (e.g. port in use) would only crash-loop.
+                    logger.error(
+                        "Worker %s failed to start (exit %s)", process.pid, process.exitcode
+                    )
+                    self.stopping = True
+                    self._drain()
+                    return 1
+                logger.warning(
+                    "Worker %s exited with %s; restarting", process.pid, process.exitcode
+                )
+                self.workers[index] = self._spawn()
+            time.sleep(0.5)
+        return self._drain()
+
+    def _drain(self) -> int:
+        for process in self.workers:
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.settings.graceful_timeout + 5
+        for process in self.workers:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("Worker %s did not drain in time; killing", process.pid)
+                process.kill()
+                process.join()
+        if self.shared_socket is not None:
+            self.shared_socket.close()
+        return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    settings = parse_settings(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(message)s")
+    if settings.workers == 1:
+        serve(settings, None if settings.fd is None else socket.socket(fileno=settings.fd))
+        return 0
+    return Supervisor(settings).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
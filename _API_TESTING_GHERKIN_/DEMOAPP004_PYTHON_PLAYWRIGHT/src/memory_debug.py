@@ -0,0 +1,158 @@
+"""
+Opt-in memory profiling for the DEMOAPP004 FastAPI host.
+
+With `TOKENPARSER_MEMORY_DEBUG=1` the server starts tracemalloc and a pure
+ASGI middleware records, per route template, how much traced memory each
+request left behind (net) and how far above its starting point it peaked.
+`/debug/memory` reports those per-route deltas together with the current and
+peak traced memory, the top allocation sites and the process RSS.
+
+Tracing makes every Python allocation slower, so this is a debugging mode and
+never on by default. Overlapping requests share one traced peak, so a route's
+peak is exact when requests are served one at a time and an upper bound
+otherwise. Allocations in offload pool threads are traced; those in pool
+processes are not.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from src.metrics import route_of
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+SNAPSHOT_GROUPS = ("lineno", "filename", "traceback")
+
+# Frames that belong to the profiler itself rather than the application.
+_IGNORED_FRAMES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def rss_bytes() -> Dict[str, Optional[int]]:
+    """Current and peak resident set size of this process, where the OS reports them."""
+    current = peak = None
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            current = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:  # no procfs (macOS, Windows)
+        pass
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = max_rss if sys.platform == "darwin" else max_rss * 1024  # bytes vs KiB
+    return {"current_bytes": current, "peak_bytes": peak}
+
+
+class _RouteMemory:
+    __slots__ = ("requests", "net_bytes", "peak_bytes_total", "max_peak_bytes")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.net_bytes = 0
+        self.peak_bytes_total = 0
+        self.max_peak_bytes = 0
+
+    def observe(self, net: int, peak: int) -> None:
+        self.requests += 1
+        self.net_bytes += net
+        self.peak_bytes_total += peak
+        self.max_peak_bytes = max(self.max_peak_bytes, peak)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "net_bytes": self.net_bytes,
+            "mean_peak_bytes": self.peak_bytes_total // self.requests if self.requests else 0,
+            "max_peak_bytes": self.max_peak_bytes,
+        }
+
+
+class MemoryProfiler:
+    """tracemalloc lifecycle, per-route allocation deltas and the debug report."""
+
+    def __init__(self, frames: int = 1) -> None:
+        self.frames = frames
+        self.routes: Dict[str, _RouteMemory] = defaultdict(_RouteMemory)
+        self.in_flight = 0
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def begin_request(self) -> int:
+        """Mark a request start; returns the traced memory it starts from."""
+        if self.in_flight == 0:
+            tracemalloc.reset_peak()
+        self.in_flight += 1
+        return tracemalloc.get_traced_memory()[0]
+
+    def end_request(self, route: str, started_at: int) -> None:
+        self.in_flight -= 1
+        current, peak = tracemalloc.get_traced_memory()
+        self.routes[route].observe(current - started_at, max(0, peak - started_at))
+
+    def report(self, top: int = 10, group: str = "lineno") -> Dict[str, Any]:
+        """
+        The `/debug/memory` payload.
+
+        Taking the snapshot walks every live traced block, so it costs tens of
+        milliseconds (more with `traceback` grouping and many frames).
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_FRAMES)
+        allocations: List[Dict[str, Any]] = []
+        for stat in snapshot.statistics(group)[:top]:
+            entry = {
+                "location": str(stat.traceback[-1]),  # the allocating (most recent) frame
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            if group == "traceback":
+                entry["traceback"] = stat.traceback.format()
+            allocations.append(entry)
+        return {
+            "tracemalloc": {
+                "frames": tracemalloc.get_traceback_limit(),
+                "current_bytes": current,
+                "peak_bytes": peak,
+                "overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+                "top": allocations,
+            },
+            "rss": rss_bytes(),
+            "routes": {route: stats.as_dict() for route, stats in sorted(self.routes.items())},
+        }
+
+    def reset(self) -> None:
+        """Forget the per-route deltas and restart the traced peak from now."""
+        self.routes.clear()
+        tracemalloc.reset_peak()
+
+
+class MemoryDebugMiddleware:
+    """Pure ASGI middleware feeding per-route deltas to a `MemoryProfiler`."""
+
+    def __init__(self, app, profiler: MemoryProfiler, exclude: frozenset = frozenset()) -> None:
+        self.app = app
+        self.profiler = profiler
+        self.exclude = exclude
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+        started_at = self.profiler.begin_request()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.end_request(route_of(scope), started_at)
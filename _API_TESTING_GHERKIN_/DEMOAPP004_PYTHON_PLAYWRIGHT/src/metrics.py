@@ -0,0 +1,214 @@
+"""
+Dependency-free Prometheus metrics for the DEMOAPP004 FastAPI host.
+
+Recording is plain integer arithmetic on dicts keyed by bounded labels (route
+template, method, status, error type), done on the event loop thread, so no
+locks are needed and the per-request cost is a handful of dict updates. The
+text exposition format is only built when `/metrics` is scraped.
+
+Metrics are per process: with several launcher workers each one reports its
+own counters, so scrape every worker or aggregate in Prometheus.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# Latency histogram upper bounds in seconds (Prometheus client defaults).
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+UNMATCHED_ROUTE = "unmatched"
+
+# Callable returning `{"hits", "misses", "size", "maxsize"}` for one cache.
+CacheSource = Callable[[], Mapping[str, int]]
+
+# Callable returning `{class: {"limit", "active", "queued", "shed": {reason: n}}}`.
+AdmissionSource = Callable[[], Mapping[str, Mapping[str, Any]]]
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """In-process counters, gauges and histograms rendered as Prometheus text."""
+
+    def __init__(self) -> None:
+        self.requests: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        self.latency: Dict[str, _Histogram] = defaultdict(_Histogram)
+        self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.in_flight = 0
+        self.generated_bytes = 0
+        self.cache_sources: Dict[str, CacheSource] = {}
+        self.admission_source: Optional[AdmissionSource] = None
+
+    def observe_request(self, route: str, method: str, status: int, seconds: float) -> None:
+        self.requests[(route, method, status)] += 1
+        self.latency[route].observe(seconds)
+
+    def record_error(self, route: str, error: BaseException) -> None:
+        self.errors[(route, type(error).__name__)] += 1
+
+    def add_generated_bytes(self, size: int) -> None:
+        self.generated_bytes += size
+
+    def add_cache_source(self, name: str, source: CacheSource) -> None:
+        self.cache_sources[name] = source
+
+    def set_admission_source(self, source: AdmissionSource) -> None:
+        self.admission_source = source
+
+    def render(self) -> str:
+        lines: List[str] = []
+
+        lines += [
+            "# HELP tokenparser_http_requests_total HTTP requests by route, method and status.",
+            "# TYPE tokenparser_http_requests_total counter",
+        ]
+        for (route, method, status), value in sorted(self.requests.items()):
+            labels = _labels(route=route, method=method, status=str(status))
+            lines.append(f"tokenparser_http_requests_total{labels} {value}")
+
+        lines += [
+            "# HELP tokenparser_http_request_duration_seconds Request latency by route.",
+            "# TYPE tokenparser_http_request_duration_seconds histogram",
+        ]
+        name = "tokenparser_http_request_duration_seconds"
+        for route, histogram in sorted(self.latency.items()):
+            cumulative = 0
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(route=route, le=str(bound))} {cumulative}")
+            labels = _labels(route=route)
+            lines.append(f"{name}_sum{labels} {histogram.total!r}")
+            lines.append(f"{name}_count{labels} {histogram.count}")
+
+        lines += [
+            "# HELP tokenparser_http_requests_in_flight Requests currently being served.",
+            "# TYPE tokenparser_http_requests_in_flight gauge",
+            f"tokenparser_http_requests_in_flight {self.in_flight}",
+            "# HELP tokenparser_token_errors_total Rejected tokens by route and error type.",
+            "# TYPE tokenparser_token_errors_total counter",
+        ]
+        for (route, error_type), value in sorted(self.errors.items()):
+            labels = _labels(route=route, type=error_type)
+            lines.append(f"tokenparser_token_errors_total{labels} {value}")
+
+        lines += [
+            "# HELP tokenparser_dynamic_string_generated_bytes_total Dynamic string output bytes.",
+            "# TYPE tokenparser_dynamic_string_generated_bytes_total counter",
+            f"tokenparser_dynamic_string_generated_bytes_total {self.generated_bytes}",
+        ]
+
+        caches = {name: source() for name, source in sorted(self.cache_sources.items())}
+        for metric, kind, help_text in (
+            ("hits", "counter", "Parser cache hits."),
+            ("misses", "counter", "Parser cache misses."),
+            ("size", "gauge", "Entries currently held by a parser cache."),
+        ):
+            name = f"tokenparser_cache_{metric}" + ("_total" if kind == "counter" else "")
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for cache, info in caches.items():
+                lines.append(f"{name}{_labels(cache=cache)} {info[metric]}")
+        lines += [
+            "# HELP tokenparser_cache_hit_ratio Hits / (hits + misses) since start.",
+            "# TYPE tokenparser_cache_hit_ratio gauge",
+        ]
+        for cache, info in caches.items():
+            lookups = info["hits"] + info["misses"]
+            ratio = info["hits"] / lookups if lookups else 0.0
+            lines.append(f"tokenparser_cache_hit_ratio{_labels(cache=cache)} {ratio!r}")
+
+        if self.admission_source is not None:
+            lines += self._render_admission(self.admission_source())
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_admission(classes: Mapping[str, Mapping[str, Any]]) -> List[str]:
+        lines: List[str] = []
+        for metric, help_text in (
+            ("limit", "Concurrent requests admitted per cost class."),
+            ("active", "Requests currently admitted per cost class."),
+            ("queued", "Requests waiting for admission per cost class."),
+        ):
+            name = f"tokenparser_admission_{metric}"
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            for cost_class, info in sorted(classes.items()):
+                lines.append(f"{name}{_labels(cost_class=cost_class)} {info[metric]}")
+        lines += [
+            "# HELP tokenparser_admission_shed_total Requests rejected by admission control.",
+            "# TYPE tokenparser_admission_shed_total counter",
+        ]
+        for cost_class, info in sorted(classes.items()):
+            for reason, value in sorted(info["shed"].items()):
+                labels = _labels(cost_class=cost_class, reason=reason)
+                lines.append(f"tokenparser_admission_shed_total{labels} {value}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording count, status and latency per route template.
+
+    Routes are labelled by their template (`scope["route"].path`), never the raw
+    URL, so label cardinality is bounded by the routing table.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        registry.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            registry.in_flight -= 1
+            elapsed = time.perf_counter() - started
+            registry.observe_request(route_of(scope), scope["method"], status, elapsed)
+
+
+def route_of(scope: Mapping) -> str:
+    """Route template label for a request scope."""
+    route = scope.get("route")
+    return route.path if route is not None else UNMATCHED_ROUTE
@@ -0,0 +1,82 @@
+"""
+Pre-encoded JSON responses for the parse endpoints.
+
+Endpoints build their bodies as bytes and return `FastJSONResponse`, so FastAPI
+skips `jsonable_encoder` and response validation. Bodies are byte-for-byte what
+`JSONResponse` produces (`json.dumps(..., ensure_ascii=False,
+separators=(",", ":"))`):
+
+- Short `ParsedToken` values that need no escaping (dates, single-line
+  dynamic strings: the pools contain no `"` or `\\`) are spliced into a
+  template.
+- Anything else, including the `\\r\\n` escaping of multi-line strings, goes
+  through `json_bytes`, which uses orjson when the `fast` extra is installed
+  (its output matches the stdlib for the string/int/bool payloads served
+  here) and falls back to the stdlib otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+PARSED_TOKEN_PREFIX = '{"ParsedToken":"'
+PARSED_TOKEN_SUFFIX = '"}'
+
+# Above this length orjson encodes faster than the template's printable check.
+TEMPLATE_MAX_CHARS = 1024
+
+
+def _stdlib_json_bytes(content: Any) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_bytes(content: Any) -> bytes:
+    """Encode exactly like `JSONResponse.render`, via orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(content)
+        except (TypeError, orjson.JSONEncodeError):
+            pass  # e.g. lone surrogates or non-str keys: let the stdlib decide
+    return _stdlib_json_bytes(content)
+
+
+def parsed_token_bytes(value: str) -> bytes:
+    """
+    Render `{"ParsedToken": value}` as `JSONResponse` would.
+
+    Printable ASCII without `"`/`\\` is spliced into the template directly.
+    The printable check costs a few ns per character, so with orjson installed
+    only values up to `TEMPLATE_MAX_CHARS` (dates, short strings) take that
+    route; longer ones, and anything needing escapes such as the CRLF of
+    multi-line strings, go through `json_bytes`.
+    """
+    if (
+        (orjson is None or len(value) <= TEMPLATE_MAX_CHARS)
+        and value.isascii()
+        and value.isprintable()  # on ASCII: 0x20-0x7E only, nothing to escape
+        and '"' not in value
+        and "\\" not in value
+    ):
+        return f"{PARSED_TOKEN_PREFIX}{value}{PARSED_TOKEN_SUFFIX}".encode("ascii")
+    return json_bytes({"ParsedToken": value})
+
+
+class FastJSONResponse(Response):
+    """`application/json` response whose content may already be encoded bytes."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return json_bytes(content)
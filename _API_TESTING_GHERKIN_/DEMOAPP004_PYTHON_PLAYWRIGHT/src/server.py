@@ -2,88 +2,816 @@
 FastAPI host for DEMOAPP004.
 
 Endpoints implemented according to `tokenparser_api_contract.md`.
+
+Cold start matters for scale-out, so code paths that are not needed to serve
+the first request (swagger/YAML rendering, gzip, process pools) import their
+modules on first use.
 """
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
+import json
 import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from json.encoder import encode_basestring_ascii
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import parse_qs
 
-import yaml
-from fastapi import FastAPI, Query
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi import FastAPI, Query, Request, WebSocket
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
+from starlette.requests import ClientDisconnect
 
-from tokenparser.date_parser import DateTokenError, format_date_utc, parse_date_token
+from src.admission import SHED_ERROR, AdmissionController, AdmissionMiddleware
+from src.memory_debug import SNAPSHOT_GROUPS, MemoryDebugMiddleware, MemoryProfiler
+from src.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from src.metrics import MetricsMiddleware, MetricsRegistry, route_of
+from src.responses import FastJSONResponse, json_bytes, parsed_token_bytes
+from src.ws_parse import Handler, ParseSession, error_text, reply_text
+from tokenparser.date_parser import (
+    DateTokenError,
+    date_token_cache_info,
+    expand_date_range_token,
+    format_date_utc,
+    is_relative_date_token,
+    parse_date_range_token,
+    parse_date_token,
+    seconds_until_utc_midnight,
+)
 from tokenparser.dynamic_string_parser import (
+    LINE_SEPARATOR,
     DynamicStringTokenError,
+    estimate_dynamic_string_size,
     generate_dynamic_string,
+    iter_dynamic_string_lines,
+    parallel_workers,
+    shutdown_executors,
 )
+from tokenparser.random_engine import translation_cache_info
+
+
+def _env_flag(name: str, default: str = "1") -> bool:
+    return os.getenv(name, default).strip().lower() not in ("0", "false", "no", "off")
+
+
+# Upper bound on generated dynamic string output, checked before generation (0 disables).
+MAX_OUTPUT_BYTES = int(os.getenv("TOKENPARSER_MAX_OUTPUT_BYTES", str(128 * 1024 * 1024)))
+
+# Size-aware dispatch: output below OFFLOAD_THREAD_MIN_CHARS is generated inline on
+# the event loop, below OFFLOAD_PROCESS_MIN_CHARS on a bounded thread pool, and
+# anything larger on a process pool so it cannot hold the worker's GIL.
+OFFLOAD_THREAD_MIN_CHARS = int(os.getenv("TOKENPARSER_OFFLOAD_THREAD_MIN_CHARS", str(64 * 1024)))
+OFFLOAD_PROCESS_MIN_CHARS = int(os.getenv("TOKENPARSER_OFFLOAD_PROCESS_MIN_CHARS", str(4_000_000)))
+OFFLOAD_THREADS = int(os.getenv("TOKENPARSER_OFFLOAD_THREADS", "4"))
+OFFLOAD_PROCESSES = int(os.getenv("TOKENPARSER_OFFLOAD_PROCESSES", str(os.cpu_count() or 1)))
+
+# Prometheus text metrics at /metrics; set TOKENPARSER_METRICS=0 to remove both the
+# endpoint and the recording middleware.
+METRICS_ENABLED = _env_flag("TOKENPARSER_METRICS")
+
+# Admission control: per cost class, at most CONCURRENCY requests run and QUEUE more
+# wait up to ADMISSION_QUEUE_TIMEOUT seconds; the rest get ADMISSION_STATUS with
+# Retry-After. `heavy` defaults to the offload pools' capacity. TOKENPARSER_ADMISSION=0
+# turns it off.
+ADMISSION_ENABLED = _env_flag("TOKENPARSER_ADMISSION")
+ADMISSION_LIMITS = {
+    "light": (
+        int(os.getenv("TOKENPARSER_ADMISSION_LIGHT_CONCURRENCY", "256")),
+        int(os.getenv("TOKENPARSER_ADMISSION_LIGHT_QUEUE", "1024")),
+    ),
+    "heavy": (
+        int(os.getenv("TOKENPARSER_ADMISSION_HEAVY_CONCURRENCY", "0"))
+        or OFFLOAD_THREADS + OFFLOAD_PROCESSES,
+        int(os.getenv("TOKENPARSER_ADMISSION_HEAVY_QUEUE", "0"))
+        or 2 * (OFFLOAD_THREADS + OFFLOAD_PROCESSES),
+    ),
+}
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("TOKENPARSER_ADMISSION_QUEUE_TIMEOUT", "1.0"))
+ADMISSION_RETRY_AFTER = int(os.getenv("TOKENPARSER_ADMISSION_RETRY_AFTER", "1"))
+ADMISSION_STATUS = int(os.getenv("TOKENPARSER_ADMISSION_STATUS", "503"))
+if ADMISSION_STATUS not in (429, 503):
+    raise ValueError("TOKENPARSER_ADMISSION_STATUS must be 429 or 503")
+
+# Memory debug mode (off by default): tracemalloc with this many frames per trace,
+# per-route allocation deltas and a /debug/memory report. See src/memory_debug.py.
+MEMORY_DEBUG_ENABLED = _env_flag("TOKENPARSER_MEMORY_DEBUG", "0")
+MEMORY_DEBUG_FRAMES = int(os.getenv("TOKENPARSER_MEMORY_DEBUG_FRAMES", "1"))
+MEMORY_DEBUG_ROUTE = "/debug/memory"
+
+# Probes the orchestrator relies on, and the memory report, are never queued or shed.
+ADMISSION_EXEMPT_PATHS = frozenset({"/alive", "/metrics", MEMORY_DEBUG_ROUTE})
+
+# Messages a /ws/parse connection may have in flight before it stops reading.
+WS_MAX_IN_FLIGHT = int(os.getenv("TOKENPARSER_WS_MAX_IN_FLIGHT", "64"))
+
+# Absolute date tokens never change; let caches keep them for a year.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# The schema only changes on redeploy, so clients revalidate (cheap 304s) on every use.
+ARTIFACT_CACHE_CONTROL = "public, no-cache"
+
+# Streamed responses are flushed in chunks of roughly this many bytes.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    Shut the offload pools and the parser's chunk pools down on exit (the
+    OpenAPI artefacts render on first use).
+    """
+    yield
+    for pool in (_thread_pool, _process_pool):
+        if pool.cache_info().currsize:
+            pool().shutdown(wait=True, cancel_futures=True)
+            pool.cache_clear()
+    shutdown_executors()
+
 
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     title="Token Parser API",
     version="1.0.0",
     description="Playwright+Python demo implementation of the Token Parser contract.",
 )
 
 
+metrics: Optional[MetricsRegistry] = None
+if METRICS_ENABLED:
+    metrics = MetricsRegistry()
+    metrics.add_cache_source("date_plans", lambda: date_token_cache_info()["plans"])
+    metrics.add_cache_source("date_results", lambda: date_token_cache_info()["results"])
+    metrics.add_cache_source("char_tables", translation_cache_info)
+    app.add_middleware(MetricsMiddleware, registry=metrics)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint():
+        """Prometheus text exposition of this worker's metrics."""
+        return PlainTextResponse(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+memory_profiler: Optional[MemoryProfiler] = None
+if MEMORY_DEBUG_ENABLED:
+    memory_profiler = MemoryProfiler(frames=MEMORY_DEBUG_FRAMES)
+    memory_profiler.start()
+    app.add_middleware(
+        MemoryDebugMiddleware,
+        profiler=memory_profiler,
+        exclude=frozenset({MEMORY_DEBUG_ROUTE}),
+    )
+
+    @app.get(MEMORY_DEBUG_ROUTE, include_in_schema=False)
+    async def memory_debug_endpoint(
+        top: int = Query(10, ge=1, le=200),
+        group: str = Query("lineno", pattern="^(" + "|".join(SNAPSHOT_GROUPS) + ")$"),
+        reset: bool = Query(False, description="Clear the per-route deltas after reporting."),
+    ):
+        """tracemalloc top allocations, traced/RSS peaks and per-route allocation deltas."""
+        report = memory_profiler.report(top=top, group=group)
+        if reset:
+            memory_profiler.reset()
+        return FastJSONResponse(json_bytes(report))
+
+
+def _token_error(request: Request, exc: Exception) -> FastJSONResponse:
+    """400 response for a rejected token, counted by route and error type."""
+    if metrics is not None:
+        metrics.record_error(route_of(request.scope), exc)
+    return FastJSONResponse({"Error": str(exc)}, status_code=400)
+
+
+ALIVE_BODY = json_bytes({"Status": "ALIVE-AND-KICKING"})
+
+
 @app.get("/alive")
 async def alive():
     """Lightweight health probe."""
-    return {"Status": "ALIVE-AND-KICKING"}
+    return FastJSONResponse(ALIVE_BODY)
+
+
+def _date_cache_headers(token: str, *variant: str) -> dict:
+    """
+    Build a strong ETag and Cache-Control for a date token response.
+
+    Relative tokens are keyed on the current UTC day and expire at the next UTC
+    midnight; absolute month tokens are immutable. Computed from the request
+    alone, so a matching `If-None-Match` never needs the token parsed.
+    """
+    key = [token, *variant]
+    if is_relative_date_token(token):
+        now = datetime.now(timezone.utc)
+        key.append(now.date().isoformat())
+        cache_control = f"public, max-age={seconds_until_utc_midnight(now)}"
+    else:
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    digest = hashlib.blake2b("\0".join(key).encode(), digest_size=12).hexdigest()
+    return {"ETag": f'"{digest}"', "Cache-Control": cache_control}
+
+
+def _not_modified(request: Request, headers: dict) -> Optional[Response]:
+    """Return a 304 when `If-None-Match` lists the current ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if headers["ETag"] in candidates:
+        return Response(status_code=304, headers=headers)
+    return None
 
 
 @app.get("/parse-date-token")
-async def parse_date_token_endpoint(token: str = Query(..., min_length=1)):
+async def parse_date_token_endpoint(request: Request, token: str = Query(..., min_length=1)):
     """
     Parse the supplied date token and return a UTC-normalised timestamp.
+
+    Successful responses carry an ETag plus a Cache-Control lifetime that ends
+    at the next UTC midnight (immutable for `[START-…]`/`[END-…]` tokens).
     """
+    headers = _date_cache_headers(token)
+    cached = _not_modified(request, headers)
+    if cached is not None:
+        return cached
     try:
         result = parse_date_token(token)
-        return {"ParsedToken": format_date_utc(result)}
+    except (ValueError, OverflowError) as exc:  # DateTokenError or out-of-range dates
+        return _token_error(request, exc)
+    return FastJSONResponse(parsed_token_bytes(format_date_utc(result)), headers=headers)
+
+
+@app.get("/parse-date-range-token")
+async def parse_date_range_token_endpoint(
+    request: Request,
+    token: str = Query(..., min_length=1),
+    step: Optional[str] = Query(None, description="Expand the range by DAY or MONTH."),
+):
+    """
+    Parse a `[START|END-MONTH-YYYY<->START|END-MONTH-YYYY]` range token.
+
+    Without `step` the two endpoints are returned as JSON. With `step=DAY` or
+    `step=MONTH` every date in the range is streamed as NDJSON (one JSON string
+    per line) from a generator, so multi-decade ranges never build a list.
+    Range tokens are absolute, so both forms are served as immutable.
+    """
+    headers = _date_cache_headers(token, (step or "").upper())
+    cached = _not_modified(request, headers)
+    if cached is not None:
+        return cached
+    try:
+        if step is None:
+            start, end = parse_date_range_token(token)
+            body = {"StartDate": format_date_utc(start), "EndDate": format_date_utc(end)}
+            return FastJSONResponse(json_bytes(body), headers=headers)
+        dates = expand_date_range_token(token, step)
     except DateTokenError as exc:
-        return JSONResponse(status_code=400, content={"Error": str(exc)})
+        return _token_error(request, exc)
+
+    lines = (format_date_utc(value) for value in dates)
+    return StreamingResponse(
+        _encode_line_stream(lines, "application/x-ndjson"),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
+
+
+def _streaming_media_type(request: Request, stream: bool) -> Optional[str]:
+    """
+    Pick the streaming format for a dynamic string request, if any.
+
+    `Accept: text/plain` or `Accept: application/x-ndjson` opts in (first match
+    wins, so `application/json` listed earlier keeps the JSON body);
+    `?stream=true` without either defaults to `text/plain`.
+    """
+    for part in request.headers.get("accept", "").split(","):
+        media_type = part.split(";")[0].strip().lower()
+        if media_type == "application/json":
+            break
+        if media_type in ("text/plain", "application/x-ndjson"):
+            return media_type
+    return "text/plain" if stream else None
+
+
+def _encode_line_stream(lines: Iterator[str], media_type: str) -> Iterator[bytes]:
+    """Group lines into ~STREAM_CHUNK_BYTES chunks (CRLF-joined text or NDJSON strings)."""
+    buffer: List[str] = []
+    size = 0
+    first = True
+    for line in lines:
+        if media_type == "application/x-ndjson":
+            piece = json.dumps(line) + "\n"
+        else:
+            piece = line if first else LINE_SEPARATOR + line
+            first = False
+        buffer.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK_BYTES:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+@lru_cache(maxsize=1)
+def _thread_pool() -> Executor:
+    return ThreadPoolExecutor(max_workers=OFFLOAD_THREADS, thread_name_prefix="tokenparser")
+
+
+@lru_cache(maxsize=1)
+def _process_pool() -> Executor:
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(
+        max_workers=OFFLOAD_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _offload_tier(cost: int) -> str:
+    """Map an estimated output size to `inline`, `thread` or `process`."""
+    if cost >= OFFLOAD_PROCESS_MIN_CHARS:
+        return "process"
+    if cost >= OFFLOAD_THREAD_MIN_CHARS:
+        return "thread"
+    return "inline"
+
+
+T = TypeVar("T")
+
+
+def _dynamic_string_body(
+    token: str, encode: Callable[[str], T] = parsed_token_bytes, workers: Optional[int] = None
+) -> T:
+    return encode(generate_dynamic_string(token, workers=workers))
+
+
+async def _run_in(executor: Executor, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    call = partial(func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+async def _offload_dynamic_string(token: str, size: int, encode: Callable[[str], T]) -> T:
+    """
+    Generate and `encode` a dynamic string on the tier its `size` calls for.
+
+    Strings big enough for the parser's multi-core chunk pool
+    (`TOKENPARSER_PARALLEL_MIN_CHARS`) are generated there: a thread-pool
+    thread waits on the chunks and encodes the result, so the event loop never
+    blocks. Other process-tier strings are generated single-core in an offload
+    pool process. The JSON encoding of anything off the inline tier happens on
+    the thread pool.
+    """
+    tier = _offload_tier(size)
+    if tier == "inline":
+        body = _dynamic_string_body(token, encode)
+    elif tier == "thread" or parallel_workers(token) > 1:
+        body = await _run_in(_thread_pool(), _dynamic_string_body, token, encode)
+    else:
+        text = await _run_in(_process_pool(), generate_dynamic_string, token, workers=1)
+        body = await _run_in(_thread_pool(), encode, text)
+    if metrics is not None:
+        metrics.add_generated_bytes(size)
+    return body
+
+
+async def _dispatch_dynamic_string(token: str) -> FastJSONResponse:
+    """Generate a JSON dynamic string response, offloaded by size."""
+    size = estimate_dynamic_string_size(token, MAX_OUTPUT_BYTES)
+    return FastJSONResponse(await _offload_dynamic_string(token, size, parsed_token_bytes))
+
+
+async def _count_generated(chunks: Iterator[bytes], size: int) -> AsyncIterator[bytes]:
+    """Relay a sync stream from the threadpool, counting `size` once it completes."""
+    async for chunk in iterate_in_threadpool(chunks):
+        yield chunk
+    metrics.add_generated_bytes(size)
 
 
 @app.get("/parse-dynamic-string-token")
-async def parse_dynamic_string_token_endpoint(token: str = Query(..., min_length=1)):
+async def parse_dynamic_string_token_endpoint(
+    request: Request,
+    token: str = Query(..., min_length=1),
+    stream: bool = Query(False, description="Stream the output as text/plain lines."),
+):
     """
     Generate one or more strings from the supplied dynamic string token.
+
+    Large `-LINES-` tokens can be streamed line by line via `?stream=true` or
+    `Accept: text/plain` / `application/x-ndjson`. Output larger than
+    `TOKENPARSER_MAX_OUTPUT_BYTES` is rejected before generation starts. JSON
+    responses are generated inline, on a thread pool or on a process pool
+    depending on their size, so large tokens never stall the event loop.
     """
+    media_type = _streaming_media_type(request, stream)
     try:
-        parsed = generate_dynamic_string(token)
-        return {"ParsedToken": parsed}
+        if media_type is None:
+            return await _dispatch_dynamic_string(token)
+        lines = iter_dynamic_string_lines(token, max_output_size=MAX_OUTPUT_BYTES)
     except DynamicStringTokenError as exc:
-        return JSONResponse(status_code=400, content={"Error": str(exc)})
+        return _token_error(request, exc)
+    body = _encode_line_stream(lines, media_type)
+    if metrics is not None:
+        body = _count_generated(body, estimate_dynamic_string_size(token))
+    return StreamingResponse(body, media_type=media_type)
+
 
+BATCH_ROUTE = "/parse-date-tokens"
 
-def _openapi_json():
-    """Helper to avoid recomputing the schema per request."""
-    return app.openapi()
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+
+# (token, error) pairs decoded from a batch body; error is None for usable tokens.
+BatchItem = Tuple[object, Optional[str]]
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    NDJSON stream that may keep reading the request body while it sends.
+
+    Starlette's default disconnect listener would swallow the body messages the
+    batch endpoints are still consuming, so disconnects are surfaced by
+    `request.stream()` (or a failed send) instead.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as exc:
+            raise ClientDisconnect() from exc
+        if self.background is not None:
+            await self.background()
+
+
+def _decode_ndjson_line(line: bytes) -> BatchItem:
+    text = line.decode("utf-8", errors="replace").strip()
+    try:
+        value = json.loads(text)
+    except ValueError:
+        return text, "Invalid NDJSON line"
+    if not isinstance(value, str):
+        return value, "Invalid string token format"
+    return value, None
+
+
+async def _iter_ndjson_tokens(chunks: AsyncIterator[bytes]) -> AsyncIterator[List[BatchItem]]:
+    """Yield the tokens completed by each body chunk of an NDJSON payload."""
+    pending = b""
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+        items = [_decode_ndjson_line(line) for line in lines if line.strip()]
+        if items:
+            yield items
+    if pending.strip():
+        yield [_decode_ndjson_line(pending)]
+
+
+# Values the decoder rejects while they are still only a prefix.
+_JSON_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+
+def _json_value_cut_short(error: json.JSONDecodeError, buffer: str) -> bool:
+    """
+    True when `error` only means the buffered value stops early.
+
+    That is the case when the decoder ran off the end of the buffer, or stopped
+    in an unterminated string, a partial `\\uXXXX` escape or a partial literal.
+    Any other error cannot be fixed by more bytes.
+    """
+    if error.pos >= len(buffer) or error.msg.startswith("Unterminated string"):
+        return True
+    tail = buffer[error.pos:]
+    if error.msg.startswith("Invalid \\uXXXX escape"):
+        return len(tail) <= len("uXXXX")  # a complete escape can still lack its quote
+    return any(literal.startswith(tail) for literal in _JSON_LITERALS)
+
+
+async def _iter_json_array_tokens(chunks: AsyncIterator[bytes]) -> AsyncIterator[List[BatchItem]]:
+    """
+    Incrementally decode a JSON array of tokens.
+
+    Only the unconsumed tail of the body is buffered, so arbitrarily large
+    arrays are processed in constant memory. A value is only held back for more
+    bytes while it runs to the end of the buffer; a malformed one ends the array
+    at once instead of buffering (and re-scanning) the rest of the body.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    expect = "open"  # open -> first/value -> separator -> value ... -> closed
+    malformed = False
+
+    async for chunk in chunks:
+        buffer += text_decoder.decode(chunk, final=not chunk)
+        items: List[BatchItem] = []
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos >= len(buffer) or expect == "closed":
+                break
+
+            char = buffer[pos]
+            if expect == "open":
+                if char != "[":
+                    expect, malformed = "closed", True
+                    items.append((None, "Invalid JSON array body"))
+                    break
+                pos += 1
+                expect = "first"
+            elif expect in ("first", "value"):
+                if expect == "first" and char == "]":
+                    pos += 1
+                    expect = "closed"
+                    continue
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as exc:
+                    if _json_value_cut_short(exc, buffer):
+                        break  # incomplete value; wait for more bytes
+                    expect, malformed = "closed", True
+                    items.append((None, "Invalid JSON array body"))
+                    break
+                if end == len(buffer) and chunk and not isinstance(value, str):
+                    break  # a number or literal may continue in the next chunk
+                pos = end
+                expect = "separator"
+                if isinstance(value, str):
+                    items.append((value, None))
+                else:
+                    items.append((value, "Invalid string token format"))
+            else:  # separator
+                if char == ",":
+                    pos += 1
+                    expect = "value"
+                elif char == "]":
+                    pos += 1
+                    expect = "closed"
+                else:
+                    expect, malformed = "closed", True
+                    items.append((None, "Invalid JSON array body"))
+        buffer = buffer[pos:]
+        if items:
+            yield items
+
+    if not malformed and (expect != "closed" or buffer.strip()):
+        yield [(None, "Invalid JSON array body")]
+
+
+def _iter_batch_tokens(request: Request) -> AsyncIterator[List[BatchItem]]:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_MEDIA_TYPES:
+        return _iter_ndjson_tokens(request.stream())
+    return _iter_json_array_tokens(request.stream())
+
+
+def _date_token_record(token: object, error: Optional[str]) -> str:
+    """One NDJSON record, formatted exactly like `json.dumps(record)`."""
+    if error is None:
+        try:
+            parsed = format_date_utc(parse_date_token(token))
+            return f'{{"token": {encode_basestring_ascii(token)}, "ParsedToken": "{parsed}"}}\n'
+        except (ValueError, OverflowError) as exc:  # DateTokenError or out-of-range dates
+            record = {"token": token, "Error": str(exc)}
+            if metrics is not None:
+                metrics.record_error(BATCH_ROUTE, exc)
+    else:
+        record = {"token": token, "Error": error}
+    return json.dumps(record) + "\n"
+
+
+async def _stream_date_token_records(
+    batches: AsyncIterator[List[BatchItem]],
+) -> AsyncIterator[bytes]:
+    async for items in batches:
+        yield "".join(_date_token_record(token, error) for token, error in items).encode()
+
+
+@app.post(BATCH_ROUTE)
+async def parse_date_tokens_endpoint(request: Request):
+    """
+    Parse a batch of date tokens sent as a JSON array or NDJSON body.
+
+    Results stream back as NDJSON (`{"token", "ParsedToken"|"Error"}` per line)
+    in input order; invalid tokens yield an `Error` record instead of failing
+    the batch.
+    """
+    return NDJSONStreamingResponse(_stream_date_token_records(_iter_batch_tokens(request)))
+
+
+WS_ROUTE = "/ws/parse"
+
+
+def _ws_date(message_id: Any, token: str) -> str:
+    return reply_text(message_id, format_date_utc(parse_date_token(token)))
+
+
+def _ws_date_range(message_id: Any, token: str) -> str:
+    start, end = parse_date_range_token(token)
+    return reply_text(
+        message_id, {"StartDate": format_date_utc(start), "EndDate": format_date_utc(end)}
+    )
+
+
+def _ws_dynamic_string(message_id: Any, token: str) -> Union[str, Awaitable[str]]:
+    """Inline-tier strings are answered on the spot; larger ones are offloaded."""
+    size = estimate_dynamic_string_size(token, MAX_OUTPUT_BYTES)
+    encode = partial(reply_text, message_id)
+    if _offload_tier(size) != "inline":
+        return _ws_offloaded_dynamic_string(message_id, token, size, encode)
+    reply = _dynamic_string_body(token, encode)
+    if metrics is not None:
+        metrics.add_generated_bytes(size)
+    return reply
+
+
+async def _ws_offloaded_dynamic_string(
+    message_id: Any, token: str, size: int, encode: Callable[[str], str]
+) -> str:
+    """
+    Offloaded WebSocket generation, under the same `heavy` admission limit as REST.
+
+    The per-connection in-flight limit alone would still let many connections
+    queue unbounded work on the pools.
+    """
+    if admission is None:
+        return await _offload_dynamic_string(token, size, encode)
+    limit = admission.limits["heavy"]
+    reason = await limit.acquire(admission.queue_timeout)
+    if reason is not None:
+        admission.shed[("heavy", reason)] += 1
+        return error_text(message_id, SHED_ERROR)
+    try:
+        return await _offload_dynamic_string(token, size, encode)
+    finally:
+        limit.release()
+
+
+WS_HANDLERS: Dict[str, Handler] = {
+    "date": _ws_date,
+    "date-range": _ws_date_range,
+    "dynamic-string": _ws_dynamic_string,
+}
+
+
+@app.websocket(WS_ROUTE)
+async def parse_ws_endpoint(websocket: WebSocket):
+    """
+    Parse a pipelined stream of `{"id", "kind", "token"}` messages.
+
+    `kind` is `date`, `date-range` or `dynamic-string`; each message gets one
+    `{"id", "result"}` or `{"id", "error"}` reply, in completion order. At most
+    `TOKENPARSER_WS_MAX_IN_FLIGHT` messages per connection are in flight; beyond
+    that the server stops reading until replies have been written.
+    """
+    on_error = partial(metrics.record_error, WS_ROUTE) if metrics is not None else None
+    await ParseSession(websocket, WS_HANDLERS, WS_MAX_IN_FLIGHT, on_error).run()
+
+
+class StaticArtifact:
+    """Pre-encoded response body with its gzip variant and strong ETags."""
+
+    __slots__ = ("media_type", "body", "gzip_body", "etag", "gzip_etag")
+
+    def __init__(self, body: bytes, media_type: str) -> None:
+        import gzip
+
+        self.media_type = media_type
+        self.body = body
+        self.gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+        self.etag = _strong_etag(body)
+        self.gzip_etag = _strong_etag(self.gzip_body)
+
+    def response(self, request: Request) -> Response:
+        """Serve the identity or gzip bytes, or a 304 when `If-None-Match` matches."""
+        use_gzip = _accepts_gzip(request)
+        body, etag = (self.gzip_body, self.gzip_etag) if use_gzip else (self.body, self.etag)
+        headers = {"ETag": etag, "Cache-Control": ARTIFACT_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+        cached = _not_modified(request, headers)
+        if cached is not None:
+            return cached
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+        return Response(body, media_type=self.media_type, headers=headers)
+
+
+def _strong_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+@lru_cache(maxsize=1)
+def _openapi_artifacts() -> Dict[str, StaticArtifact]:
+    """
+    Render the schema once as JSON and YAML bytes.
+
+    The JSON matches what `JSONResponse(app.openapi())` would produce byte for
+    byte; the YAML matches `yaml.safe_dump`. Rendered on the first swagger
+    request rather than at startup, so PyYAML and FastAPI's schema generation
+    stay off the cold-start path.
+    """
+    import yaml
+
+    schema = app.openapi()
+    return {
+        "json": StaticArtifact(json_bytes(schema), "application/json"),
+        "yaml": StaticArtifact(yaml.safe_dump(schema).encode("utf-8"), "application/x-yaml"),
+    }
 
 
 @app.get("/swagger/v1/json")
-async def swagger_ui_json():
+async def swagger_ui_json(request: Request):
     """Serve the Swagger UI JSON for parity with other demos."""
-    return JSONResponse(_openapi_json())
+    return _openapi_artifacts()["json"].response(request)
 
 
 @app.get("/swagger/v1/swagger.json")
-async def swagger_raw_json():
-    return JSONResponse(_openapi_json())
+async def swagger_raw_json(request: Request):
+    return _openapi_artifacts()["json"].response(request)
 
 
 @app.get("/swagger/v1/swagger.yaml")
-async def swagger_raw_yaml():
-    schema = yaml.safe_dump(_openapi_json())
-    return PlainTextResponse(schema, media_type="application/x-yaml")
+async def swagger_raw_yaml(request: Request):
+    return _openapi_artifacts()["yaml"].response(request)
 
 
-def run():
-    """Entry point when invoking `python -m src.server`."""
-    import uvicorn
+def _admission_class(scope: Mapping) -> Optional[str]:
+    """
+    Cost class of a request, from its raw path and query string.
+
+    Batch bodies, stepped range expansions and dynamic strings big enough for
+    the offload pools are `heavy`; everything else, including tokens that will
+    be rejected, is `light`. Exempt paths return None.
+    """
+    path = scope["path"]
+    if path in ADMISSION_EXEMPT_PATHS:
+        return None
+    if path == BATCH_ROUTE:
+        return "heavy"
+    if path == "/parse-date-range-token":
+        return "heavy" if "step" in parse_qs(scope["query_string"].decode("latin-1")) else "light"
+    if path == "/parse-dynamic-string-token":
+        tokens = parse_qs(scope["query_string"].decode("latin-1")).get("token")
+        try:
+            size = estimate_dynamic_string_size(tokens[-1]) if tokens else 0
+        except DynamicStringTokenError:
+            return "light"
+        return "heavy" if size >= OFFLOAD_THREAD_MIN_CHARS else "light"
+    return "light"
+
+
+admission: Optional[AdmissionController] = None
+if ADMISSION_ENABLED:
+    admission = AdmissionController(
+        ADMISSION_LIMITS,
+        queue_timeout=ADMISSION_QUEUE_TIMEOUT,
+        retry_after=ADMISSION_RETRY_AFTER,
+        status_code=ADMISSION_STATUS,
+    )
+    # Added after MetricsMiddleware, so it runs outside it: shed requests show up in
+    # tokenparser_admission_shed_total rather than in the per-route request metrics.
+    app.add_middleware(AdmissionMiddleware, controller=admission, classify=_admission_class)
+    if metrics is not None:
+        metrics.set_admission_source(admission.stats)
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point when invoking `python -m src.server`.
+
+    Prefer `python -m src.launcher`, which does not import the app in the
+    supervisor. See `src/launcher.py` for the worker, event loop, socket and
+    drain settings (CLI flags or `TOKENPARSER_*` environment variables).
+    """
+    from src.launcher import main
 
-    port = int(os.getenv("PORT", "3002"))
-    uvicorn.run("src.server:app", host="0.0.0.0", port=port, reload=False)
+    return main(argv)
 
 
 if __name__ == "__main__":
-    run()
+    raise SystemExit(run())
@@ -0,0 +1,220 @@
+"""
+Vectorised bulk evaluation of date tokens backed by NumPy `datetime64`.
+
+Tokens are compiled through `date_parser.compile_date_token` (so validation
+and error messages are shared with the scalar parser) and their adjustment
+plans are then evaluated column-wise across every token and anchor day at
+once. NumPy is an optional dependency: install the `bulk` extra to use it.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, Sequence
+
+from tokenparser.date_parser import DateTokenPlan, _utc_today, compile_date_token
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+UNIT_CODES = {"YEAR": 1, "MONTH": 2, "DAY": 3}
+
+# `datetime` only supports years 1..9999; anything outside is an error in the
+# scalar parser, so deltas are clipped well beyond that to avoid int64 overflow.
+MIN_YEAR, MAX_YEAR = 1, 9999
+DELTA_LIMIT = 10**9
+
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "parse_date_tokens_bulk requires NumPy; install with `pip install -e .[bulk]`."
+        )
+
+
+def _as_day_array(anchors: Any) -> "np.ndarray":
+    if isinstance(anchors, np.ndarray):
+        return anchors.astype("datetime64[D]").ravel()
+
+    days = []
+    for anchor in anchors:
+        if isinstance(anchor, datetime):
+            if anchor.tzinfo is not None:
+                anchor = anchor.astimezone(timezone.utc)
+            anchor = anchor.date()
+        days.append(np.datetime64(anchor, "D"))
+    return np.array(days, dtype="datetime64[D]")
+
+
+def _split_days(days: "np.ndarray") -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    months = days.astype("datetime64[M]")
+    year = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+    return year, month, day
+
+
+def _join_days(year: "np.ndarray", month: "np.ndarray", day: "np.ndarray") -> "np.ndarray":
+    months = ((year - 1970) * 12 + (month - 1)).astype("datetime64[M]")
+    return months.astype("datetime64[D]") + (day - 1)
+
+
+def _days_in_month(year: "np.ndarray", month: "np.ndarray") -> "np.ndarray":
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    return np.asarray(DAYS_IN_MONTH, dtype=np.int64)[month - 1] + ((month == 2) & leap)
+
+
+def _padded_steps(plans: Sequence[DateTokenPlan]) -> tuple["np.ndarray", "np.ndarray"]:
+    width = max((len(plan.steps) for plan in plans), default=0)
+    units = np.zeros((len(plans), width), dtype=np.int8)
+    deltas = np.zeros((len(plans), width), dtype=np.int64)
+    for row, plan in enumerate(plans):
+        for col, (unit, delta) in enumerate(plan.steps):
+            units[row, col] = UNIT_CODES[unit]
+            deltas[row, col] = max(-DELTA_LIMIT, min(DELTA_LIMIT, delta))
+    return units, deltas
+
+
+def _evaluate_relative(
+    plans: Sequence[DateTokenPlan], anchors: "np.ndarray"
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Return `(days, invalid)` matrices shaped `(len(plans), len(anchors))`."""
+    shape = (len(plans), len(anchors))
+    offsets = np.array(
+        [max(-DELTA_LIMIT, min(DELTA_LIMIT, plan.anchor_offset)) for plan in plans],
+        dtype=np.int64,
+    )
+    ordinals = anchors.astype(np.int64)[np.newaxis, :] + offsets[:, np.newaxis]
+    invalid = np.zeros(shape, dtype=bool)
+
+    # Keep out-of-range rows on a harmless date so later steps cannot overflow.
+    safe_min = np.datetime64("0001-01-01", "D").astype(np.int64)
+    safe_max = np.datetime64("9999-12-31", "D").astype(np.int64)
+    invalid |= (ordinals < safe_min) | (ordinals > safe_max)
+    ordinals = np.where(invalid, 0, ordinals)
+    year, month, day = _split_days(ordinals.astype("datetime64[D]"))
+
+    units, deltas = _padded_steps(plans)
+    for col in range(units.shape[1]):
+        unit = units[:, col][:, np.newaxis]
+        delta = np.broadcast_to(deltas[:, col][:, np.newaxis], shape)
+
+        is_year = np.broadcast_to(unit == UNIT_CODES["YEAR"], shape)
+        if is_year.any():
+            shifted = year + delta
+            # `datetime.replace` rejects Feb 29 in a non-leap target year.
+            leap = (shifted % 4 == 0) & ((shifted % 100 != 0) | (shifted % 400 == 0))
+            invalid |= is_year & (month == 2) & (day == 29) & ~leap
+            year = np.where(is_year, shifted, year)
+            invalid |= (year < MIN_YEAR) | (year > MAX_YEAR)
+
+        is_month = np.broadcast_to(unit == UNIT_CODES["MONTH"], shape)
+        if is_month.any():
+            total = year * 12 + (month - 1) + delta
+            shifted_year, shifted_month = np.divmod(total, 12)
+            shifted_month += 1
+            year = np.where(is_month, shifted_year, year)
+            month = np.where(is_month, shifted_month, month)
+            invalid |= (year < MIN_YEAR) | (year > MAX_YEAR)
+            safe_year = np.where(invalid, 1970, year)
+            day = np.where(is_month, np.minimum(day, _days_in_month(safe_year, month)), day)
+
+        is_day = np.broadcast_to(unit == UNIT_CODES["DAY"], shape)
+        if is_day.any():
+            safe_year = np.where(invalid, 1970, year)
+            shifted = _join_days(safe_year, month, day).astype(np.int64)
+            shifted += np.where(is_day, delta, 0)
+            invalid |= is_day & ((shifted < safe_min) | (shifted > safe_max))
+            shifted = np.where(invalid, 0, shifted)
+            year, month, day = (
+                np.where(is_day, part, current)
+                for part, current in zip(
+                    _split_days(shifted.astype("datetime64[D]")), (year, month, day)
+                )
+            )
+
+        year = np.where(invalid, 1970, year)
+
+    return _join_days(year, month, day), invalid
+
+
+def parse_date_tokens_bulk(
+    tokens: Iterable[str],
+    anchors: Iterable[Any] | "np.ndarray" | None = None,
+    errors: str = "raise",
+) -> "np.ndarray":
+    """
+    Evaluate many date tokens at once and return a `datetime64[D]` array.
+
+    - With `anchors=None` every token is resolved against today (UTC) and the
+      result has shape `(len(tokens),)`.
+    - Otherwise `anchors` is a sequence of dates (or a `datetime64` array)
+      standing in for "today"; the result has shape `(len(tokens), len(anchors))`.
+
+    `errors="raise"` surfaces the same `DateTokenError`/`ValueError` the scalar
+    `parse_date_token` would raise; `errors="coerce"` returns `NaT` instead.
+    """
+    _require_numpy()
+    if errors not in ("raise", "coerce"):
+        raise ValueError("errors must be 'raise' or 'coerce'")
+
+    single_anchor = anchors is None
+    anchor_days = (
+        np.array([np.datetime64(_utc_today(), "D")])
+        if single_anchor
+        else _as_day_array(anchors)
+    )
+
+    token_list = list(tokens)
+    plan_index: dict[DateTokenPlan, int] = {}
+    token_rows: dict[str, int] = {}  # -1 marks tokens that failed to compile
+    rows = np.empty(len(token_list), dtype=np.int64)
+    for position, token in enumerate(token_list):
+        row = token_rows.get(token)
+        if row is None:
+            try:
+                plan = compile_date_token(token)
+            except ValueError:
+                if errors == "raise":
+                    raise
+                row = -1
+            else:
+                row = plan_index.setdefault(plan, len(plan_index))
+            token_rows[token] = row
+        rows[position] = row
+    token_invalid = rows < 0
+
+    plans = list(plan_index)
+    result = np.full((len(plans), len(anchor_days)), np.datetime64("NaT", "D"))
+    invalid = np.zeros(result.shape, dtype=bool)
+
+    relative = [i for i, plan in enumerate(plans) if plan.is_relative]
+    if relative and len(anchor_days):
+        days, relative_invalid = _evaluate_relative([plans[i] for i in relative], anchor_days)
+        result[relative] = days
+        invalid[relative] = relative_invalid
+    for i, plan in enumerate(plans):
+        if not plan.is_relative:
+            result[i] = np.datetime64(plan.fixed.date(), "D")
+
+    if invalid.any():
+        if errors == "raise":
+            raise ValueError("date value out of range")
+        result[invalid] = np.datetime64("NaT")
+
+    if plans:
+        output = result[np.where(token_invalid, 0, rows)]
+    else:
+        output = np.full((len(token_list), len(anchor_days)), np.datetime64("NaT", "D"))
+    output[token_invalid] = np.datetime64("NaT")
+    return output[:, 0] if single_anchor else output
+
+
+def anchors_between(start: date, end: date) -> "np.ndarray":
+    """Return every day from `start` to `end` inclusive, e.g. for back-testing a year."""
+    _require_numpy()
+    return np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
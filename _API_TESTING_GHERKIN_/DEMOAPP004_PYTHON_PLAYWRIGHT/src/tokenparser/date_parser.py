@@ -7,11 +7,13 @@ format described in `tokenparser_api_contract.md`.
 
 from __future__ import annotations
 
+import os
 import re
 from calendar import monthrange
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Iterable
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, Iterator
 
 
 class DateTokenError(ValueError):
@@ -28,6 +30,8 @@ INNER_SECTION_PATTERN = re.compile(
     r"(?P<sign>[+-])(?P<adjustValue>\d+)(?P<dateUnit>YEAR|MONTH|DAY)"
 )
 
+RANGE_STEPS = ("DAY", "MONTH")
+
 MONTH_MAP = {
     "JANUARY": 1,
     "FEBRUARY": 2,
@@ -44,19 +48,47 @@ MONTH_MAP = {
 }
 
 
-def _midnight_utc(dt: datetime) -> datetime:
+ANCHOR_OFFSETS = {
+    "TODAY": 0,
+    "TOMORROW": 1,
+    "YESTERDAY": -1,
+}
+
+# Tokens starting with one of these resolve differently each UTC day.
+RELATIVE_PREFIXES = tuple(f"[{anchor}" for anchor in ANCHOR_OFFSETS)
+
+# Plan/result cache sizes; callers tend to resend the same few hundred tokens.
+PLAN_CACHE_SIZE = int(os.getenv("TOKENPARSER_DATE_PLAN_CACHE_SIZE", "1024"))
+RESULT_CACHE_SIZE = int(os.getenv("TOKENPARSER_DATE_RESULT_CACHE_SIZE", "1024"))
+
+AdjustmentStep = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class DateTokenPlan:
+    """
+    Immutable, pre-validated form of a date token.
+
+    Relative tokens keep the anchor offset (in days) plus the folded
+    `(unit, delta)` steps; absolute `START|END-MONTH-YYYY` tokens carry the
+    resolved `fixed` datetime and ignore the current day entirely.
+    """
+
+    anchor_offset: int = 0
+    steps: tuple[AdjustmentStep, ...] = ()
+    fixed: datetime | None = None
+
+    @property
+    def is_relative(self) -> bool:
+        return self.fixed is None
+
+
+def _midnight_utc(dt: date) -> datetime:
     return datetime(dt.year, dt.month, dt.day, tzinfo=timezone.utc)
 
 
-def _anchor_date(anchor: str) -> datetime:
-    today = _midnight_utc(datetime.utcnow().replace(tzinfo=timezone.utc))
-    if anchor == "TODAY":
-        return today
-    if anchor == "TOMORROW":
-        return today + timedelta(days=1)
-    if anchor == "YESTERDAY":
-        return today - timedelta(days=1)
-    raise DateTokenError("Invalid start date section")
+def _utc_today() -> date:
+    return datetime.utcnow().date()
 
 
 def _adjust_year(date: datetime, delta: int) -> datetime:
@@ -76,11 +108,8 @@ def _adjust_day(date: datetime, delta: int) -> datetime:
     return date + timedelta(days=delta)
 
 
-def _apply_adjustments(date: datetime, adjustments: Iterable[re.Match]) -> datetime:
-    for match in adjustments:
-        sign = 1 if match.group("sign") == "+" else -1
-        value = int(match.group("adjustValue")) * sign
-        unit = match.group("dateUnit")
+def _apply_adjustments(date: datetime, adjustments: Iterable[AdjustmentStep]) -> datetime:
+    for unit, value in adjustments:
         if unit == "YEAR":
             date = _adjust_year(date, value)
         elif unit == "MONTH":
@@ -92,14 +121,43 @@ def _apply_adjustments(date: datetime, adjustments: Iterable[re.Match]) -> datet
     return date
 
 
-def _parse_full_token(inner: str) -> datetime:
-    match = FULL_PATTERN.fullmatch(inner)
-    if not match:
-        raise DateTokenError("Invalid string token format")
+def _fold_adjustments(
+    anchor_offset: int, adjustments: Iterable[AdjustmentStep]
+) -> tuple[int, tuple[AdjustmentStep, ...]]:
+    """
+    Collapse adjustments without changing the evaluated date.
 
-    date = _anchor_date(match.group("anchorDate"))
-    adjustments = INNER_SECTION_PATTERN.finditer(match.group("adjustTokens"))
-    return _apply_adjustments(date, adjustments)
+    Only consecutive DAY steps are merged (month clamping and Feb 29 year
+    shifts are order-sensitive), leading DAY steps fold into the anchor
+    offset, and zero deltas are dropped.
+    """
+    steps: list[AdjustmentStep] = []
+    for unit, value in adjustments:
+        if unit == "DAY":
+            if not steps:
+                anchor_offset += value
+                continue
+            if steps[-1][0] == "DAY":
+                steps[-1] = ("DAY", steps[-1][1] + value)
+                continue
+        steps.append((unit, value))
+    return anchor_offset, tuple(step for step in steps if step[1] != 0)
+
+
+def _compile_full_token(match: re.Match) -> DateTokenPlan:
+    anchor = match.group("anchorDate")
+    if anchor not in ANCHOR_OFFSETS:
+        raise DateTokenError("Invalid start date section")
+
+    adjustments = (
+        (
+            section.group("dateUnit"),
+            int(section.group("adjustValue")) * (1 if section.group("sign") == "+" else -1),
+        )
+        for section in INNER_SECTION_PATTERN.finditer(match.group("adjustTokens"))
+    )
+    anchor_offset, steps = _fold_adjustments(ANCHOR_OFFSETS[anchor], adjustments)
+    return DateTokenPlan(anchor_offset=anchor_offset, steps=steps)
 
 
 def _parse_month_start_end(inner: str) -> datetime:
@@ -108,6 +166,10 @@ def _parse_month_start_end(inner: str) -> datetime:
         raise DateTokenError("Invalid string token format")
 
     start_end, month_str, year_str = match.groups()
+    return _month_boundary(start_end == "START", month_str, year_str)
+
+
+def _month_boundary(is_start: bool, month_str: str, year_str: str) -> datetime:
     month = MONTH_MAP.get(month_str.upper())
     if not month:
         raise DateTokenError("Invalid month token")
@@ -116,7 +178,7 @@ def _parse_month_start_end(inner: str) -> datetime:
     if year < 1:
         raise DateTokenError("Invalid year value")
 
-    if start_end == "START":
+    if is_start:
         return datetime(year, month, 1, tzinfo=timezone.utc)
 
     # END => last day of month.
@@ -124,47 +186,266 @@ def _parse_month_start_end(inner: str) -> datetime:
     return datetime(year, month, last_day, tzinfo=timezone.utc)
 
 
-def parse_date_token(token: str) -> datetime:
+def _scan_month_start_end(text: str, pos: int, end: int) -> datetime:
+    """Scan `START|END-MONTH-YYYY` occupying `text[pos:end]` in one pass."""
+    if text.startswith("START-", pos):
+        is_start, pos = True, pos + 6
+    elif text.startswith("END-", pos):
+        is_start, pos = False, pos + 4
+    else:
+        raise DateTokenError("Invalid string token format")
+
+    # MONTH is `[A-Z]+` and YYYY is exactly four decimal digits.
+    dash = end - 5
+    month_str = text[pos:dash]
+    year_str = text[dash + 1 : end]
+    if (
+        dash <= pos
+        or text[dash] != "-"
+        or not (month_str.isascii() and month_str.isalpha() and month_str.isupper())
+        or not year_str.isdecimal()
+    ):
+        raise DateTokenError("Invalid string token format")
+    return _month_boundary(is_start, month_str, year_str)
+
+
+def _scan_date_token(token: str) -> DateTokenPlan:
     """
-    Parse a Token Parser date token and return a timezone-aware UTC datetime.
+    Validate and compile a date token in a single left-to-right pass.
 
-    Raises:
-        DateTokenError: if validation fails.
+    Accepts exactly the language of `BRACKETED_TOKEN` + `FULL_PATTERN` /
+    `RANGE_PATTERN` (`isdecimal` matches what `\\d` accepts) and raises the
+    same `DateTokenError` messages as `_compile_date_token_regex`.
     """
+    end = len(token) - 1
+    if end < 1 or token[0] != "[" or token[end] != "]":
+        raise DateTokenError("Invalid string token format")
+
+    lead = token[1:3]
+    if lead == "TO":
+        if token.startswith("TODAY", 1):
+            anchor_offset, pos = 0, 6
+        elif token.startswith("TOMORROW", 1):
+            anchor_offset, pos = 1, 9
+        else:
+            raise DateTokenError("Invalid string token format")
+    elif lead == "YE" and token.startswith("YESTERDAY", 1):
+        anchor_offset, pos = -1, 10
+    else:
+        return DateTokenPlan(fixed=_scan_month_start_end(token, 1, end))
+
+    adjustments: list[AdjustmentStep] = []
+    while pos < end:
+        sign = token[pos]
+        if sign != "+" and sign != "-":
+            raise DateTokenError("Invalid string token format")
+        pos += 1
+        digits_start = pos
+        while pos < end and token[pos].isdecimal():
+            pos += 1
+        if pos == digits_start:
+            raise DateTokenError("Invalid string token format")
+        value = int(token[digits_start:pos])
+
+        if token.startswith("DAY", pos):
+            unit, pos = "DAY", pos + 3
+        elif token.startswith("MONTH", pos):
+            unit, pos = "MONTH", pos + 5
+        elif token.startswith("YEAR", pos):
+            unit, pos = "YEAR", pos + 4
+        else:
+            raise DateTokenError("Invalid string token format")
+        adjustments.append((unit, value if sign == "+" else -value))
+
+    if pos != end:
+        raise DateTokenError("Invalid string token format")
+    anchor_offset, steps = _fold_adjustments(anchor_offset, adjustments)
+    return DateTokenPlan(anchor_offset=anchor_offset, steps=steps)
+
+
+def _compile_date_token_regex(token: str) -> DateTokenPlan:
+    """Regex reference implementation of `_scan_date_token`, kept for benchmarks."""
     if not token or not BRACKETED_TOKEN.fullmatch(token):
         raise DateTokenError("Invalid string token format")
 
     inner = token[1:-1]
 
-    if FULL_PATTERN.fullmatch(inner):
-        return _parse_full_token(inner)
+    match = FULL_PATTERN.fullmatch(inner)
+    if match:
+        return _compile_full_token(match)
 
     if RANGE_PATTERN.fullmatch(inner):
-        return _parse_month_start_end(inner)
+        return DateTokenPlan(fixed=_parse_month_start_end(inner))
 
     raise DateTokenError("Invalid string token format")
 
 
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_date_token(token: str) -> DateTokenPlan:
+    """
+    Validate a date token once and return its immutable adjustment plan.
+
+    Tokens are scanned in a single pass and plans are kept in a bounded LRU,
+    so repeated tokens skip validation entirely.
+
+    Raises:
+        DateTokenError: if validation fails (errors are not cached).
+    """
+    return _scan_date_token(token)
+
+
+def evaluate_date_plan(plan: DateTokenPlan, anchor_day: date | None = None) -> datetime:
+    """Evaluate a compiled plan against `anchor_day` (defaults to today, UTC)."""
+    if plan.fixed is not None:
+        return plan.fixed
+
+    start = _midnight_utc(anchor_day or _utc_today())
+    return _apply_adjustments(start + timedelta(days=plan.anchor_offset), plan.steps)
+
+
+@lru_cache(maxsize=RESULT_CACHE_SIZE)
+def _evaluate_cached(plan: DateTokenPlan, anchor_day: date) -> datetime:
+    return evaluate_date_plan(plan, anchor_day)
+
+
+_result_cache_day: date | None = None
+
+
+def _evaluate_for_today(plan: DateTokenPlan) -> datetime:
+    """Memoise relative results per UTC day; the cache is dropped at midnight."""
+    global _result_cache_day
+
+    if plan.fixed is not None:
+        return plan.fixed
+
+    today = _utc_today()
+    if today != _result_cache_day:
+        _evaluate_cached.cache_clear()
+        _result_cache_day = today
+    return _evaluate_cached(plan, today)
+
+
+def date_token_cache_info() -> dict[str, dict[str, int]]:
+    """Return hit/miss statistics for the plan and result caches."""
+    stats = {}
+    for name, cached in (("plans", compile_date_token), ("results", _evaluate_cached)):
+        info = cached.cache_info()
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+    return stats
+
+
+def clear_date_token_caches() -> None:
+    """Drop every cached plan and evaluated result."""
+    global _result_cache_day
+
+    compile_date_token.cache_clear()
+    _evaluate_cached.cache_clear()
+    _result_cache_day = None
+
+
+def parse_date_token(token: str) -> datetime:
+    """
+    Parse a Token Parser date token and return a timezone-aware UTC datetime.
+
+    Raises:
+        DateTokenError: if validation fails.
+    """
+    return _evaluate_for_today(compile_date_token(token))
+
+
 def format_date_utc(dt: datetime) -> str:
     """Return `yyyy-MM-dd HH:mm:ssZ` formatted string."""
     iso = dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
     return f"{iso}Z"
 
 
+def is_relative_date_token(token: str) -> bool:
+    """
+    True when the token is anchored on TODAY/TOMORROW/YESTERDAY, i.e. its value
+    changes at UTC midnight. A prefix check only: the token is not validated.
+    """
+    return token.startswith(RELATIVE_PREFIXES)
+
+
+def seconds_until_utc_midnight(now: datetime | None = None) -> int:
+    """Whole seconds (at least 1) until relative date tokens roll over."""
+    now = now or datetime.now(timezone.utc)
+    midnight = _midnight_utc(now.astimezone(timezone.utc).date() + timedelta(days=1))
+    return max(1, int((midnight - now).total_seconds()))
+
+
 def parse_date_range_token(token: str) -> tuple[datetime, datetime]:
     """
     Parse a date range token in the form
     [MONTHENDSTART-MONTH-YEAR<->MONTHENDSTART-MONTH-YEAR].
     """
-    if not token or not BRACKETED_TOKEN.fullmatch(token):
+    end = len(token) - 1
+    if end < 1 or token[0] != "[" or token[end] != "]" or "\n" in token:
         raise DateTokenError("Invalid string token format")
 
-    inner = token[1:-1]
-    parts = inner.split("<->")
-    if len(parts) != 2:
+    separator = token.find("<->", 1, end)
+    if separator < 0 or token.find("<->", separator + 3, end) >= 0:
         raise DateTokenError("Invalid string token format")
 
-    start_inner, end_inner = parts
-    start = _parse_month_start_end(start_inner)
-    end = _parse_month_start_end(end_inner)
-    return start, end
+    start = _scan_month_start_end(token, 1, separator)
+    finish = _scan_month_start_end(token, separator + 3, end)
+    return start, finish
+
+
+def iter_date_range(start: datetime, end: datetime, step: str = "DAY") -> Iterator[datetime]:
+    """
+    Lazily yield every date from `start` to `end` inclusive.
+
+    `MONTH` steps are measured from `start` (so `[END-JANUARY-...]` yields the
+    last day of each month, clamped) rather than compounded, which avoids
+    drifting to the 28th after February. An `end` before `start` yields nothing.
+    Neither step looks past `end`, so ranges ending in December 9999 finish
+    cleanly.
+    """
+    if step == "DAY":
+        current = start
+        one_day = timedelta(days=1)
+        while current <= end:
+            yield current
+            if current == end:  # stepping past 9999-12-31 would overflow
+                return
+            current += one_day
+        return
+
+    if step == "MONTH":
+        month_end = start.day == monthrange(start.year, start.month)[1]
+        offset = 0
+        current = start
+        while current <= end:
+            yield current
+            if (current.year, current.month) == (end.year, end.month):
+                return  # the next step is past `end` (and may be past year 9999)
+            offset += 1
+            current = _adjust_month(start, offset)
+            if month_end:
+                # Keep month-end anchors on the last day of each month.
+                current = current.replace(day=monthrange(current.year, current.month)[1])
+        return
+
+    raise DateTokenError("Invalid range step")
+
+
+def expand_date_range_token(token: str, step: str = "DAY") -> Iterator[datetime]:
+    """
+    Validate a date range token eagerly and return a generator over its dates.
+
+    Multi-decade ranges are never materialised; see `iter_date_range`.
+
+    Raises:
+        DateTokenError: if the token or `step` is invalid.
+    """
+    step = step.upper()
+    if step not in RANGE_STEPS:
+        raise DateTokenError("Invalid range step")
+    start, end = parse_date_range_token(token)
+    return iter_date_range(start, end, step)
@@ -8,9 +8,16 @@ that engineers can follow the Screenplay tests when they call into this module.
 
 from __future__ import annotations
 
+import os
 import random
 import re
+import threading
+from collections import deque
+from concurrent.futures import Executor
 from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+from tokenparser.random_engine import CharSampler
 
 
 class DynamicStringTokenError(ValueError):
@@ -30,6 +37,17 @@ TOKEN_PATTERN = re.compile(
     re.ASCII,
 )
 
+LINE_SEPARATOR = "\r\n"
+
+# Characters sampled per round when lines are produced incrementally.
+LINE_BATCH_CHARS = 64 * 1024
+
+# Multi-core generation: requests of at least PARALLEL_MIN_CHARS are split into
+# line chunks of about PARALLEL_CHUNK_CHARS and generated on a process pool.
+PARALLEL_WORKERS = int(os.getenv("TOKENPARSER_PARALLEL_WORKERS", str(os.cpu_count() or 1)))
+PARALLEL_MIN_CHARS = int(os.getenv("TOKENPARSER_PARALLEL_MIN_CHARS", str(4_000_000)))
+PARALLEL_CHUNK_CHARS = int(os.getenv("TOKENPARSER_PARALLEL_CHUNK_CHARS", str(1_000_000)))
+
 
 @dataclass(frozen=True)
 class ParsedDynamicStringToken:
@@ -37,6 +55,15 @@ class ParsedDynamicStringToken:
     length: int | None
     lines: int
 
+    @property
+    def line_length(self) -> int:
+        return len(self.char_pool) if self.length is None else self.length
+
+    @property
+    def output_size(self) -> int:
+        """Characters (all ASCII, so also bytes) in the generated output."""
+        return self.line_length * self.lines + len(LINE_SEPARATOR) * (self.lines - 1)
+
 
 def _parse_token(token: str) -> ParsedDynamicStringToken:
     """Validate the token and extract structural information."""
@@ -76,27 +103,192 @@ def _parse_token(token: str) -> ParsedDynamicStringToken:
     return ParsedDynamicStringToken(char_pool=char_pool, length=length, lines=lines)
 
 
-def generate_dynamic_string(token: str) -> str:
+_executors: Dict[int, Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor(workers: int) -> Executor:
+    """
+    Return a lazily created process pool shared by every request.
+
+    `spawn` is used everywhere (it is the only option on Windows) so workers
+    never inherit a forked copy of a running event loop. Creation is locked:
+    the server's thread pool and streaming responses can ask concurrently.
+    """
+    executor = _executors.get(workers)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(workers)
+            if executor is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                executor = _executors[workers] = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+    return executor
+
+
+def shutdown_executors() -> None:
+    """Shut down the chunk pools (the next parallel request creates them again)."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _resolve_workers(parsed: ParsedDynamicStringToken, workers: int | None) -> int:
+    """Return the worker count to use, or 1 when the request stays single-core."""
+    workers = PARALLEL_WORKERS if workers is None else workers
+    if workers <= 1 or parsed.length is None or parsed.lines < 2:
+        return 1
+    if parsed.output_size < PARALLEL_MIN_CHARS:
+        return 1
+    return workers
+
+
+def _chunk_line_counts(parsed: ParsedDynamicStringToken, workers: int) -> List[int]:
+    per_chunk = max(1, PARALLEL_CHUNK_CHARS // parsed.line_length)
+    per_chunk = min(per_chunk, -(-parsed.lines // workers))  # at least one chunk per worker
+    counts = [per_chunk] * (parsed.lines // per_chunk)
+    if parsed.lines % per_chunk:
+        counts.append(parsed.lines % per_chunk)
+    return counts
+
+
+def _generate_chunk(pool: str, width: int, lines: int, mode: str | None, seed: int | None) -> str:
+    """Process-pool worker: generate `lines` CRLF-joined lines with its own RNG stream."""
+    chars = CharSampler(pool, mode, seed).sample(width * lines)
+    return LINE_SEPARATOR.join(
+        chars[start : start + width] for start in range(0, len(chars), width)
+    )
+
+
+def _iter_parallel_chunks(
+    parsed: ParsedDynamicStringToken, mode: str | None, seed: int | None, workers: int
+) -> Iterator[str]:
+    """
+    Yield CRLF-joined line chunks in order while keeping at most `2 * workers`
+    chunks in flight, so streamed output stays memory-bounded.
+
+    Each chunk gets an independent RNG stream: `crypto` reads `os.urandom` in
+    its own process, and `fast` chunks are seeded from `seed` (when given) so
+    parallel runs stay reproducible, though not identical to serial ones.
+    """
+    seeds = random.Random(seed) if seed is not None else None
+    executor = _executor(workers)
+    pending: deque = deque()
+    for count in _chunk_line_counts(parsed, workers):
+        chunk_seed = seeds.getrandbits(64) if seeds is not None else None
+        pending.append(
+            executor.submit(
+                _generate_chunk, parsed.char_pool, parsed.length, count, mode, chunk_seed
+            )
+        )
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _check_output_size(parsed: ParsedDynamicStringToken, max_output_size: int | None) -> None:
+    if max_output_size and parsed.output_size > max_output_size:
+        raise DynamicStringTokenError(
+            f"Requested output exceeds the maximum size of {max_output_size} bytes"
+        )
+
+
+def _generate_lines(
+    parsed: ParsedDynamicStringToken, mode: str | None, seed: int | None, workers: int
+) -> Iterator[str]:
+    if parsed.length is None:  # ALL
+        for _ in range(parsed.lines):
+            yield parsed.char_pool
+        return
+
+    if workers > 1:
+        for chunk in _iter_parallel_chunks(parsed, mode, seed, workers):
+            yield from chunk.split(LINE_SEPARATOR)
+        return
+
+    width = parsed.length
+    sampler = CharSampler(parsed.char_pool, mode, seed)
+    batch_lines = max(1, LINE_BATCH_CHARS // width)
+    remaining = parsed.lines
+    while remaining > 0:
+        count = min(batch_lines, remaining)
+        chars = sampler.sample(width * count)
+        for start in range(0, len(chars), width):
+            yield chars[start : start + width]
+        remaining -= count
+
+
+def estimate_dynamic_string_size(token: str, max_output_size: int | None = None) -> int:
+    """
+    Validate the token and return the size of its output (length x lines plus
+    separators) without generating anything. Raises like `generate_dynamic_string`.
+    """
+    parsed = _parse_token(token)
+    _check_output_size(parsed, max_output_size)
+    return parsed.output_size
+
+
+def parallel_workers(token: str, workers: int | None = None) -> int:
+    """
+    Number of chunk-pool processes `generate_dynamic_string(token, workers=...)`
+    would use (1 means it generates single-core in the calling process).
+    """
+    return _resolve_workers(_parse_token(token), workers)
+
+
+def iter_dynamic_string_lines(
+    token: str,
+    mode: str | None = None,
+    seed: int | None = None,
+    max_output_size: int | None = None,
+    workers: int | None = None,
+) -> Iterator[str]:
+    """
+    Validate the token eagerly, then return a generator of output lines.
+
+    Lines are sampled in batches of roughly `LINE_BATCH_CHARS` (or in ordered
+    process-pool chunks for large requests), so memory stays bounded however
+    many `-LINES-` are requested. Raises `DynamicStringTokenError` before
+    anything is generated when the token is invalid or its output would exceed
+    `max_output_size` bytes.
+    """
+    parsed = _parse_token(token)
+    _check_output_size(parsed, max_output_size)
+    return _generate_lines(parsed, mode, seed, _resolve_workers(parsed, workers))
+
+
+def generate_dynamic_string(
+    token: str,
+    mode: str | None = None,
+    seed: int | None = None,
+    max_output_size: int | None = None,
+    workers: int | None = None,
+) -> str:
     """
     Generate one or more lines of characters based on the supplied token.
 
-    - When `length` is numeric, characters are sampled randomly from the pool.
+    - When `length` is numeric, characters are sampled randomly from the pool
+      in bulk via `random_engine.CharSampler` (`mode` defaults to `crypto`, or
+      `TOKENPARSER_RANDOM_MODE`; `seed` only applies to the `fast` mode).
+    - Requests of at least `TOKENPARSER_PARALLEL_MIN_CHARS` are split into line
+      chunks generated on a process pool (`workers` overrides
+      `TOKENPARSER_PARALLEL_WORKERS`; `1` forces single-core generation).
     - When `length` equals `ALL`, the entire pool is emitted once per line.
     - Lines are separated using Windows-style CRLF (`\\r\\n`) to mirror the
       existing TypeScript implementation and the contract.
     """
     parsed = _parse_token(token)
-    rng = random.SystemRandom()  # crypto-strong randomness for stability
-    lines = []
-
-    for _ in range(parsed.lines):
-        if parsed.length is None:  # ALL
-            lines.append(parsed.char_pool)
-        else:
-            chars = "".join(
-                parsed.char_pool[rng.randrange(len(parsed.char_pool))]
-                for _ in range(parsed.length)
-            )
-            lines.append(chars)
+    _check_output_size(parsed, max_output_size)
+    if parsed.length is None:  # ALL
+        return LINE_SEPARATOR.join([parsed.char_pool] * parsed.lines)
 
-    return "\r\n".join(lines)
+    resolved_workers = _resolve_workers(parsed, workers)
+    if resolved_workers > 1:
+        return LINE_SEPARATOR.join(_iter_parallel_chunks(parsed, mode, seed, resolved_workers))
+    return _generate_chunk(parsed.char_pool, parsed.length, parsed.lines, mode, seed)
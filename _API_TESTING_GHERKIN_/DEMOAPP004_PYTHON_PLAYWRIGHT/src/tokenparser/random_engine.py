@@ -0,0 +1,103 @@
+"""
+Bulk character sampling for the dynamic string parser.
+
+Instead of one `SystemRandom.randrange` call per character, random bytes are
+drawn in large blocks and mapped onto the character pool with a single
+`bytes.translate` call. Bytes at or above the largest multiple of the pool
+size are deleted (rejection sampling), so every pool position stays equally
+likely with no modulo bias.
+
+Modes:
+- `crypto` (default): bytes from `os.urandom`.
+- `fast`: bytes from a Mersenne Twister `random.Random`; NOT suitable for
+  secrets, intended for load tests and fixture generation.
+- `legacy`: the original per-character `SystemRandom` loop, kept as a
+  reference point for benchmarks and for pools larger than 256 characters.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from functools import lru_cache
+from typing import Callable, Iterator
+
+RANDOM_MODES = ("crypto", "fast", "legacy")
+DEFAULT_RANDOM_MODE = os.getenv("TOKENPARSER_RANDOM_MODE", "crypto")
+
+# Upper bound for a single draw from the byte source.
+MAX_BLOCK_BYTES = 1 << 20
+
+ByteSource = Callable[[int], bytes]
+
+
+def resolve_mode(mode: str | None) -> str:
+    """Return a validated random mode, falling back to `TOKENPARSER_RANDOM_MODE`."""
+    resolved = (mode or DEFAULT_RANDOM_MODE).lower()
+    if resolved not in RANDOM_MODES:
+        raise ValueError(f"Unknown random mode '{resolved}'; expected one of {RANDOM_MODES}")
+    return resolved
+
+
+@lru_cache(maxsize=64)
+def _translation(pool: str) -> tuple[bytes, bytes, float]:
+    """Return `(table, rejected_bytes, acceptance_ratio)` for an ASCII pool."""
+    size = len(pool)
+    limit = 256 - (256 % size)
+    encoded = pool.encode("ascii")
+    table = bytes(encoded[value % size] if value < limit else 0 for value in range(256))
+    rejected = bytes(range(limit, 256))
+    return table, rejected, limit / 256
+
+
+def translation_cache_info() -> dict[str, int]:
+    """Return hit/miss statistics for the per-pool translation table cache."""
+    info = _translation.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+
+def supports_bulk(pool: str) -> bool:
+    """Bulk sampling needs a non-empty ASCII pool of at most 256 entries."""
+    return 0 < len(pool) <= 256 and pool.isascii()
+
+
+class CharSampler:
+    """Draws uniformly distributed characters from a fixed pool."""
+
+    def __init__(self, pool: str, mode: str | None = None, seed: int | None = None) -> None:
+        self.pool = pool
+        self.mode = resolve_mode(mode)
+        if self.mode != "legacy" and not supports_bulk(pool):
+            self.mode = "legacy"
+
+        if self.mode == "legacy":
+            self._rng = random.SystemRandom()
+        elif self.mode == "fast":
+            self._source: ByteSource = random.Random(seed).randbytes
+        else:
+            self._source = os.urandom
+
+    def sample(self, count: int) -> str:
+        """Return `count` characters sampled from the pool."""
+        if count <= 0:
+            return ""
+        if self.mode == "legacy":
+            pool, randrange = self.pool, self._rng.randrange
+            size = len(pool)
+            return "".join(pool[randrange(size)] for _ in range(count))
+        return "".join(self._bulk_chunks(count))
+
+    def _bulk_chunks(self, count: int) -> Iterator[str]:
+        table, rejected, acceptance = _translation(self.pool)
+        remaining = count
+        while remaining > 0:
+            # Over-draw slightly so one round usually suffices.
+            block = min(MAX_BLOCK_BYTES, int(remaining / acceptance) + 64)
+            chunk = self._source(block).translate(table, rejected)[:remaining]
+            remaining -= len(chunk)
+            yield chunk.decode("ascii")
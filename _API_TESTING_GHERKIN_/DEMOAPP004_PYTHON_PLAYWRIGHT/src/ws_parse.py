@@ -0,0 +1,152 @@
+"""
+Pipelined token parsing over a WebSocket (`/ws/parse`).
+
+Every text frame from the client is one JSON object `{"id", "kind", "token"}`
+and is answered by one text frame, `{"id", "result"}` or `{"id", "error"}`.
+Clients may send as many messages as they like without waiting; replies go out
+as soon as they are ready, so a cheap token can overtake a large dynamic
+string sent before it and clients match replies by `id`.
+
+Flow control is a per-connection limit on in-flight messages (received but
+whose reply has not been written yet). At the limit the session stops reading
+the socket, so a client that outpaces the server, or stops reading its
+replies, is pushed back on by TCP instead of growing a backlog on the server.
+
+Like `src.admission`, all state lives on the event loop thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+from typing import Any, Awaitable, Callable, Mapping, Optional, Set, Union
+
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from src.responses import json_bytes
+
+logger = logging.getLogger("tokenparser.ws_parse")
+
+# A handler takes `(id, token)` and returns the encoded reply (see `reply_text`),
+# directly for cheap kinds or as an awaitable for work that is offloaded. Errors
+# meant for the client are raised as ValueError (the parsers' token errors).
+Handler = Callable[[Any, str], Union[str, Awaitable[str]]]
+ErrorHook = Callable[[BaseException], None]
+
+INTERNAL_ERROR = "Internal server error"
+
+
+def reply_text(message_id: Any, result: Any) -> str:
+    return json_bytes({"id": message_id, "result": result}).decode("utf-8")
+
+
+def error_text(message_id: Any, error: str) -> str:
+    return json_bytes({"id": message_id, "error": error}).decode("utf-8")
+
+
+class ParseSession:
+    """One `/ws/parse` connection: a reader that dispatches and a writer that replies."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        handlers: Mapping[str, Handler],
+        max_in_flight: int,
+        on_error: Optional[ErrorHook] = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self.websocket = websocket
+        self.handlers = handlers
+        self.on_error = on_error
+        self.slots = asyncio.Semaphore(max_in_flight)
+        self.replies: asyncio.Queue[str] = asyncio.Queue()
+        self.pending: Set[asyncio.Task] = set()
+        self.kinds = ", ".join(handlers)
+
+    async def run(self) -> None:
+        """Serve until the client disconnects; pending work is cancelled then."""
+        await self.websocket.accept()
+        reader = asyncio.create_task(self._read())
+        writer = asyncio.create_task(self._write())
+        try:
+            done, _ = await asyncio.wait({reader, writer}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            tasks = [reader, writer, *self.pending]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                raise error
+
+    async def _read(self) -> None:
+        receive = self.websocket.receive
+        while True:
+            await self.slots.acquire()
+            message = await receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            text = message.get("text")
+            if text is None:
+                text = (message.get("bytes") or b"").decode("utf-8", "replace")
+            self._dispatch(text)
+
+    async def _write(self) -> None:
+        send_text = self.websocket.send_text
+        while True:
+            reply = await self.replies.get()
+            await send_text(reply)
+            self.slots.release()
+
+    def _dispatch(self, text: str) -> None:
+        try:
+            message = json.loads(text)
+        except ValueError:
+            self.replies.put_nowait(error_text(None, "Message is not valid JSON"))
+            return
+        if not isinstance(message, dict):
+            self.replies.put_nowait(error_text(None, "Message must be a JSON object"))
+            return
+
+        message_id = message.get("id")
+        kind = message.get("kind")
+        token = message.get("token")
+        handler = self.handlers.get(kind) if isinstance(kind, str) else None
+        if handler is None:
+            error = f"Unknown kind {kind!r}, expected one of: {self.kinds}"
+            self.replies.put_nowait(error_text(message_id, error))
+            return
+        if not isinstance(token, str) or not token:
+            self.replies.put_nowait(error_text(message_id, "token must be a non-empty string"))
+            return
+
+        try:
+            reply = handler(message_id, token)
+        except (ValueError, OverflowError) as exc:  # token errors or out-of-range dates
+            self.replies.put_nowait(self._error_reply(message_id, exc))
+            return
+        if inspect.isawaitable(reply):
+            task = asyncio.ensure_future(self._complete(message_id, reply))
+            self.pending.add(task)
+            task.add_done_callback(self.pending.discard)
+        else:
+            self.replies.put_nowait(reply)
+
+    async def _complete(self, message_id: Any, reply: Awaitable[str]) -> None:
+        try:
+            text = await reply
+        except (ValueError, OverflowError) as exc:
+            text = self._error_reply(message_id, exc)
+        except Exception:
+            logger.exception("ws/parse handler failed for message id %r", message_id)
+            text = error_text(message_id, INTERNAL_ERROR)
+        self.replies.put_nowait(text)
+
+    def _error_reply(self, message_id: Any, exc: BaseException) -> str:
+        if self.on_error is not None:
+            self.on_error(exc)
+        return error_text(message_id, str(exc))
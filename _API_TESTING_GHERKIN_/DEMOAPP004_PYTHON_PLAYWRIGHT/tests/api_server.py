@@ -0,0 +1,146 @@
+"""Self-managed `src.launcher` server for test sessions that are not given `API_BASE_URL`."""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+class ServerStartupError(RuntimeError):
+    pass
+
+
+def free_port() -> int:
+    """Return a currently unused localhost TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ApiServer:
+    """
+    `python -m src.launcher` on 127.0.0.1 and an ephemeral port.
+
+    On POSIX the listening socket is bound here, on port 0, and handed to the
+    server with `--fd`. The kernel picks the port, so two sessions can never
+    get the same one, and `/alive` can only be answered by this server. Elsewhere
+    the port is picked first and bound by the server, so another process can take
+    it in between. The server runs without SO_REUSEPORT, so it then fails to bind
+    and `start()` retries on a fresh port. `start()` polls `/alive` with
+    exponential backoff until the server answers. `stop()` sends SIGTERM, which
+    the launcher forwards to its workers, and kills the process if it outlives
+    `stop_timeout`.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        log_path: Optional[Path] = None,
+        startup_timeout: float = 30.0,
+        stop_timeout: float = 15.0,
+        attempts: int = 3,
+    ) -> None:
+        self.workers = workers
+        self.log_path = log_path
+        self.startup_timeout = startup_timeout
+        self.stop_timeout = stop_timeout
+        self.attempts = attempts
+        self.port: Optional[int] = None
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "ApiServer":
+        for attempt in range(1, self.attempts + 1):
+            self.process = self._spawn()
+            try:
+                self.wait_until_alive()
+                return self
+            except ServerStartupError:
+                self.stop()
+                if attempt == self.attempts:
+                    raise
+        return self
+
+    def _spawn(self) -> subprocess.Popen:
+        environ = dict(os.environ)
+        environ["PYTHONPATH"] = os.pathsep.join([str(PROJECT_ROOT / "src"), str(PROJECT_ROOT)])
+        command = [
+            sys.executable, "-m", "src.launcher", "--workers", str(self.workers),
+            # Without SO_REUSEPORT a port clash fails the bind, so start() can retry.
+            "--no-reuse-port", "--no-access-log", "--log-level", "warning",
+        ]
+        listener = None
+        if os.name == "posix" and self.workers == 1:
+            listener = socket.socket()
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(2048)
+            self.port = listener.getsockname()[1]
+            command += ["--fd", str(listener.fileno())]
+        else:
+            self.port = free_port()
+            command += ["--host", "127.0.0.1", "--port", str(self.port)]
+        log = open(self.log_path, "ab") if self.log_path else subprocess.DEVNULL
+        try:
+            return subprocess.Popen(
+                command,
+                cwd=PROJECT_ROOT,
+                env=environ,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                pass_fds=() if listener is None else (listener.fileno(),),
+            )
+        finally:
+            if self.log_path:
+                log.close()  # the child keeps its own handle
+            if listener is not None:
+                listener.close()  # likewise
+
+    def wait_until_alive(self) -> None:
+        """Poll `/alive` (50 ms, doubling to 1 s between tries) until it answers 200."""
+        deadline = time.monotonic() + self.startup_timeout
+        delay = 0.05
+        while True:
+            if self.process.poll() is not None:
+                raise ServerStartupError(
+                    f"src.launcher exited with {self.process.returncode} during startup"
+                    + self._log_hint()
+                )
+            try:
+                with urllib.request.urlopen(f"{self.base_url}/alive", timeout=2) as response:
+                    if response.status == 200:
+                        return
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                pass
+            if time.monotonic() + delay > deadline:
+                raise ServerStartupError(
+                    f"src.launcher at {self.base_url} was not alive after "
+                    f"{self.startup_timeout:.0f}s" + self._log_hint()
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+    def stop(self) -> None:
+        if self.process is None or self.process.poll() is not None:
+            return
+        self.process.send_signal(signal.SIGTERM)
+        try:
+            self.process.wait(timeout=self.stop_timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+    def _log_hint(self) -> str:
+        return f" (see {self.log_path})" if self.log_path else ""
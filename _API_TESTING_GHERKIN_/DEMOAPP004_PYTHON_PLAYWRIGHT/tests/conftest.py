@@ -3,19 +3,135 @@
 from __future__ import annotations
 
 import os
-from typing import Dict
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
 
 import pytest
+from playwright.async_api import APIRequestContext as AsyncAPIRequestContext
+from playwright.async_api import async_playwright
 from playwright.sync_api import APIRequestContext, Playwright, sync_playwright
 
 from screenplay.abilities.call_an_api import CallAnApi
+from screenplay.abilities.call_an_api_async import CallAnApiAsync
+from screenplay.abilities.call_an_asgi_app import CallAnAsgiApp
+from screenplay.abilities.call_an_asgi_app_async import CallAnAsgiAppAsync
 from screenplay.abilities.use_token_parsers import UseTokenParsers
+from screenplay.abilities.use_websockets import UseWebSockets
 from screenplay.actors.actor import Actor
+from screenplay.actors.async_actor import AsyncActor
+from screenplay.support import latency_trace
+from screenplay.support.asgi_transport import AsgiRequestContext, AsyncAsgiRequestContext
+from screenplay.support.async_runner import AsyncRunner
+from screenplay.support.latency_trace import LatencyTrace
+from tests.api_server import ApiServer
+
+TRANSPORTS = ("network", "asgi")
+API_SERVER_MODES = ("per-worker", "shared")
+
+
+def _api_transport() -> str:
+    transport = os.getenv("API_TRANSPORT", "network").strip().lower()
+    if transport not in TRANSPORTS:
+        raise pytest.UsageError(f"API_TRANSPORT must be one of {TRANSPORTS}, got {transport!r}")
+    return transport
+
+
+def _api_server_mode() -> str:
+    mode = os.getenv("API_SERVER_MODE", "per-worker").strip().lower()
+    if mode not in API_SERVER_MODES:
+        raise pytest.UsageError(f"API_SERVER_MODE must be one of {API_SERVER_MODES}, got {mode!r}")
+    return mode
+
+
+class _SharedApiServer:
+    """
+    xdist controller plugin for `API_SERVER_MODE=shared`: starts one server when
+    the first worker is configured and hands its URL to every worker.
+    """
+
+    def __init__(self) -> None:
+        self.server: Optional[ApiServer] = None
+
+    def pytest_configure_node(self, node) -> None:
+        if self.server is None:
+            log_path = Path(tempfile.mkdtemp(prefix="api-server-")) / "server.log"
+            self.server = ApiServer(workers=os.cpu_count() or 1, log_path=log_path).start()
+        node.workerinput["api_base_url"] = self.server.base_url
+
+    def pytest_unconfigure(self, config) -> None:
+        if self.server is not None:
+            self.server.stop()
+
+
+def pytest_configure(config):
+    shared = (
+        getattr(config.option, "numprocesses", None)
+        and not hasattr(config, "workerinput")  # the xdist controller only
+        and not os.getenv("API_BASE_URL")
+        and _api_transport() == "network"
+        and _api_server_mode() == "shared"
+    )
+    if shared and not config.pluginmanager.has_plugin("shared-api-server"):
+        config.pluginmanager.register(_SharedApiServer(), "shared-api-server")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    In-process runs have no server to open sockets to: skip `@network` scenarios.
+    `@perf` scenarios move megabytes per request, so they only run with `API_RUN_PERF=1`.
+    """
+    skips = {}
+    if _api_transport() == "asgi":
+        skips["network"] = pytest.mark.skip(reason="needs a running server (API_TRANSPORT=asgi)")
+    if os.getenv("API_RUN_PERF", "").strip().lower() not in ("1", "true", "yes", "on"):
+        skips["perf"] = pytest.mark.skip(reason="large-payload scenario (set API_RUN_PERF=1)")
+    if not skips:
+        return
+    for item in items:
+        for marker, skip in skips.items():
+            if item.get_closest_marker(marker):
+                item.add_marker(skip)
 
 
 @pytest.fixture(scope="session")
-def api_base_url() -> str:
-    return os.getenv("API_BASE_URL", "http://localhost:3002")
+def api_transport() -> str:
+    """
+    `network` (default) calls the server at `api_base_url` through Playwright;
+    `asgi` dispatches in-process into `src.server.app`. Set `API_TRANSPORT`, or
+    override this fixture.
+    """
+    return _api_transport()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def latency_trace_file() -> Optional[LatencyTrace]:
+    """With `API_TRACE_PATH` set, the HTTP tasks append one JSONL record per request there."""
+    path = os.getenv("API_TRACE_PATH")
+    if not path:
+        yield None
+        return
+    trace = LatencyTrace(path)
+    latency_trace.install(trace)
+    yield trace
+    latency_trace.install(None)
+    trace.close()
+
+
+@pytest.fixture(scope="session")
+def api_base_url(request, tmp_path_factory) -> str:
+    """
+    `API_BASE_URL` when set. Otherwise the URL of a server this session owns:
+    the shared one from the xdist controller (`API_SERVER_MODE=shared`), or one
+    started here on a free port, per xdist worker (the default).
+    """
+    supplied = os.getenv("API_BASE_URL")
+    supplied = supplied or getattr(request.config, "workerinput", {}).get("api_base_url")
+    if supplied:
+        return supplied
+    server = ApiServer(log_path=tmp_path_factory.mktemp("api-server") / "server.log")
+    request.addfinalizer(server.stop)
+    return server.start().base_url
 
 
 @pytest.fixture(scope="session")
@@ -34,14 +150,77 @@ def playwright_api_context(
     context.dispose()
 
 
+@pytest.fixture(scope="session")
+def async_runner() -> AsyncRunner:
+    runner = AsyncRunner()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def async_playwright_api_context(
+    async_runner: AsyncRunner, api_base_url: str
+) -> AsyncAPIRequestContext:
+    """One async request context for the session, bound to `async_runner`'s loop."""
+
+    async def start():
+        playwright = await async_playwright().start()
+        return playwright, await playwright.request.new_context(base_url=api_base_url)
+
+    playwright, context = async_runner.run(start())
+    yield context
+    async_runner.run(context.dispose())
+    async_runner.run(playwright.stop())
+
+
+@pytest.fixture(scope="session")
+def asgi_app():
+    from src.server import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def asgi_request_context(asgi_app, async_runner: AsyncRunner) -> AsgiRequestContext:
+    """Sync in-process request context; the app's lifespan spans the session."""
+    context = AsgiRequestContext(asgi_app, async_runner)
+    context.start()
+    yield context
+    context.dispose()
+
+
+@pytest.fixture(scope="session")
+def async_asgi_request_context(
+    asgi_request_context: AsgiRequestContext,
+) -> AsyncAsgiRequestContext:
+    """The async side of `asgi_request_context`, on `async_runner`'s loop."""
+    return asgi_request_context.inner
+
+
 @pytest.fixture
 def scenario_context() -> Dict[str, str]:
     return {}
 
 
 @pytest.fixture
-def actor(playwright_api_context: APIRequestContext) -> Actor:
+def actor(request, api_transport: str) -> Actor:
     actor = Actor("Python API Tester")
-    actor.can(CallAnApi(playwright_api_context))
+    if api_transport == "asgi":
+        actor.can(CallAnAsgiApp(request.getfixturevalue("asgi_request_context")))
+    else:
+        actor.can(CallAnApi(request.getfixturevalue("playwright_api_context")))
+        actor.can(UseWebSockets(request.getfixturevalue("api_base_url")))
+    actor.can(UseTokenParsers())
+    return actor
+
+
+@pytest.fixture
+def async_actor(request, api_transport: str) -> AsyncActor:
+    """Async counterpart of `actor`; drive it from steps through `async_runner.run`."""
+    actor = AsyncActor("Python Async API Tester")
+    if api_transport == "asgi":
+        actor.can(CallAnAsgiAppAsync(request.getfixturevalue("async_asgi_request_context")))
+    else:
+        actor.can(CallAnApiAsync(request.getfixturevalue("async_playwright_api_context")))
     actor.can(UseTokenParsers())
     return actor
@@ -0,0 +1,392 @@
+"""Asyncio load generator for the Token Parser API with a JSON latency report."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import ssl
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote, urlsplit
+
+from summary_renderer import percentile
+
+FEATURE_DIR = Path(__file__).resolve().parents[1] / "features" / "api"
+
+ENDPOINTS = {
+    "alive": "/alive",
+    "date": "/parse-date-token",
+    "dynamic": "/parse-dynamic-string-token",
+}
+
+# Feature files whose Examples tables supply tokens for each endpoint.
+FEATURE_TOKEN_SOURCES = {
+    "date": "parse_date_token.feature",
+    "dynamic": "parse_dynamic_string_token.feature",
+}
+
+DYNAMIC_SIZE_PATTERN = re.compile(r"-(\d+)(?:-LINES-(\d+))?\]$")
+
+PERCENTILES = (("p50_ms", 0.50), ("p90_ms", 0.90), ("p99_ms", 0.99))
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Statuses that never carry a body, whatever the headers say.
+BODILESS_STATUSES = frozenset({204, 304})
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    status: int
+    seconds: float
+
+
+class HttpConnection:
+    """
+    Minimal keep-alive HTTP/1.1 client connection (GET only, stdlib asyncio).
+
+    A body is read by `Content-Length` or chunked framing. 1xx, 204 and 304
+    responses have none, and neither does any other unframed response unless
+    the server announces `Connection: close`, in which case it runs to EOF.
+    """
+
+    def __init__(self, host: str, port: int, tls: Optional[ssl.SSLContext] = None) -> None:
+        self.host = host
+        self.port = port
+        self.tls = tls
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def get(self, target: str) -> int:
+        if self.writer is None or self.writer.is_closing():
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.tls
+            )
+        self.writer.write(f"GET {target} HTTP/1.1\r\nHost: {self.host}\r\n\r\n".encode("latin-1"))
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("server closed the connection")
+        status = int(status_line.split()[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        closing = headers.get("connection", "").lower() == "close"
+        if status in BODILESS_STATUSES or status < 200:
+            pass
+        elif "content-length" in headers:
+            await self.reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif closing:
+            await self.reader.read()
+        if closing:
+            self.close()
+        return status
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def _dynamic_output_size(token: str) -> int:
+    match = DYNAMIC_SIZE_PATTERN.search(token)
+    if not match:
+        return 0
+    return int(match.group(1)) * int(match.group(2) or 1)
+
+
+def _feature_tokens(name: str, max_dynamic_chars: int) -> List[str]:
+    """Successful tokens from the `token` column of a feature's Examples tables."""
+    tokens: List[str] = []
+    columns: Optional[List[str]] = None
+    feature = FEATURE_DIR / FEATURE_TOKEN_SOURCES[name]
+    for line in feature.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line.startswith("|"):
+            columns = None
+            continue
+        cells = [cell.strip() for cell in line.strip("|").split("|")]
+        if columns is None:
+            columns = cells
+            continue
+        row = dict(zip(columns, cells))
+        if "token" not in row or row.get("status", "200") != "200":
+            continue
+        if name == "dynamic" and _dynamic_output_size(row["token"]) > max_dynamic_chars:
+            continue
+        tokens.append(row["token"])
+    return sorted(set(tokens))
+
+
+def _file_tokens(path: Path) -> Dict[str, List[str]]:
+    """Read `<date|dynamic> <token>` lines; blank lines and `#` comments are skipped."""
+    tokens: Dict[str, List[str]] = defaultdict(list)
+    for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, _, token = line.partition(" ")
+        if name not in FEATURE_TOKEN_SOURCES or not token.strip():
+            raise SystemExit(f"{path}:{number}: expected '<date|dynamic> <token>', got {line!r}")
+        tokens[name].append(token.strip())
+    return tokens
+
+
+def _parse_mix(text: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint '{name}' in --mix (use {', '.join(ENDPOINTS)}).")
+        mix[name] = float(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def _build_targets(
+    mix: Dict[str, float], tokens: Dict[str, List[str]]
+) -> Tuple[List[Tuple[str, str]], List[float]]:
+    """Expand the mix into (endpoint, request target) pairs with per-pair weights."""
+    targets: List[Tuple[str, str]] = []
+    weights: List[float] = []
+    for name, weight in mix.items():
+        path = ENDPOINTS[name]
+        if name == "alive":
+            targets.append((path, path))
+            weights.append(weight)
+            continue
+        if not tokens.get(name):
+            raise SystemExit(f"No tokens available for '{name}'.")
+        for token in tokens[name]:
+            targets.append((path, f"{path}?token={quote(token, safe='')}"))
+            weights.append(weight / len(tokens[name]))
+    return targets, weights
+
+
+async def _closed_loop(
+    host: str, port: int, tls: Optional[ssl.SSLContext], picks, concurrency: int, duration: float
+) -> List[Sample]:
+    """`concurrency` virtual users, each sending its next request as soon as one completes."""
+    samples: List[Sample] = []
+    deadline = time.perf_counter() + duration
+
+    async def user() -> None:
+        connection = HttpConnection(host, port, tls)
+        try:
+            while time.perf_counter() < deadline:
+                endpoint, target = picks()
+                started = time.perf_counter()
+                try:
+                    status = await connection.get(target)
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    connection.close()
+                    status = 0
+                samples.append(Sample(endpoint, status, time.perf_counter() - started))
+        finally:
+            connection.close()
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return samples
+
+
+async def _open_loop(
+    host: str,
+    port: int,
+    tls: Optional[ssl.SSLContext],
+    picks,
+    rate: float,
+    duration: float,
+    max_connections: int,
+) -> List[Sample]:
+    """
+    Start requests at a fixed arrival rate regardless of how fast responses come.
+
+    Latency is measured from each request's scheduled start, so time spent
+    waiting for a free connection counts (no coordinated omission).
+    """
+    samples: List[Sample] = []
+    idle: List[HttpConnection] = []
+    slots = asyncio.Semaphore(max_connections)
+
+    async def send(endpoint: str, target: str, scheduled: float) -> None:
+        async with slots:
+            connection = idle.pop() if idle else HttpConnection(host, port, tls)
+            try:
+                status = await connection.get(target)
+                idle.append(connection)
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                connection.close()
+                status = 0
+        samples.append(Sample(endpoint, status, time.perf_counter() - scheduled))
+
+    tasks = []
+    started = time.perf_counter()
+    for index in range(int(rate * duration)):
+        scheduled = started + index / rate
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        tasks.append(asyncio.create_task(send(*picks(), scheduled)))
+    await asyncio.gather(*tasks)
+    for connection in idle:
+        connection.close()
+    return samples
+
+
+def _summarise(samples: Sequence[Sample], elapsed: float) -> Dict[str, object]:
+    ordered = sorted(sample.seconds for sample in samples)
+    statuses = Counter(sample.status for sample in samples)
+    summary: Dict[str, object] = {
+        "requests": len(samples),
+        "errors": sum(count for status, count in statuses.items() if not 200 <= status < 400),
+        "status_counts": {str(status): count for status, count in sorted(statuses.items())},
+        "rps": len(samples) / elapsed if elapsed else 0.0,
+    }
+    for name, fraction in PERCENTILES:
+        summary[name] = percentile(ordered, fraction) * 1000 if ordered else None
+    summary["max_ms"] = ordered[-1] * 1000 if ordered else None
+    return summary
+
+
+def _print_report(report: Dict[str, object]) -> None:
+    columns = ("requests", "errors", "rps", "p50_ms", "p90_ms", "p99_ms", "max_ms")
+    rows = [("TOTAL", report["totals"]), *report["endpoints"].items()]
+    print(f"{'endpoint':<30}" + "".join(f"{column:>11}" for column in columns))
+    for name, summary in rows:
+        cells = []
+        for column in columns:
+            value = summary[column]
+            cells.append(f"{value:>11.1f}" if isinstance(value, float) else f"{value!s:>11}")
+        print(f"{name:<30}" + "".join(cells))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Drive a request mix against the API and write a latency report."
+    )
+    parser.add_argument(
+        "--base-url",
+        default=os.getenv("API_BASE_URL", "http://localhost:3002"),
+        help="API root (defaults to API_BASE_URL or http://localhost:3002).",
+    )
+    parser.add_argument(
+        "--mix",
+        default="alive=1,date=4,dynamic=4",
+        help="Comma-separated endpoint weights from: alive, date, dynamic.",
+    )
+    parser.add_argument(
+        "--token-file",
+        type=Path,
+        help="Tokens as '<date|dynamic> <token>' lines instead of the feature Examples.",
+    )
+    parser.add_argument(
+        "--max-dynamic-chars",
+        type=int,
+        default=100_000,
+        help="Skip feature-file dynamic tokens whose output exceeds this many characters.",
+    )
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument(
+        "--concurrency", type=int, default=32, help="Closed loop: number of virtual users."
+    )
+    load.add_argument("--rate", type=float, help="Open loop: requests started per second.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load.")
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=256,
+        help="Open loop only: cap on simultaneous connections.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the request mix.")
+    parser.add_argument(
+        "--label", default=None, help="Report file label (defaults to the load mode)."
+    )
+    parser.add_argument(
+        "--results-dir",
+        default=".results",
+        help="Directory where the JSON report will be written.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    url = urlsplit(args.base_url)
+    if url.scheme not in DEFAULT_PORTS:
+        raise SystemExit(f"--base-url must be an http:// or https:// URL, got {args.base_url!r}.")
+    host, port = url.hostname or "localhost", url.port or DEFAULT_PORTS[url.scheme]
+    tls = ssl.create_default_context() if url.scheme == "https" else None
+
+    mix = _parse_mix(args.mix)
+    if args.token_file:
+        tokens, token_source = _file_tokens(args.token_file), str(args.token_file)
+    else:
+        tokens = {
+            name: _feature_tokens(name, args.max_dynamic_chars) for name in FEATURE_TOKEN_SOURCES
+        }
+        token_source = "features"
+    targets, weights = _build_targets(mix, tokens)
+    rng = random.Random(args.seed)
+
+    def picks() -> Tuple[str, str]:
+        return rng.choices(targets, weights)[0]
+
+    if args.rate:
+        mode = {"mode": "rate", "rate": args.rate, "max_connections": args.max_connections}
+        load = _open_loop(host, port, tls, picks, args.rate, args.duration, args.max_connections)
+    else:
+        mode = {"mode": "concurrency", "concurrency": args.concurrency}
+        load = _closed_loop(host, port, tls, picks, args.concurrency, args.duration)
+
+    started_at = datetime.utcnow()
+    started = time.perf_counter()
+    samples = asyncio.run(load)
+    elapsed = time.perf_counter() - started
+
+    by_endpoint: Dict[str, List[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample.endpoint].append(sample)
+    report = {
+        "base_url": args.base_url,
+        **mode,
+        "duration_seconds": elapsed,
+        "started_at": started_at.isoformat(timespec="seconds") + "Z",
+        "mix": mix,
+        "token_source": token_source,
+        "totals": _summarise(samples, elapsed),
+        "endpoints": {
+            endpoint: _summarise(group, elapsed) for endpoint, group in sorted(by_endpoint.items())
+        },
+    }
+
+    results_dir = Path(args.results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    label = (args.label or mode["mode"]).replace(" ", "_")
+    report_path = results_dir / f"load_{label}_{started_at.strftime('%Y%m%dT%H%MZ')}.json"
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    _print_report(report)
+    print(f"[load_test] report: {report_path}")
+    return 0 if report["totals"]["requests"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
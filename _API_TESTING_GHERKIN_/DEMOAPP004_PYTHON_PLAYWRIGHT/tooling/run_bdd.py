@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
 from datetime import datetime
@@ -10,6 +11,10 @@ from pathlib import Path
 
 from summary_renderer import render_summary
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BENCH_BASELINE = PROJECT_ROOT / "benchmarks" / "baseline_tokenparser.json"
+DEFAULT_MEMORY_BASELINE = PROJECT_ROOT / "benchmarks" / "baseline_memory.json"
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -25,6 +30,46 @@ def _parse_args() -> argparse.Namespace:
         default=".results",
         help="Directory where logs and summaries will be written.",
     )
+    parser.add_argument(
+        "--slowest",
+        type=int,
+        default=10,
+        help="How many of the slowest traced requests the summary lists.",
+    )
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="Run the tokenparser micro-benchmarks against a baseline instead of pytest.",
+    )
+    parser.add_argument(
+        "--bench-baseline",
+        default=str(DEFAULT_BENCH_BASELINE),
+        help="Baseline JSON for --bench (see benchmarks/bench_tokenparser.py).",
+    )
+    parser.add_argument(
+        "--bench-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed per-case slowdown for --bench as a fraction (0.25 = 25%%).",
+    )
+    parser.add_argument(
+        "--memory-baseline",
+        default=str(DEFAULT_MEMORY_BASELINE),
+        help="Per-request peak memory baseline for --bench (see benchmarks/bench_memory.py).",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.10,
+        help="Allowed per-case peak memory growth for --bench as a fraction (0.10 = 10%%).",
+    )
+    parser.add_argument(
+        "--startup-budget-ms",
+        type=float,
+        default=None,
+        help="Also fail --bench when the server's median time to /alive exceeds this "
+        "(see benchmarks/bench_startup.py; 0 skips the startup check).",
+    )
     parser.add_argument(
         "pytest_args",
         nargs=argparse.REMAINDER,
@@ -33,6 +78,58 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _run_bench(args: argparse.Namespace, results_dir: Path, timestamp: str) -> int:
+    """
+    Run the benchmark gates; non-zero exit when any of them fails.
+
+    The gates are parser latency and per-request peak memory against their
+    baselines, then the server's startup budget.
+    """
+    log_path = results_dir / f"bench_{timestamp}.log"
+    report_path = results_dir / f"bench_{timestamp}.json"
+
+    cmd = [
+        sys.executable, "-m", "benchmarks.bench_tokenparser",
+        "--baseline", str(Path(args.bench_baseline).resolve()),
+        "--threshold", str(args.bench_threshold),
+        "--json", str(report_path.resolve()),
+    ]
+    process = subprocess.run(cmd, capture_output=True, text=True, cwd=PROJECT_ROOT)
+    log = process.stdout + process.stderr
+    returncode = process.returncode
+
+    memory_path = results_dir / f"bench_memory_{timestamp}.json"
+    cmd = [
+        sys.executable, "-m", "benchmarks.bench_memory",
+        "--baseline", str(Path(args.memory_baseline).resolve()),
+        "--threshold", str(args.memory_threshold),
+        "--json", str(memory_path.resolve()),
+    ]
+    process = subprocess.run(cmd, capture_output=True, text=True, cwd=PROJECT_ROOT)
+    log += "\n" + process.stdout + process.stderr
+    returncode = returncode or process.returncode
+    print(f"[run_bdd] memory report: {memory_path}")
+
+    if args.startup_budget_ms != 0:
+        startup_path = results_dir / f"bench_startup_{timestamp}.json"
+        cmd = [
+            sys.executable, "-m", "benchmarks.bench_startup",
+            "--json", str(startup_path.resolve()),
+        ]
+        if args.startup_budget_ms is not None:
+            cmd += ["--budget-ms", str(args.startup_budget_ms)]
+        process = subprocess.run(cmd, capture_output=True, text=True, cwd=PROJECT_ROOT)
+        log += "\n" + process.stdout + process.stderr
+        returncode = returncode or process.returncode
+        print(f"[run_bdd] startup report: {startup_path}")
+    log_path.write_text(log, encoding="utf-8")
+
+    print(f"[run_bdd] bench exit code: {returncode}")
+    print(f"[run_bdd] log: {log_path}")
+    print(f"[run_bdd] report: {report_path}")
+    return returncode
+
+
 def main() -> int:
     args = _parse_args()
     timestamp = datetime.utcnow().strftime("%Y%m%dT%H%MZ")
@@ -41,8 +138,12 @@ def main() -> int:
     results_dir = Path(args.results_dir)
     results_dir.mkdir(parents=True, exist_ok=True)
 
+    if args.bench:
+        return _run_bench(args, results_dir, timestamp)
+
     log_path = results_dir / f"pytest_{marker_label}_{timestamp}.log"
     summary_path = results_dir / f"pytest_{marker_label}_{timestamp}.summary.json"
+    trace_path = results_dir / f"latency_{marker_label}_{timestamp}.jsonl"
 
     cmd = [sys.executable, "-m", "pytest", "--maxfail=1"]
     if args.marker:
@@ -50,14 +151,17 @@ def main() -> int:
     if args.pytest_args:
         cmd += args.pytest_args
 
-    process = subprocess.run(cmd, capture_output=True, text=True)
+    env = {**os.environ, "API_TRACE_PATH": str(trace_path.resolve())}
+    process = subprocess.run(cmd, capture_output=True, text=True, env=env)
     log_path.write_text(process.stdout + process.stderr, encoding="utf-8")
 
-    render_summary(log_path, process.returncode, summary_path)
+    render_summary(log_path, process.returncode, summary_path, trace_path, args.slowest)
 
     print(f"[run_bdd] pytest exit code: {process.returncode}")
     print(f"[run_bdd] log: {log_path}")
     print(f"[run_bdd] summary: {summary_path}")
+    if trace_path.exists():
+        print(f"[run_bdd] latency trace: {trace_path}")
     return process.returncode
 
 
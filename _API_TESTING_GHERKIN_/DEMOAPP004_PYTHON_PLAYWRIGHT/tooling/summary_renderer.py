@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import math
 import re
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence
 
 SUMMARY_PATTERN = re.compile(r"==+.*in\s+([\d\.]+)s\s*==+")
 
@@ -21,8 +24,53 @@ def _parse_counts(line: str) -> Dict[str, int]:
     return counts
 
 
-def render_summary(log_path: str | Path, exit_code: int, summary_path: str | Path) -> None:
-    """Parse pytest output and write a JSON summary."""
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of the sorted, non-empty `ordered` (0 < fraction <= 1)."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarise_latency(trace_path: str | Path, slowest: int = 10) -> Dict[str, Any]:
+    """Per-endpoint p50/p95/p99 and the `slowest` requests from a latency trace JSONL."""
+    records: List[Dict[str, Any]] = []
+    with Path(trace_path).open(encoding="utf-8") as trace:
+        for line in trace:
+            if line.strip():
+                records.append(json.loads(line))
+
+    durations: Dict[str, List[float]] = defaultdict(list)
+    sizes: Dict[str, int] = defaultdict(int)
+    for record in records:
+        key = f"{record['method']} {record['endpoint']}"
+        durations[key].append(record["duration_ms"])
+        sizes[key] += record["bytes"]
+
+    endpoints: Dict[str, Dict[str, Any]] = {}
+    for key in sorted(durations):
+        ordered = sorted(durations[key])
+        endpoints[key] = {
+            "requests": len(ordered),
+            "p50_ms": percentile(ordered, 0.50),
+            "p95_ms": percentile(ordered, 0.95),
+            "p99_ms": percentile(ordered, 0.99),
+            "max_ms": ordered[-1],
+            "bytes": sizes[key],
+        }
+    return {
+        "trace_path": str(trace_path),
+        "requests": len(records),
+        "endpoints": endpoints,
+        "slowest": heapq.nlargest(slowest, records, key=lambda record: record["duration_ms"]),
+    }
+
+
+def render_summary(
+    log_path: str | Path,
+    exit_code: int,
+    summary_path: str | Path,
+    trace_path: Optional[str | Path] = None,
+    slowest: int = 10,
+) -> None:
+    """Parse pytest output (and the latency trace, when given) and write a JSON summary."""
     log_path = Path(log_path)
     summary_path = Path(summary_path)
 
@@ -51,4 +99,7 @@ def render_summary(log_path: str | Path, exit_code: int, summary_path: str | Pat
                 )
                 break
 
+    if trace_path is not None and Path(trace_path).exists():
+        summary["latency"] = summarise_latency(trace_path, slowest)
+
     summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")